@@ -15,7 +15,7 @@ source.dir = .
 source.main = main.py
 
 # (list) Source files to include (let empty to include all the files)
-source.include_exts = py,png,jpg,kv,atlas,ogg,wav,mp3,ttf,otf
+source.include_exts = py,png,jpg,kv,atlas,json,ogg,wav,mp3,ttf,otf,bin
 
 # (list) List of inclusions using pattern matching
 source.include_patterns = assets/*,assets/**/*,screens/*,components/*,utils/*
@@ -24,7 +24,7 @@ source.include_patterns = assets/*,assets/**/*,screens/*,components/*,utils/*
 #source.exclude_patterns = 
 
 # (list) List of directory to exclude (let empty to not exclude anything)
-source.exclude_dirs = tests, bin, venv, __pycache__, web, .github, .git, buildozer_venv, buildozer_venv2, buildozer_env, .buildozer
+source.exclude_dirs = tests, tools, bin, venv, __pycache__, web, .github, .git, buildozer_venv, buildozer_venv2, buildozer_env, .buildozer
 
 # (str) Application versioning
 version = 1.0
@@ -1,10 +1,29 @@
 """
 Components Package
-Contains all reusable game components
+Contains all reusable game components. Exports are imported on first
+access, so the headless simulation modules load without Kivy.
 """
 
-from components.fighter import Fighter
-from components.touch_controls import TouchControls
-from components.health_bar import HealthBar
+import importlib
 
-__all__ = ['Fighter', 'TouchControls', 'HealthBar']
+# Exported name -> module defining it
+_EXPORTS = {
+    'Fighter': 'components.fighter',
+    'TouchControls': 'components.touch_controls',
+    'HealthBar': 'components.health_bar',
+    'RetainedScene': 'components.scene',
+    'SpriteBatch': 'components.sprite_batch',
+    'ColorPalette': 'components.sprite_batch',
+}
+
+__all__ = ['Fighter', 'TouchControls', 'HealthBar', 'RetainedScene',
+           'SpriteBatch', 'ColorPalette']
+
+
+def __getattr__(name):
+    """Import an exported component the first time it is used."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'components' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
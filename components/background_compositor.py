@@ -0,0 +1,247 @@
+"""
+Background Compositor Component
+Flattens a stack of static background layers into one opaque texture per
+resolution using an Fbo, with an optional on-disk cache of the result
+"""
+
+import hashlib
+import os
+from functools import partial
+
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Color, Rectangle
+from kivy.core.image import Image as CoreImage
+
+from utils.asset_cache import AssetCache
+from utils.asset_loader import AssetLoader
+
+
+class BackgroundCompositor:
+    """Shared cache of flattened background textures keyed by layers and size."""
+
+    _instance = None
+
+    # Flattened textures kept per layer stack, in memory and on disk (recent resolutions)
+    MAX_SIZES_PER_STACK = 2
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = BackgroundCompositor(cache_dir=default_cache_dir())
+        return cls._instance
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self._entries = {}  # stack key -> list of (size, fbo or None, texture)
+        self._pending = {}  # (stack key, size) -> callbacks waiting on load_async
+
+        # Statistics
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    def get(self, layer_paths, size, fill=(0, 0, 0, 1), layer_textures=None):
+        """Get the flattened texture of layer_paths (back to front) at size.
+
+        layer_textures, when given, are the already decoded layers to
+        composite instead of loading the files.
+        """
+        size = (int(size[0]), int(size[1]))
+        texture = self.get_cached(layer_paths, size, fill)
+        if texture is not None:
+            return texture
+
+        stack_key = self._stack_key(layer_paths, fill)
+        fbo = None
+        if layer_textures is None:
+            texture = self._load_from_disk(stack_key, layer_paths, size)
+        if texture is None:
+            fbo, texture = self._render(layer_paths, size, fill, layer_textures)
+            self._save_to_disk(stack_key, size, texture)
+
+        self._remember(stack_key, size, fbo, texture)
+        return texture
+
+    def get_cached(self, layer_paths, size, fill=(0, 0, 0, 1)):
+        """Get the flattened texture if it is already in memory, else None."""
+        size = (int(size[0]), int(size[1]))
+        for entry in self._entries.get(self._stack_key(layer_paths, fill), ()):
+            if entry[0] == size:
+                self.hits += 1
+                return entry[2]
+        return None
+
+    def load_async(self, layer_paths, size, callback, fill=(0, 0, 0, 1)):
+        """Like get(), but decodes on the AssetLoader's workers.
+
+        callback(texture) runs on the main thread once the texture is ready.
+        Requests for a stack that is already loading share that load.
+        """
+        size = (int(size[0]), int(size[1]))
+        stack_key = self._stack_key(layer_paths, fill)
+        if (stack_key, size) in self._pending:
+            self._pending[stack_key, size].append(callback)
+            return
+        self._pending[stack_key, size] = [callback]
+        loader = AssetLoader.get_instance()
+
+        def finish(texture):
+            for waiting in self._pending.pop((stack_key, size)):
+                waiting(texture)
+
+        # A fresh flattened copy on disk is one decode instead of one per layer
+        disk_path = self._fresh_disk_path(stack_key, layer_paths, size)
+        if disk_path:
+            def on_flattened(texture):
+                if texture is None:
+                    finish(self.get(layer_paths, size, fill))
+                    return
+                self.disk_hits += 1
+                self._remember(stack_key, size, None, texture)
+                finish(texture)
+
+            loader.load_image(disk_path, on_flattened)
+            return
+
+        # Layers come from the shared asset cache and are released once flattened
+        cache = AssetCache.get_instance()
+        layer_textures = [None] * len(layer_paths)
+        pending = [len(layer_paths)]
+
+        def on_layer(index, texture):
+            layer_textures[index] = texture
+            pending[0] -= 1
+            if pending[0] == 0:
+                texture = self.get(layer_paths, size, fill, layer_textures)
+                for path, layer in zip(layer_paths, layer_textures):
+                    if layer is not None:
+                        cache.release(path)
+                finish(texture)
+
+        for index, path in enumerate(layer_paths):
+            cache.acquire(path, partial(on_layer, index))
+
+    def _remember(self, stack_key, size, fbo, texture):
+        """Keep a flattened texture in memory (most recent sizes first)."""
+        entries = self._entries.setdefault(stack_key, [])
+        entries.insert(0, (size, fbo, texture))
+        del entries[self.MAX_SIZES_PER_STACK:]
+
+    def _stack_key(self, layer_paths, fill):
+        """Stable key for a layer stack."""
+        text = '|'.join(layer_paths) + '|' + ','.join(str(c) for c in fill)
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+    def _render(self, layer_paths, size, fill, layer_textures=None):
+        """Draw all layers into an opaque Fbo once."""
+        self.renders += 1
+        fbo = Fbo(size=size)
+        with fbo:
+            ClearColor(*fill)
+            ClearBuffers()
+            Color(1, 1, 1, 1)
+            for index, path in enumerate(layer_paths):
+                try:
+                    if layer_textures is None:
+                        texture = CoreImage(path).texture
+                    else:
+                        texture = layer_textures[index]
+                        if texture is None:
+                            continue  # The loader already reported it
+                    Rectangle(texture=texture, pos=(0, 0), size=size)
+                except Exception as e:
+                    print(f"Warning: Could not load background layer {path}: {e}")
+        fbo.draw()
+        # Keep the Fbo alive with its texture so it is redrawn after a GL context loss
+        return fbo, fbo.texture
+
+    def _cache_path(self, stack_key, size):
+        """On-disk location of a flattened background."""
+        return os.path.join(self.cache_dir, f'{stack_key}_{size[0]}x{size[1]}.png')
+
+    def _fresh_disk_path(self, stack_key, layer_paths, size):
+        """Path of the cached flattened texture if it is newer than all its layers, else None."""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(stack_key, size)
+        try:
+            cached_mtime = os.path.getmtime(path)
+            if any(os.path.getmtime(p) > cached_mtime for p in layer_paths if os.path.exists(p)):
+                return None
+        except OSError:
+            return None
+        return path
+
+    def _load_from_disk(self, stack_key, layer_paths, size):
+        """Load the cached flattened texture if it is still fresh."""
+        path = self._fresh_disk_path(stack_key, layer_paths, size)
+        if path is None:
+            return None
+        try:
+            texture = CoreImage(path).texture
+            self.disk_hits += 1
+            return texture
+        except Exception as e:
+            print(f"Warning: Could not load cached background {path}: {e}")
+            return None
+
+    def _save_to_disk(self, stack_key, size, texture):
+        """Write a flattened texture to the disk cache.
+
+        Only the read back from the GPU happens here; the PNG is encoded and
+        written, and older resolutions of the stack pruned, on an AssetLoader
+        worker thread.
+        """
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            AssetLoader.get_instance().submit(_write_png, self._cache_path(stack_key, size),
+                                              texture.size, texture.pixels, self.MAX_SIZES_PER_STACK)
+        except Exception as e:
+            print(f"Warning: Could not cache background: {e}")
+
+
+def _write_png(path, size, pixels, keep):
+    """Encode RGBA pixels read back from a texture to a PNG file (worker thread).
+
+    Afterwards only the keep most recently written resolutions of the same
+    layer stack stay on disk.
+    """
+    from kivy.core.image import ImageLoader
+
+    # Written under a temporary name so readers never see a partial file
+    root, ext = os.path.splitext(path)
+    temp_path = f'{root}.tmp{ext}'
+    try:
+        loader = next(loader for loader in ImageLoader.loaders if loader.can_save('png', False))
+        # Texture pixels are bottom-up, like Texture.save()
+        loader.save(temp_path, size[0], size[1], 'rgba', pixels, True, 'png')
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"Warning: Could not cache background: {e}")
+        return
+    _prune_disk_cache(path, keep)
+
+
+def _prune_disk_cache(path, keep):
+    """Delete all but the keep newest cached resolutions of path's layer stack."""
+    cache_dir, name = os.path.split(path)
+    prefix = name.rsplit('_', 1)[0] + '_'
+    try:
+        paths = [os.path.join(cache_dir, f) for f in os.listdir(cache_dir)
+                 if f.startswith(prefix) and f.endswith('.png') and not f.endswith('.tmp.png')]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for old_path in paths[keep:]:
+            os.remove(old_path)
+    except OSError as e:
+        print(f"Warning: Could not prune background cache: {e}")
+
+
+def default_cache_dir():
+    """Disk cache directory in the app's user data dir (None outside a running app)."""
+    from kivy.app import App
+    app = App.get_running_app()
+    if app is None:
+        return None
+    return os.path.join(app.user_data_dir, 'background_cache')
@@ -3,17 +3,71 @@ Bot AI Component
 Handles AI decision making for the enemy fighter
 """
 
+import json
+import os
 import random
-from config import ATTACK_RANGE, FIGHTER_SPEED
+from config import ATTACK_RANGE, FIGHTER_SPEED, BOT_DIFFICULTY, SIM_TICK_RATE
+from components.perception import PerceptionBuffer
+from components.lookahead import LookaheadSearch, MACRO_TICKS, apply_action
+from components.decision_worker import DecisionWorker, take_snapshot
+from components.policy_table import (
+    PolicyTable, encode_state, ACTIONS,
+    ATTACK1, ATTACK2, ATTACK3, DODGE, JUMP, APPROACH, BACK_OFF
+)
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIFFICULTY_FILE = os.path.join(BASE_PATH, 'assets', 'data', 'bot_difficulty.json')
+
+# Share of a macro-action's duration a decision worker may plan for
+WORKER_PLAN_SHARE = 0.5
+
+
+def load_difficulty_settings(path=DIFFICULTY_FILE):
+    """Config defaults per difficulty, overridden by the calibrated data file if present."""
+    settings = {name: dict(values) for name, values in BOT_DIFFICULTY.items()}
+    if not os.path.exists(path):
+        return settings
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        for name, values in data.get('difficulties', {}).items():
+            values = dict(values)
+            if 'decision_interval' in values:
+                values['decision_interval'] = tuple(values['decision_interval'])
+            settings.setdefault(name, {}).update(values)
+    except Exception as e:
+        print(f"Warning: Could not load bot difficulty file {path}: {e}")
+    return settings
+
+
+# AI parameters per difficulty (loaded once at startup)
+DIFFICULTY_SETTINGS = load_difficulty_settings()
+
+
+def get_difficulty_settings(difficulty):
+    """Get AI parameters for a difficulty (unknown names play as nightmare)."""
+    return DIFFICULTY_SETTINGS.get(difficulty, DIFFICULTY_SETTINGS['nightmare'])
+
+
+def uses_search(difficulty):
+    """Whether a difficulty plays by lookahead search rather than its rule parameters."""
+    return bool(get_difficulty_settings(difficulty).get('search_budget_ms'))
 
 
 class BotAI:
     """AI controller for enemy fighter."""
     
-    def __init__(self, fighter, difficulty='medium'):
+    def __init__(self, fighter, difficulty='medium', seed=None):
         self.fighter = fighter
         self.difficulty = difficulty
         
+        # Own random generator so matches replay from their seed and parallel
+        # simulations don't share state (seed=None picks a random seed)
+        self.seed = None
+        self.rng = random.Random()
+        self.reseed(seed)
+        
         # AI timing
         self.decision_timer = 0
         self.decision_interval = self._get_decision_interval()
@@ -23,58 +77,116 @@ class BotAI:
         self.action_timer = 0
         
         # Difficulty settings
+        self.perception = None
+        self.search = None
+        self.worker = None
+        
+        # Decision worker bookkeeping
+        self.pending_request = None
+        self.worker_timer = 0
+        self.decisions_on_time = 0
+        self.decisions_late = 0
+        
         self._setup_difficulty()
     
+    def reset(self, seed=None):
+        """Reset AI state for a new match and restart the random stream."""
+        self.reseed(seed)
+        self.decision_timer = 0
+        self.decision_interval = self._get_decision_interval()
+        self.current_action = 'idle'
+        self.action_timer = 0
+        self.perception.clear()
+        if self.search is not None:
+            self.search.reset()
+        self.pending_request = None
+        self.worker_timer = 0
+    
+    def reseed(self, seed=None):
+        """Restart the random stream from a seed (a new random seed if None)."""
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng.seed(self.seed)
+    
     def _setup_difficulty(self):
         """Set AI parameters based on difficulty."""
-        if self.difficulty == 'easy':
-            self.reaction_time = 20  # frames before reacting
-            self.attack_chance = 0.4
-            self.dodge_chance = 0.2
-            self.aggression = 0.4
-        elif self.difficulty == 'medium':
-            self.reaction_time = 10
-            self.attack_chance = 0.6
-            self.dodge_chance = 0.4
-            self.aggression = 0.6
-        elif self.difficulty == 'hard':
-            # Faster reactions and higher aggression; less spammable dodging
-            self.reaction_time = 3
-            self.attack_chance = 0.85
-            self.dodge_chance = 0.35
-            self.aggression = 0.9
-        else:  # nightmare
-            # Very fast, highly aggressive, but don't dodge excessively — prefer punishes
-            self.reaction_time = 1  # Nearly instant reactions
-            self.attack_chance = 0.98
-            self.dodge_chance = 0.25
-            self.aggression = 0.995
+        settings = get_difficulty_settings(self.difficulty)
+        self.reaction_time = settings['reaction_time']
+        self.attack_chance = settings['attack_chance']
+        self.dodge_chance = settings['dodge_chance']
+        self.aggression = settings['aggression']
+        budget = settings.get('search_budget_ms')
+        
+        # Decisions see the opponent reaction_time ticks late (the search
+        # simulates from the opponent's full state, so it keeps that too)
+        keep_states = bool(budget)
+        if (self.perception is None or self.perception.delay != self.reaction_time or
+                (self.perception.states is not None) != keep_states):
+            self.perception = PerceptionBuffer(self.reaction_time, keep_states)
+        
+        # Play the trained policy table (tools/train_policy.py) when enabled and built
+        self.policy_table = None
+        if settings.get('policy_table'):
+            table = PolicyTable.get_instance()
+            if table.available:
+                self.policy_table = table
+        
+        # Replace rule-based decisions with a time-budgeted lookahead search
+        if not budget:
+            self.search = None
+        elif self.search is None:
+            self.search = LookaheadSearch(self.rng, budget, policy_table=self.policy_table)
+        else:
+            self.search.budget = budget / 1000.0
+            self.search.policy_table = self.policy_table
+        
+        # Optionally run that search on a worker thread or process instead
+        mode = settings.get('decision_worker') if budget else None
+        if self.worker is not None and self.worker.mode != mode:
+            self.worker.stop()
+            self.worker = None
+        if mode and self.worker is None:
+            self.worker = DecisionWorker(mode, self.rng.getrandbits(32), budget, self.policy_table is not None)
+            self.pending_request = None
+            self.worker_timer = 0
     
     def _get_decision_interval(self):
         """Get decision interval based on difficulty."""
-        if self.difficulty == 'easy':
-            return random.randint(15, 30)
-        elif self.difficulty == 'medium':
-            return random.randint(8, 18)
-        elif self.difficulty == 'hard':
-            return random.randint(3, 10)
-        else:  # nightmare
-            return random.randint(1, 3)  # Near-instant decisions
-    
-    def update(self, target, screen_width):
+        return self.rng.randint(*get_difficulty_settings(self.difficulty)['decision_interval'])
+    
+    def begin_frame(self, ticks):
+        """Spread the search budget over the ticks of the coming rendered frame."""
+        if self.search is not None:
+            self.search.begin_frame(ticks)
+    
+    def update(self, target, screen_width, screen_height=600):
         """Update AI decision making and control the fighter."""
+        self.perception.record(target)
+        
         if not self.fighter.alive or not target.alive:
             self.fighter.move_left = False
             self.fighter.move_right = False
             return
         
+        if self.worker is not None:
+            self._worker_update(target, screen_width, screen_height)
+            return
+        
+        if self.search is not None:
+            # Searched from the perceived opponent, like the rules' decisions
+            action = self.search.update(self.fighter, target, self.perception.perceive_state(),
+                                        screen_width, screen_height)
+            if action is not None:
+                apply_action(self.fighter, action, self.perception.perceive())
+                self.current_action = ACTIONS[action]
+            return
+        
         # Update decision timer
         self.decision_timer += 1
         
         if self.decision_timer >= self.decision_interval:
             self.decision_timer = 0
             self.decision_interval = self._get_decision_interval()
-            self._make_decision(target, screen_width)
+            self._make_decision(self.perception.perceive(), screen_width)
         
         # Update action timer
         if self.action_timer > 0:
@@ -86,8 +198,33 @@ class BotAI:
                 self.fighter.move_right = False
                 self.current_action = 'idle'
     
+    def _worker_update(self, target, screen_width, screen_height):
+        """At each decision point play the worker's answer, or the rules if it is late."""
+        if self.worker_timer > 0:
+            self.worker_timer -= 1
+            return
+        
+        committed = -1
+        decision = self.worker.poll() if self.pending_request is not None else None
+        if decision is not None and decision[0] == self.pending_request:
+            committed = decision[1]
+            apply_action(self.fighter, committed, self.perception.perceive())
+            self.current_action = ACTIONS[committed]
+            self.decisions_on_time += 1
+        else:
+            if self.pending_request is not None:
+                self.decisions_late += 1
+            self._make_decision(self.perception.perceive(), screen_width)
+        
+        # Ask for the decision due when this one has played out
+        plan_time = WORKER_PLAN_SHARE * MACRO_TICKS / SIM_TICK_RATE
+        snapshot = take_snapshot(self.fighter, target, self.perception.perceive_state(),
+                                 screen_width, screen_height)
+        self.pending_request = self.worker.post(committed, snapshot, plan_time)
+        self.worker_timer = MACRO_TICKS - 1
+    
     def _make_decision(self, target, screen_width):
-        """Make an AI decision based on game state."""
+        """Make an AI decision based on the perceived (delayed) opponent state."""
         # Calculate distance to target
         distance = abs(self.fighter.x - target.x)
         
@@ -101,6 +238,10 @@ class BotAI:
         if self.fighter.attacking:
             return
         
+        if self.policy_table is not None:
+            self._table_decision(target)
+            return
+        
         # Close range - attack or dodge
         if distance < ATTACK_RANGE + 50:
             self._close_range_decision(target)
@@ -113,14 +254,14 @@ class BotAI:
     
     def _close_range_decision(self, target):
         """Decision making when close to target."""
-        roll = random.random()
+        roll = self.rng.random()
 
         # If target is in attack recovery (can't immediately retaliate), prioritize punishing
         if getattr(target, 'attack_cooldown', 0) > 0:
             punish_chance = min(1.0, self.attack_chance + 0.25)
             if roll < punish_chance:
                 # Prefer stronger or moving attacks when punishing
-                if random.random() < 0.35:
+                if self.rng.random() < 0.35:
                     # Special moving attack
                     self._do_attack(target)
                 else:
@@ -136,7 +277,7 @@ class BotAI:
             # Slight chance to attempt a short punish after a tiny delay
             if roll < self.attack_chance:
                 # Wait a couple frames to time a counter (give the engine a short pause)
-                self.action_timer = random.randint(2, 6)
+                self.action_timer = self.rng.randint(2, 6)
                 self._do_attack(target)
                 return
 
@@ -149,9 +290,33 @@ class BotAI:
             self.fighter.do_jump()
             self._do_attack(target)
     
+    def _table_decision(self, target):
+        """Play the action the policy table samples for the perceived state."""
+        action = self.policy_table.choose(encode_state(self.fighter, target), self.rng)
+        
+        if action in (ATTACK1, ATTACK2, ATTACK3):
+            self._do_attack(target, attack_type=action - ATTACK1 + 1)
+        elif action == DODGE:
+            if self.fighter.dodge_cooldown == 0:
+                # Face away from target to dash away
+                self.fighter.flip = self.fighter.x < target.x
+                self.fighter.do_dodge()
+            else:
+                self._back_off(target)
+        elif action == JUMP:
+            self.fighter.do_jump()
+        elif action == APPROACH:
+            self._approach(target)
+        elif action == BACK_OFF:
+            self._back_off(target)
+        else:  # wait
+            self.fighter.move_left = False
+            self.fighter.move_right = False
+            self.current_action = 'idle'
+    
     def _medium_range_decision(self, target):
         """Decision making at medium range."""
-        roll = random.random()
+        roll = self.rng.random()
         
         if roll < self.aggression:
             # Approach
@@ -169,7 +334,7 @@ class BotAI:
     def _far_range_decision(self, target, screen_width):
         """Decision making when far from target."""
         # Almost always approach when far
-        if random.random() < 0.8:
+        if self.rng.random() < 0.8:
             self._approach(target)
         else:
             # Occasionally jump while approaching
@@ -188,7 +353,7 @@ class BotAI:
             self.current_action = 'move_left'
         
         # Set action duration
-        self.action_timer = random.randint(10, 30)
+        self.action_timer = self.rng.randint(10, 30)
     
     def _back_off(self, target):
         """Move away from the target."""
@@ -201,12 +366,12 @@ class BotAI:
             self.fighter.move_right = True
             self.current_action = 'move_right'
         
-        self.action_timer = random.randint(5, 15)
+        self.action_timer = self.rng.randint(5, 15)
     
     def _dodge(self, target):
         """Dodge away from target's attack."""
         # Use the dash dodge if available. Use configured dodge_chance so difficulty controls it.
-        if self.fighter.dodge_cooldown == 0 and random.random() < self.dodge_chance:
+        if self.fighter.dodge_cooldown == 0 and self.rng.random() < self.dodge_chance:
             # Face away from target to dash away
             self.fighter.flip = self.fighter.x < target.x
             self.fighter.do_dodge()
@@ -214,17 +379,20 @@ class BotAI:
             # Fall back to backing off; on higher difficulties this will be rarer
             self._back_off(target)
             # Maybe jump while dodging/backing
-            if random.random() < 0.35:
+            if self.rng.random() < 0.35:
                 self.fighter.do_jump()
     
-    def _do_attack(self, target=None):
-        """Perform an attack."""
-        # Choose attack type
-        attack_type = random.choice([1, 2])
+    def _do_attack(self, target=None, attack_type=None):
+        """Perform an attack (a random type unless one is given)."""
+        if attack_type is None:
+            # Choose attack type
+            attack_type = self.rng.choice([1, 2])
+            
+            # Occasionally do special attack (Attack 3 = A2 while moving)
+            if self.rng.random() < 0.15:
+                attack_type = 3
         
-        # Occasionally do special attack (Attack 3 = A2 while moving)
-        if random.random() < 0.15:
-            attack_type = 3
+        if attack_type == 3:
             # Attack 3 requires movement, so start moving towards target
             if target is not None:
                 if self.fighter.x < target.x:
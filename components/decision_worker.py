@@ -0,0 +1,136 @@
+"""
+Decision Worker Component
+Runs the bot's lookahead search off the render thread: the game posts
+immutable world snapshots, a worker thread or process plans on them and
+publishes decisions through a double-buffered slot the game polls
+"""
+
+import multiprocessing
+import queue
+import random
+import threading
+from array import array
+
+from components.lookahead import LookaheadSearch, MACRO_TICKS
+
+
+class DecisionSlot:
+    """Lock-free, double-buffered slot holding the latest (request, action).
+
+    The single writer fills the back buffer and then flips the front index,
+    so the reader never waits. A read that raced two flips sees the buffer's
+    sequence number change underneath it and is reported as empty.
+    """
+
+    # Front buffer index, then (sequence, request, action) per buffer
+    SIZE = 7
+
+    def __init__(self, shared=False):
+        if shared:
+            self.data = multiprocessing.RawArray('q', self.SIZE)
+        else:
+            self.data = array('q', [0]) * self.SIZE
+        self.sequence = 0  # Writer side only
+
+    def publish(self, request, action):
+        """Write a decision into the back buffer and make it the front one."""
+        data = self.data
+        back = 1 - data[0]
+        base = 1 + 3 * back
+        self.sequence += 1
+        data[base] = -1  # Being written
+        data[base + 1] = request
+        data[base + 2] = action
+        data[base] = self.sequence
+        data[0] = back
+
+    def read(self):
+        """Latest (request, action), or None if nothing consistent is published."""
+        data = self.data
+        base = 1 + 3 * data[0]
+        sequence = data[base]
+        request = data[base + 1]
+        action = data[base + 2]
+        if sequence <= 0 or data[base] != sequence:
+            return None
+        return request, action
+
+
+def take_snapshot(fighter, target, target_state, screen_width, screen_height):
+    """Immutable (picklable) world state a worker plans from (target_state as the bot perceives it)."""
+    return (fighter.name, fighter.is_player_2, fighter.get_state(),
+            target.name, target.is_player_2, target_state,
+            fighter._get_scale_factor(), screen_width, screen_height)
+
+
+def _plan_loop(requests, slot, seed, budget_ms, use_table):
+    """Worker body: plan on the newest snapshot and publish until told to stop."""
+    table = None
+    if use_table:
+        from components.policy_table import PolicyTable
+        table = PolicyTable.get_instance()
+        if not table.available:
+            table = None
+    search = LookaheadSearch(random.Random(seed), budget_ms, policy_table=table)
+    last_action = -1
+
+    while True:
+        request = requests.get()
+        # Snapshots that queued up meanwhile are already stale
+        while request is not None and not requests.empty():
+            request = requests.get()
+        if request is None:
+            return
+
+        request_id, committed, snapshot, plan_time = request
+        own_name, own_is_player_2, own_state, target_name, target_is_player_2, target_state, scale, width, height = snapshot
+        search.prepare(own_name, own_is_player_2, target_name, target_is_player_2, scale)
+
+        # Keep the tree if the game played our last answer, otherwise start over
+        if committed >= 0 and committed == last_action:
+            search.advance(committed)
+        else:
+            search.reset()
+            search.remaining = MACRO_TICKS
+
+        search.think(own_state, target_state, width, height, plan_time)
+        last_action = search.best_action()
+        slot.publish(request_id, last_action)
+
+
+class DecisionWorker:
+    """Background lookahead planner; the game posts snapshots and polls, never waits.
+
+    mode is 'thread' (shares the GIL with the game) or 'process' (true
+    parallelism; the slot lives in shared memory).
+    """
+
+    def __init__(self, mode, seed, budget_ms, use_table=False):
+        self.mode = mode
+        if mode == 'process':
+            self.requests = multiprocessing.SimpleQueue()
+            self.slot = DecisionSlot(shared=True)
+            worker_type = multiprocessing.Process
+        else:
+            self.requests = queue.SimpleQueue()
+            self.slot = DecisionSlot()
+            worker_type = threading.Thread
+        self.worker = worker_type(target=_plan_loop, daemon=True,
+                                  args=(self.requests, self.slot, seed, budget_ms, use_table))
+        self.worker.start()
+        self.next_request = 0
+
+    def post(self, committed, snapshot, plan_time):
+        """Queue a snapshot to plan from for up to plan_time seconds; returns its request id."""
+        self.next_request += 1
+        self.requests.put((self.next_request, committed, snapshot, plan_time))
+        return self.next_request
+
+    def poll(self):
+        """Latest published (request, action) or None."""
+        return self.slot.read()
+
+    def stop(self):
+        """Ask the worker to exit and wait briefly for it."""
+        self.requests.put(None)
+        self.worker.join(timeout=1.0)
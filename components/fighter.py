@@ -4,10 +4,10 @@ Handles animations, movement, attacks, and health with responsive scaling
 """
 
 import os
-from kivy.core.image import Image as CoreImage
-from kivy.core.audio import SoundLoader
-from kivy.core.window import Window
+from functools import partial
+from operator import attrgetter
 
+from utils.atlas import GameAtlas
 from config import (
     SPRITE_CONFIG, GROUND_Y, FIGHTER_SPEED, GRAVITY, 
     MAX_JUMPS, JUMP_VELOCITY, ATTACK_DAMAGE, ATTACK_RANGE,
@@ -16,6 +16,40 @@ from config import (
 )
 
 
+# Impact frames for each character and attack
+# These are the frames where the weapon visually connects
+IMPACT_FRAMES = {
+    'fantasy_warrior': {
+        'Attack1': [5],
+        'Attack2': [3],
+        'Attack3': [5],
+    },
+    'knight': {
+        'Attack1': [2],
+        'Attack2': [3],
+        'Attack3': [2, 7],  # Two hits in this combo attack
+    }
+}
+
+# Asset locations
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHARACTERS_PATH = os.path.join(BASE_PATH, 'assets', 'images', 'characters')
+
+# Sword sound cue (config.SFX_CUES) each attack plays, per character
+# Fantasy Warrior: Attack1->Sword2, Attack2->Sword3, Attack3->Sword1
+# Knight: Attack1->Sword3, Attack2->Sword2, Attack3->Sword3+Sword2
+ATTACK_SOUNDS = {
+    'fantasy_warrior': {'attack1': 'sword2', 'attack2': 'sword3', 'attack3': 'sword1'},
+    'knight': {'attack1': 'sword3', 'attack2': 'sword2', 'attack3_first': 'sword3', 'attack3_second': 'sword2'},
+}
+
+
+def sheet_path(name, action):
+    """Path of a character's sprite sheet for one action."""
+    character = 'knight' if name == 'knight' else 'fantasy_warrior'
+    return os.path.join(CHARACTERS_PATH, character, f'{action}.png')
+
+
 class Fighter:
     """Fighter class for game characters with responsive scaling."""
     
@@ -23,11 +57,27 @@ class Fighter:
     BASE_RECT_WIDTH = 105
     BASE_RECT_HEIGHT = 225
     
-    def __init__(self, x, y, name='fantasy_warrior', is_player_2=False):
+    # Simulation state captured by get_state() (attack_hits_registered is
+    # appended separately since it is mutable)
+    SIM_STATE = (
+        'x', 'y', 'vel_y', 'jump', 'jump_count', 'flip',
+        'attack_type', 'attacking', 'health', 'hit_cooldown', 'attack_cooldown',
+        'alive', 'death_animation_done', 'current_action', 'frame_index', 'animation_counter',
+        'move_left', 'move_right', 'dodging', 'dodge_cooldown', 'dodge_timer', 'dodge_direction',
+        'last_run_frame', 'attack3_second_swing_played',
+    )
+    _get_sim_state = attrgetter(*SIM_STATE)
+    
+    def __init__(self, x, y, name='fantasy_warrior', is_player_2=False, headless=False):
         self.name = name
         self.flip = is_player_2
         self.is_player_2 = is_player_2
         
+        # Headless fighters (simulation only) load no textures or sounds and
+        # use the base 1000x600 viewport instead of the Kivy Window
+        self.headless = headless
+        self.headless_scale = 1.0  # Scale a headless fighter simulates at
+        
         # Get config
         config = SPRITE_CONFIG.get(self.name, SPRITE_CONFIG['fantasy_warrior'])
         
@@ -62,8 +112,12 @@ class Fighter:
         self.current_action = 'Idle'
         self.frame_index = 0
         self.animation_counter = 0
-        self.animations = {}
+        self.animations = {}            # Right-facing frames per action
+        self.animations_flipped = {}    # Pre-mirrored (left-facing) frames per action
         self.current_texture = None
+        self.current_texture_flipped = None
+        self._sheets = []               # Sprite sheet paths held in the shared asset cache
+        self._sheet_generation = 0      # Bumped when the animations are replaced or unloaded
         
         # Movement input state (for touch controls)
         self.move_left = False
@@ -75,21 +129,28 @@ class Fighter:
         self.dodge_timer = 0
         self.dodge_direction = 1  # 1 = right, -1 = left
         
-        # Sound state
-        self.sounds = {}
-        self.footstep_sounds = []
-        self.footstep_index = 0
+        # Sound state (cues play on the shared SFX mixer; headless fighters have none)
+        self.sfx = None
+        self.attack_sounds = ATTACK_SOUNDS.get(self.name, ATTACK_SOUNDS['knight'])
         self.last_run_frame = -1
         self.attack3_second_swing_played = False
         
-        # Load animations
-        self.load_animations()
+        # Frame counts straight from the sprite config (textures may still be loading)
+        self.frame_counts = dict(self.animation_config)
         
-        # Load sounds
-        self.load_sounds()
+        if not headless:
+            # Load animations
+            self.load_animations()
+            
+            # Connect to the sound effect mixer
+            self.load_sounds()
     
     def _get_scale_factor(self):
         """Calculate scale factor based on screen size."""
+        if self.headless:
+            return self.headless_scale
+        
+        from kivy.core.window import Window
         base_width = 1000
         base_height = 600
         width_scale = Window.width / base_width
@@ -110,131 +171,134 @@ class Fighter:
         self.x_offset = (self.scale_width - self.RECT_WIDTH) // 2
     
     def load_animations(self):
-        """Load sprite sheet animations."""
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        """Load sprite sheet animations.
+        
+        Frames come from the shared texture atlas when it has been built
+        (tools/build_atlas.py), otherwise from the per-action sprite sheets.
+        Builds a right-facing and a mirrored left-facing frame table once so
+        drawing never has to create or flip texture regions. Sprite sheets come
+        from the shared asset cache and their frames are filled in as they arrive.
+        Animations loaded before are unloaded first.
+        """
+        from utils.asset_cache import AssetCache
+        
+        self.unload_animations()
+        atlas = GameAtlas.get_instance()
+        cache = AssetCache.get_instance()
+        generation = self._sheet_generation
         
         for action, num_frames in self.animation_config.items():
             self.animations[action] = []
+            self.animations_flipped[action] = []
             
-            if self.name == 'knight':
-                file_path = os.path.join(base_path, f'assets/images/characters/knight/{action}.png')
-            else:
-                file_path = os.path.join(base_path, f'assets/images/characters/fantasy_warrior/{action}.png')
+            # Preferred: pre-split frames from the shared atlas
+            frames = atlas.get_frames(self.name, action)
+            if frames:
+                for frame_texture in frames:
+                    self._add_frame(action, frame_texture)
+                continue
             
-            try:
-                if os.path.exists(file_path):
-                    core_img = CoreImage(file_path)
-                    texture = core_img.texture
-                    
-                    frame_width = texture.width // num_frames
-                    frame_height = texture.height
-                    
-                    for frame_idx in range(num_frames):
-                        frame_texture = texture.get_region(
-                            frame_idx * frame_width,
-                            0,
-                            frame_width,
-                            frame_height
-                        )
-                        self.animations[action].append(frame_texture)
-                else:
-                    print(f"Warning: Could not find {file_path}")
-            except Exception as e:
-                print(f"Warning: Could not load {file_path}: {e}")
+            file_path = sheet_path(self.name, action)
+            if os.path.exists(file_path):
+                cache.acquire(file_path, partial(self._on_sheet_loaded, generation, action, num_frames, file_path))
+            else:
+                print(f"Warning: Could not find {file_path}")
         
-        # Set initial texture
+        self._set_initial_texture()
+    
+    def unload_animations(self):
+        """Clear the frame tables and release the sprite sheets taken from the asset cache.
+        
+        Sheets still loading are released as soon as they arrive.
+        """
+        from utils.asset_cache import AssetCache
+        
+        cache = AssetCache.get_instance()
+        for path in self._sheets:
+            cache.release(path)
+        self._sheets = []
+        self._sheet_generation += 1
+        
+        self.animations = {}
+        self.animations_flipped = {}
+        self.current_texture = None
+        self.current_texture_flipped = None
+    
+    @staticmethod
+    def preload_assets(name):
+        """Load a character's sprite sheets into the shared asset cache."""
+        from utils.asset_cache import AssetCache
+        
+        atlas = GameAtlas.get_instance()
+        cache = AssetCache.get_instance()
+        config = SPRITE_CONFIG.get(name, SPRITE_CONFIG['fantasy_warrior'])
+        
+        for action in config['animations']:
+            file_path = sheet_path(name, action)
+            if not atlas.get_frames(name, action) and os.path.exists(file_path):
+                cache.preload(file_path)
+    
+    def _on_sheet_loaded(self, generation, action, num_frames, path, texture):
+        """Split a decoded sprite sheet into the action's frames."""
+        if texture is None:
+            return
+        if generation != self._sheet_generation:
+            # The animations were replaced or unloaded while this sheet loaded
+            from utils.asset_cache import AssetCache
+            AssetCache.get_instance().release(path)
+            return
+        self._sheets.append(path)
+        
+        frame_width = texture.width // num_frames
+        frame_height = texture.height
+        
+        for frame_idx in range(num_frames):
+            frame_texture = texture.get_region(
+                frame_idx * frame_width,
+                0,
+                frame_width,
+                frame_height
+            )
+            self._add_frame(action, frame_texture)
+        
+        if self.current_texture is None:
+            self._set_initial_texture()
+    
+    def _set_initial_texture(self):
+        """Show the first Idle frame once it is loaded."""
         if 'Idle' in self.animations and self.animations['Idle']:
             self.current_texture = self.animations['Idle'][0]
+            self.current_texture_flipped = self.animations_flipped['Idle'][0]
+    
+    def _add_frame(self, action, frame_texture):
+        """Add a frame and its pre-mirrored copy to the animation tables."""
+        self.animations[action].append(frame_texture)
+        
+        # Mirrored copy only differs in its tex_coords
+        flipped_texture = frame_texture.get_region(0, 0, frame_texture.width, frame_texture.height)
+        flipped_texture.flip_horizontal()
+        self.animations_flipped[action].append(flipped_texture)
     
     def load_sounds(self):
-        """Load sound effects for the fighter."""
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sfx_path = os.path.join(base_path, 'assets', 'images', 'sound_effects')
-        
-        def load_sound(file_path):
-            """Load a sound using Kivy's SoundLoader."""
-            if not os.path.exists(file_path):
-                return None
-            
-            try:
-                sound = SoundLoader.load(file_path)
-                return sound
-            except Exception as e:
-                print(f"[Sound] Error loading {file_path}: {e}")
-                return None
-        
-        # Load footstep sounds
-        dirt_path = os.path.join(sfx_path, 'Footsteps', 'Dirt')
-        
-        for i in range(1, 6):
-            sound_file = os.path.join(dirt_path, f'Dirt Run {i}.wav')
-            sound = load_sound(sound_file)
-            if sound:
-                sound.volume = 0.3
-                self.footstep_sounds.append(sound)
-        
-        # Load jump and land sounds
-        jump_file = os.path.join(dirt_path, 'Dirt Jump.wav')
-        land_file = os.path.join(dirt_path, 'Dirt Land.wav')
-        
-        self.sounds['jump'] = load_sound(jump_file)
-        if self.sounds['jump']:
-            self.sounds['jump'].volume = 0.4
-        
-        self.sounds['land'] = load_sound(land_file)
-        if self.sounds['land']:
-            self.sounds['land'].volume = 0.4
-        
-        # Load sword attack sounds
-        sword_path = os.path.join(sfx_path, 'sword_attacks_hits_and_blocks')
-        
-        sword_files = {
-            'sword1': os.path.join(sword_path, 'Sword Attack 1.wav'),
-            'sword2': os.path.join(sword_path, 'Sword Attack 2.wav'),
-            'sword3': os.path.join(sword_path, 'Sword Attack 3.wav'),
-        }
-        
-        for key, file_path in sword_files.items():
-            sound = load_sound(file_path)
-            if sound:
-                sound.volume = 0.5
-                self.sounds[key] = sound
-        
-        # Map attacks to sounds based on character
-        # Fantasy Warrior: Attack1->Sword2, Attack2->Sword3, Attack3->Sword1
-        # Knight: Attack1->Sword3, Attack2->Sword2, Attack3->Sword3+Sword2
-        if self.name == 'fantasy_warrior':
-            self.sounds['attack1'] = self.sounds.get('sword2')
-            self.sounds['attack2'] = self.sounds.get('sword3')
-            self.sounds['attack3'] = self.sounds.get('sword1')
-        else:  # knight
-            self.sounds['attack1'] = self.sounds.get('sword3')
-            self.sounds['attack2'] = self.sounds.get('sword2')
-            self.sounds['attack3_first'] = self.sounds.get('sword3')
-            self.sounds['attack3_second'] = self.sounds.get('sword2')
+        """Use the shared SFX mixer, which loads its voices on first use."""
+        from utils.sfx_mixer import SfxMixer
+        
+        self.sfx = SfxMixer.get_instance()
+        self.sfx.prewarm()
     
     def play_sound(self, sound_name):
-        """Play a sound effect."""
-        if sound_name in self.sounds and self.sounds[sound_name]:
-            try:
-                self.sounds[sound_name].play()
-            except Exception as e:
-                print(f"[Sound] Error playing {sound_name}: {e}")
+        """Trigger a sound effect cue (attacks play their character's sword cue)."""
+        if self.sfx is not None:
+            self.sfx.play(self.attack_sounds.get(sound_name, sound_name))
     
     def play_footstep(self):
         """Play the next footstep sound in sequence."""
-        if self.footstep_sounds:
-            try:
-                self.footstep_sounds[self.footstep_index].play()
-                self.footstep_index = (self.footstep_index + 1) % len(self.footstep_sounds)
-            except Exception as e:
-                print(f"[Sound] Error playing footstep: {e}")
+        self.play_sound('footstep')
     
     def update_animation(self, slow_motion_factor=1.0):
         """Update animation frame with optional slow motion."""
-        if self.current_action not in self.animations:
-            return
-        if len(self.animations[self.current_action]) == 0:
+        max_frames = self.frame_counts.get(self.current_action, 0)
+        if max_frames == 0:
             return
         
         if self.current_action == 'Death' and self.death_animation_done:
@@ -247,8 +311,6 @@ class Fighter:
             self.animation_counter = 0
             self.frame_index += 1
             
-            max_frames = len(self.animations[self.current_action])
-            
             # Knight Attack3 second swing sound (frame 5 is when second swing starts)
             if (self.current_action == 'Attack3' and self.name == 'knight' and 
                 self.frame_index == 5 and not self.attack3_second_swing_played):
@@ -266,16 +328,17 @@ class Fighter:
                     self.attacking = False
                     self.attack_cooldown = ATTACK_COOLDOWN
         
-        if self.current_action in self.animations:
-            frames = self.animations[self.current_action]
-            if len(frames) > 0:
-                safe_index = min(self.frame_index, len(frames) - 1)
-                self.current_texture = frames[safe_index]
+        frames = self.animations.get(self.current_action)
+        if frames:
+            safe_index = min(self.frame_index, len(frames) - 1)
+            self.current_texture = frames[safe_index]
+            self.current_texture_flipped = self.animations_flipped[self.current_action][safe_index]
     
     def move(self, screen_width, screen_height, target):
         """Update fighter position and state."""
-        # Update scaled dimensions for responsive sizing
-        self._update_scaled_dimensions()
+        # Update scaled dimensions for responsive sizing (fixed when headless)
+        if not self.headless:
+            self._update_scaled_dimensions()
         
         # Get scaled physics values
         scale = self._get_scale_factor()
@@ -441,21 +504,6 @@ class Fighter:
         if not self.attacking or not self.alive:
             return
         
-        # Define impact frames for each character and attack
-        # These are the frames where the weapon visually connects
-        IMPACT_FRAMES = {
-            'fantasy_warrior': {
-                'Attack1': [5],
-                'Attack2': [3],
-                'Attack3': [5],
-            },
-            'knight': {
-                'Attack1': [2],
-                'Attack2': [3],
-                'Attack3': [2, 7],  # Two hits in this combo attack
-            }
-        }
-        
         # Get impact frames for this character and attack
         char_impacts = IMPACT_FRAMES.get(self.name, {})
         attack_impacts = char_impacts.get(self.current_action, [])
@@ -490,6 +538,28 @@ class Fighter:
                 target.hit_cooldown = HIT_COOLDOWN
                 self.attack_hits_registered.add(self.frame_index)  # Mark this frame as hit
     
+    def get_state(self):
+        """Snapshot of the simulation state (cheap tuple, see set_state)."""
+        return self._get_sim_state(self) + (frozenset(self.attack_hits_registered),)
+    
+    def set_state(self, state):
+        """Restore a snapshot taken by get_state (of this or another fighter)."""
+        for name, value in zip(self.SIM_STATE, state):
+            setattr(self, name, value)
+        self.attack_hits_registered = set(state[-1])
+    
+    def set_headless_scale(self, scale):
+        """Simulate at another fighter's screen scale (headless fighters only)."""
+        if scale != self.headless_scale:
+            self.headless_scale = scale
+            self._update_scaled_dimensions()
+    
+    def get_frame_texture(self):
+        """Get the current frame texture for the direction the fighter faces."""
+        if self.flip:
+            return self.current_texture_flipped
+        return self.current_texture
+    
     def get_draw_pos(self):
         """Get position to draw sprite."""
         draw_x = self.x - self.x_offset
@@ -525,9 +595,9 @@ class Fighter:
         self.dodge_timer = 0
         
         # Reset sound state
-        self.footstep_index = 0
         self.last_run_frame = -1
         self.attack3_second_swing_played = False
         
         if 'Idle' in self.animations and self.animations['Idle']:
             self.current_texture = self.animations['Idle'][0]
+            self.current_texture_flipped = self.animations_flipped['Idle'][0]
@@ -1,9 +1,10 @@
 """
 Health Bar Component
 Draws and manages health bar display with responsive scaling
+Keeps cached quads that are only rebuilt when health or viewport changes,
+plus an animated recent damage trail, and submits them to a SpriteBatch
 """
 
-from kivy.graphics import Rectangle, Color, Line
 from kivy.core.window import Window
 
 
@@ -16,20 +17,40 @@ class HealthBar:
     BASE_OFFSET_Y = 50
     BASE_MARGIN = 20
     
+    # Recent damage trail
+    TRAIL_HOLD_TIME = 0.4   # Seconds the trail stays put after a hit
+    TRAIL_DRAIN_SPEED = 60  # Health points per second the trail drains
+    BORDER_WIDTH = 2
+    
+    # Solid colors (drawn from a ColorPalette texture)
+    BG_COLOR = (1, 0, 0, 1)
+    FILL_COLOR = (0, 1, 0, 1)
+    TRAIL_COLOR = (1, 0.85, 0.2, 1)
+    BORDER_COLOR = (1, 1, 1, 1)
+    COLORS = (BG_COLOR, FILL_COLOR, TRAIL_COLOR, BORDER_COLOR)
+    
     def __init__(self, is_flipped=False):
         self.is_flipped = is_flipped  # For enemy health bar (fills from right)
+        
+        # Displayed state
+        self.health = 100
+        self.trail_health = 100
+        self.trail_hold = 0
+        self.dirty = True
+        
+        self.viewport = (Window.width, Window.height)
         self._update_dimensions()
     
     def _get_scale_factor(self):
-        """Calculate scale factor based on screen size."""
+        """Calculate scale factor based on viewport size."""
         base_width = 1000
         base_height = 600
-        width_scale = Window.width / base_width
-        height_scale = Window.height / base_height
+        width_scale = self.viewport[0] / base_width
+        height_scale = self.viewport[1] / base_height
         return min(width_scale, height_scale)
     
     def _update_dimensions(self):
-        """Update dimensions based on current screen size."""
+        """Update dimensions based on current viewport size."""
         scale = self._get_scale_factor()
         
         self.width = int(self.BASE_WIDTH * scale)
@@ -37,35 +58,102 @@ class HealthBar:
         margin = int(self.BASE_MARGIN * scale)
         offset_y = int(self.BASE_OFFSET_Y * scale)
         
-        self.y = Window.height - offset_y - self.height
+        self.y = self.viewport[1] - offset_y - self.height
         
         if self.is_flipped:
-            self.x = Window.width - self.width - margin
+            self.x = self.viewport[0] - self.width - margin
         else:
             self.x = margin
     
-    def draw(self, canvas, health):
-        """Draw the health bar on the given canvas."""
-        # Update dimensions in case window was resized
+    def set_viewport(self, width, height):
+        """Recompute layout if the viewport size changed."""
+        if (width, height) == self.viewport:
+            return
+        self.viewport = (width, height)
         self._update_dimensions()
+        self.dirty = True
+    
+    @property
+    def animating(self):
+        """True while the damage trail still has to move."""
+        return self.trail_health > self.health
+    
+    def reset(self, health=100):
+        """Snap the bar and its damage trail to a health value."""
+        self.health = health
+        self.trail_health = health
+        self.trail_hold = 0
+        self.dirty = True
+    
+    def build(self, palette):
+        """Resolve the solid color swatches used to draw the bar."""
+        self.bg_region = palette.get(self.BG_COLOR)
+        self.trail_region = palette.get(self.TRAIL_COLOR)
+        self.fill_region = palette.get(self.FILL_COLOR)
+        self.border_region = palette.get(self.BORDER_COLOR)
+        self.quads = []
+        self.dirty = True
+    
+    def update(self, health, dt=0.0):
+        """Advance the damage trail and rebuild quads only when something changed.
         
-        ratio = max(0, min(1, health / 100))
+        Returns True if the quads changed and need to be resubmitted.
+        """
+        if health != self.health:
+            if health < self.health:
+                # Hold the trail at the pre-hit value for a moment
+                self.trail_hold = self.TRAIL_HOLD_TIME
+            self.health = health
+            if self.trail_health < health:
+                self.trail_health = health
+            self.dirty = True
         
-        with canvas:
+        # Drain the recent damage trail towards current health
+        if self.trail_health > self.health:
+            if self.trail_hold > 0:
+                self.trail_hold -= dt
+            else:
+                self.trail_health = max(self.health, self.trail_health - self.TRAIL_DRAIN_SPEED * dt)
+                self.dirty = True
+        
+        if not self.dirty:
+            return False
+        self.dirty = False
+        self._apply_geometry()
+        return True
+    
+    def _apply_geometry(self):
+        """Rebuild the cached quads from the current layout and health."""
+        ratio = max(0, min(1, self.health / 100))
+        trail_ratio = max(0, min(1, self.trail_health / 100))
+        
+        health_width = self.width * ratio
+        trail_width = self.width * trail_ratio
+        if self.is_flipped:
+            # Fill from right for enemy
+            trail_x = self.x + self.width - trail_width
+            health_x = self.x + self.width - health_width
+        else:
+            trail_x = self.x
+            health_x = self.x
+        
+        x, y, w, h = self.x, self.y, self.width, self.height
+        b = self.BORDER_WIDTH
+        self.quads = [
             # Background (red)
-            Color(1, 0, 0, 1)
-            Rectangle(pos=(self.x, self.y), size=(self.width, self.height))
-            
+            (self.bg_region, x, y, w, h),
+            # Recent damage trail (behind the green fill)
+            (self.trail_region, trail_x, y, trail_width, h),
             # Health (green)
-            Color(0, 1, 0, 1)
-            if self.is_flipped:
-                # Fill from right for enemy
-                health_width = self.width * ratio
-                health_x = self.x + self.width - health_width
-                Rectangle(pos=(health_x, self.y), size=(health_width, self.height))
-            else:
-                Rectangle(pos=(self.x, self.y), size=(self.width * ratio, self.height))
-            
-            # Border
-            Color(1, 1, 1, 1)
-            Line(rectangle=(self.x, self.y, self.width, self.height), width=2)
+            (self.fill_region, health_x, y, health_width, h),
+            # Border (centered on the bar edges)
+            (self.border_region, x - b / 2, y - b / 2, w + b, b),
+            (self.border_region, x - b / 2, y + h - b / 2, w + b, b),
+            (self.border_region, x - b / 2, y - b / 2, b, h + b),
+            (self.border_region, x + w - b / 2, y - b / 2, b, h + b),
+        ]
+    
+    def draw(self, batch):
+        """Submit the cached quads to a sprite batch."""
+        for region, x, y, w, h in self.quads:
+            batch.draw(region, x, y, w, h)
@@ -0,0 +1,251 @@
+"""
+Lookahead Search Component
+Time-budgeted open-loop Monte Carlo tree search for the bot: plays short
+macro-actions forward on cloned headless fighters, keeps its tree between
+frames and commits to the most visited action at each decision point
+"""
+
+import math
+import time
+
+from components.policy_table import (
+    ACTIONS, ATTACK1, ATTACK3, DODGE, JUMP, APPROACH, BACK_OFF, encode_state
+)
+
+
+MACRO_TICKS = 8            # Ticks each searched action is held for
+DEPTH = 4                  # Macro-actions per simulated line (32 ticks, ~0.5 s)
+EXPLORATION = 1.0          # UCB1 exploration constant (rewards are ~-1..1)
+REWARD_SCALE = 20.0        # Damage points per unit of reward
+KO_BONUS = 2.0             # Reward for knocking out the opponent (negative when knocked out)
+OPPONENT_MODEL = 'hard'    # Rule-based difficulty the opponent is simulated as
+
+
+def apply_action(fighter, action, target):
+    """Start a macro-action on a fighter (live or cloned) facing a target."""
+    towards_right = fighter.x < target.x
+    if ATTACK1 <= action <= ATTACK3:
+        # Attack 3 is A2 while moving, so keep moving towards the target
+        moving = action == ATTACK3
+        fighter.move_left = moving and not towards_right
+        fighter.move_right = moving and towards_right
+        fighter.do_attack(action - ATTACK1 + 1)
+    elif action == DODGE and fighter.dodge_cooldown == 0:
+        # Face away from target to dash away
+        fighter.flip = towards_right
+        fighter.do_dodge()
+    elif action in (DODGE, BACK_OFF):
+        fighter.move_left = towards_right
+        fighter.move_right = not towards_right
+    elif action == APPROACH:
+        fighter.move_left = not towards_right
+        fighter.move_right = towards_right
+    elif action == JUMP:
+        fighter.do_jump()
+    else:  # wait
+        fighter.move_left = False
+        fighter.move_right = False
+
+
+class SearchNode:
+    """Statistics for one macro-action sequence."""
+
+    __slots__ = ('visits', 'total', 'children')
+
+    def __init__(self):
+        self.visits = 0
+        self.total = 0.0
+        self.children = [None] * len(ACTIONS)
+
+
+class LookaheadSearch:
+    """Anytime search choosing a fighter's macro-actions in place of BotAI's rules.
+
+    Every update() restores the clones to the live state, finishes the
+    committed macro-action and then runs simulations from the tree root until
+    the time budget is spent (or a fixed number of iterations, for
+    reproducible offline runs). After begin_frame() the budget is per
+    rendered frame, shared by the ticks that frame runs; otherwise it is per
+    update(). When the committed action ends, the most
+    visited root action is chosen and its subtree becomes the new root.
+    Works from state snapshots only, so it can also run on a DecisionWorker.
+    """
+
+    def __init__(self, rng, budget_ms, iterations=None, policy_table=None):
+        self.rng = rng
+        self.budget = budget_ms / 1000.0
+        self.iterations = iterations
+        self.policy_table = policy_table
+        self.own = None
+        self.opponent = None
+        self.model = None
+        self.reset()
+
+    def reset(self):
+        """Drop the tree (e.g. at the start of a match)."""
+        self.root = SearchNode()
+        self.remaining = 0
+        self.iterations_run = 0
+        self.frame_budget = None  # Seconds left this rendered frame (None: budget per update)
+        self.frame_ticks = 0  # Ticks this rendered frame has yet to run
+
+    def prepare(self, own_name, own_is_player_2, target_name, target_is_player_2, scale):
+        """Create the headless clones and opponent model on first use, at the live scale."""
+        if self.own is None or self.own.name != own_name or self.opponent.name != target_name:
+            # Imported here: bot_ai imports this module
+            from components.bot_ai import BotAI
+            from components.fighter import Fighter
+            self.own = Fighter(0, 0, own_name, own_is_player_2, headless=True)
+            self.opponent = Fighter(0, 0, target_name, target_is_player_2, headless=True)
+            self.model = BotAI(self.opponent, OPPONENT_MODEL, seed=self.rng.getrandbits(32))
+            self.order = (self.opponent, self.own) if own_is_player_2 else (self.own, self.opponent)
+        self.own.set_headless_scale(scale)
+        self.opponent.set_headless_scale(scale)
+
+    def begin_frame(self, ticks):
+        """Give the next rendered frame one budget, split evenly across its ticks."""
+        self.frame_budget = self.budget
+        self.frame_ticks = ticks
+
+    def update(self, fighter, target, target_state, screen_width, screen_height):
+        """Search for this tick's budget; returns the next action when one is due, else None.
+
+        target_state is the opponent's state as the bot perceives it (see
+        PerceptionBuffer.perceive_state), not necessarily its live state.
+        """
+        self.prepare(fighter.name, fighter.is_player_2, target.name, target.is_player_2,
+                     fighter._get_scale_factor())
+        if self.remaining > 0:
+            self.remaining -= 1
+
+        if self.frame_budget is None:
+            self.think(fighter.get_state(), target_state, screen_width, screen_height)
+        else:
+            # This tick's share of what is left of the frame (overruns come out of later ticks)
+            start = time.perf_counter()
+            budget = self.frame_budget / max(1, self.frame_ticks)
+            self.frame_ticks = max(0, self.frame_ticks - 1)
+            self.think(fighter.get_state(), target_state, screen_width, screen_height, budget)
+            self.frame_budget -= time.perf_counter() - start
+        if self.remaining == 0:
+            return self.commit()
+        return None
+
+    def think(self, own_state, target_state, screen_width, screen_height, budget=None):
+        """Run simulations from a snapshot for the budget (seconds, default self.budget)."""
+        if self.iterations is not None:
+            for _ in range(self.iterations):
+                self._iterate(own_state, target_state, screen_width, screen_height)
+            return
+        deadline = time.perf_counter() + (self.budget if budget is None else budget)
+        while time.perf_counter() < deadline:
+            self._iterate(own_state, target_state, screen_width, screen_height, deadline)
+
+    def commit(self):
+        """Choose the best root action and hold it for the next macro-action."""
+        action = self.best_action()
+        self.advance(action)
+        return action
+
+    def advance(self, action):
+        """Make an action's subtree the root once it has been played."""
+        self.root = self.root.children[action] or SearchNode()
+        self.remaining = MACRO_TICKS
+
+    def best_action(self):
+        """Most visited root action (best mean on ties)."""
+        best, best_key = 0, None
+        for action, child in enumerate(self.root.children):
+            if child is None or child.visits == 0:
+                continue
+            key = (child.visits, child.total / child.visits)
+            if best_key is None or key > best_key:
+                best, best_key = action, key
+        return best
+
+    def _iterate(self, own_state, target_state, screen_width, screen_height, deadline=None):
+        """Run one simulation from the live state and back up its reward.
+
+        A simulation still running at the deadline is dropped unscored, so
+        the budget is overrun by at most one macro-action.
+        """
+        own = self.own
+        opponent = self.opponent
+        rng = self.rng
+        own.set_state(own_state)
+        opponent.set_state(target_state)
+        model = self.model
+        model.perception.clear()
+        model.decision_timer = 0
+        model.action_timer = 0
+        model.current_action = 'idle'
+        own_health = own.health
+        opponent_health = opponent.health
+
+        # Finish the committed action, then walk the tree
+        self._simulate(self.remaining, screen_width, screen_height)
+        node = self.root
+        path = [node]
+        expanding = True
+        for _ in range(DEPTH):
+            if own.health <= 0 or opponent.health <= 0:
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                return
+            if expanding:
+                action, expanding = self._select(node, rng)
+                if node.children[action] is None:
+                    node.children[action] = SearchNode()
+                node = node.children[action]
+                path.append(node)
+            else:
+                action = self._rollout_action(rng)
+            apply_action(own, action, opponent)
+            self._simulate(MACRO_TICKS, screen_width, screen_height)
+
+        reward = ((opponent_health - opponent.health) - (own_health - own.health)) / REWARD_SCALE
+        if opponent.health <= 0:
+            reward += KO_BONUS
+        elif own.health <= 0:
+            reward -= KO_BONUS
+        for visited in path:
+            visited.visits += 1
+            visited.total += reward
+        self.iterations_run += 1
+
+    def _select(self, node, rng):
+        """UCB1 child, or an untried action (which ends tree descent)."""
+        untried = [action for action, child in enumerate(node.children) if child is None or child.visits == 0]
+        if untried:
+            return untried[int(rng.random() * len(untried))], False
+        log_visits = math.log(node.visits)
+        best, best_score = 0, -math.inf
+        for action, child in enumerate(node.children):
+            score = child.total / child.visits + EXPLORATION * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = action, score
+        return best, True
+
+    def _rollout_action(self, rng):
+        """Default policy below the tree: the trained table if loaded, else uniform."""
+        table = self.policy_table
+        if table is not None:
+            return table.choose(encode_state(self.own, self.opponent), rng)
+        return int(rng.random() * len(ACTIONS))
+
+    def _simulate(self, ticks, screen_width, screen_height):
+        """Advance the clones as Match.step does while in play."""
+        own = self.own
+        opponent = self.opponent
+        model = self.model
+        first, second = self.order
+        for _ in range(ticks):
+            model.update(own, screen_width)
+            first.move(screen_width, screen_height, second)
+            second.move(screen_width, screen_height, first)
+            first.update_animation()
+            second.update_animation()
+            first.check_attack_hit(second)
+            second.check_attack_hit(first)
+            if own.health <= 0 or opponent.health <= 0:
+                return
@@ -0,0 +1,154 @@
+"""
+Match Simulation Component
+Deterministic fixed-step match rules: countdown, bot AI, fighter physics,
+attack hits, match timer and game over. Has no rendering or Kivy Clock
+dependency, so it advances by exactly one tick per step() call.
+"""
+
+from config import SIM_TICK_RATE
+
+
+class Match:
+    """Fixed-step simulation of one match between two fighters."""
+
+    COUNTDOWN_TIME = 1.9   # Seconds of "3, 2, 1, FIGHT!"
+    MATCH_TIME = 40.0      # Seconds per round
+
+    def __init__(self, fighter_1, fighter_2, bot_ai=None, tick_rate=SIM_TICK_RATE, player_ai=None, seed=None):
+        self.fighter_1 = fighter_1
+        self.fighter_2 = fighter_2
+        self.bot_ai = bot_ai          # Controls fighter 2 when set
+        self.player_ai = player_ai    # Controls fighter 1 when set (bot vs bot)
+        self.seed = seed              # Seed the AI was started from, recorded with results
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate
+        self.reset()
+
+    def reset(self):
+        """Reset match state (fighters are reset by their owner)."""
+        self.tick = 0
+
+        # Game over state
+        self.game_over = False
+        self.game_over_timer = 0
+        self.slow_motion_factor = 1.0
+        self.winner = None  # 'player' or 'bot'
+
+        # Match timer
+        self.match_time = self.MATCH_TIME
+
+        # Countdown state (3, 2, 1, FIGHT!)
+        self.countdown_active = True
+        self.countdown_time = self.COUNTDOWN_TIME
+        self.countdown_text = "3"
+
+    @property
+    def in_play(self):
+        """True while fighters accept input (after countdown, before game over)."""
+        return not self.countdown_active and not self.game_over
+
+    def begin_frame(self, ticks):
+        """Tell the AI controllers how many ticks the coming rendered frame runs."""
+        for ai in (self.player_ai, self.bot_ai):
+            if ai is not None:
+                ai.begin_frame(ticks)
+
+    def step(self, screen_width, screen_height):
+        """Advance the match by exactly one tick."""
+        self.tick += 1
+        dt = self.tick_dt
+
+        # Handle countdown
+        if self.countdown_active:
+            self.countdown_time -= dt
+
+            # Determine countdown text based on remaining time
+            # 1.9 -> 1.425: "3", 1.425 -> 0.95: "2", 0.95 -> 0.475: "1", 0.475 -> 0: "FIGHT!"
+            if self.countdown_time > 1.425:
+                self.countdown_text = "3"
+            elif self.countdown_time > 0.95:
+                self.countdown_text = "2"
+            elif self.countdown_time > 0.475:
+                self.countdown_text = "1"
+            elif self.countdown_time > 0:
+                self.countdown_text = "FIGHT!"
+            else:
+                self.countdown_active = False
+                self.countdown_text = ""
+
+            # During countdown fighters only idle
+            self.fighter_1.update_animation()
+            self.fighter_2.update_animation()
+            return
+
+        # If game is over, only update slow motion timer and animations
+        if self.game_over:
+            self.game_over_timer += dt
+
+            # Gradually slow down
+            if self.slow_motion_factor > 0.2:
+                self.slow_motion_factor -= dt * 0.8  # Slow down over ~1 second
+                self.slow_motion_factor = max(0.2, self.slow_motion_factor)
+
+            # Continue applying gravity so fighters land on the ground
+            self.fighter_1.move(screen_width, screen_height, self.fighter_2)
+            self.fighter_2.move(screen_width, screen_height, self.fighter_1)
+
+            # Update animations in slow motion
+            self.fighter_1.update_animation(self.slow_motion_factor)
+            self.fighter_2.update_animation(self.slow_motion_factor)
+            return
+
+        # Update AI controllers (fighter 1 only in bot vs bot matches)
+        if self.player_ai:
+            self.player_ai.update(self.fighter_2, screen_width, screen_height)
+        if self.bot_ai:
+            self.bot_ai.update(self.fighter_1, screen_width, screen_height)
+
+        # Update fighters
+        self.fighter_1.move(screen_width, screen_height, self.fighter_2)
+        self.fighter_2.move(screen_width, screen_height, self.fighter_1)
+
+        # Update animations
+        self.fighter_1.update_animation()
+        self.fighter_2.update_animation()
+
+        # Check attacks
+        self.fighter_1.check_attack_hit(self.fighter_2)
+        self.fighter_2.check_attack_hit(self.fighter_1)
+
+        # Update match timer
+        self.match_time -= dt
+        if self.match_time <= 0:
+            self.match_time = 0
+            # Determine winner by health
+            if self.fighter_1.health > self.fighter_2.health:
+                self.trigger_game_over('player')
+            elif self.fighter_2.health > self.fighter_1.health:
+                self.trigger_game_over('bot')
+            else:
+                # Tie - bot wins by default
+                self.trigger_game_over('bot')
+
+        # Check for game over
+        if not self.fighter_1.alive and not self.game_over:
+            self.trigger_game_over('bot')
+        elif not self.fighter_2.alive and not self.game_over:
+            self.trigger_game_over('player')
+
+    def trigger_game_over(self, winner):
+        """Trigger game over state."""
+        self.game_over = True
+        self.game_over_timer = 0
+        self.slow_motion_factor = 1.0
+        self.winner = winner
+
+        # Disable movement and stop any ongoing attacks (except for a dead fighter)
+        for fighter in (self.fighter_1, self.fighter_2):
+            fighter.move_left = False
+            fighter.move_right = False
+            if fighter.alive:
+                fighter.attacking = False
+                fighter.current_action = 'Idle'
+                fighter.frame_index = 0
+                fighter.animation_counter = 0
@@ -0,0 +1,80 @@
+"""
+Parallax Background Component
+One Rectangle per layer on a repeating texture; scrolling only changes
+tex_coords, driven by elapsed time so speed is frame-rate independent
+"""
+
+from kivy.graphics import Color, Rectangle
+from kivy.clock import Clock
+
+
+class ParallaxBackground:
+    """Time-driven UV-scrolling parallax layers drawn on a canvas."""
+
+    def __init__(self, canvas, textures, speeds=None, pos=(0, 0), size=(100, 100)):
+        """Create the layer rectangles.
+
+        textures: layer textures ordered back to front.
+        speeds: scroll speed per layer in texture pixels per second (0 = static).
+        """
+        self.textures = list(textures)
+        self.speeds = list(speeds) if speeds else [0] * len(self.textures)
+        self.elapsed = 0.0
+        self._event = None
+
+        self.canvas = canvas
+        self.color = Color(1, 1, 1, 1)
+        self.rects = []
+        canvas.add(self.color)
+        for texture in self.textures:
+            if any(self.speeds):
+                texture.wrap = 'repeat'
+            rect = Rectangle(texture=texture, pos=pos, size=size)
+            canvas.add(rect)
+            self.rects.append(rect)
+        self._apply_offsets()
+
+    @property
+    def animated(self):
+        """True if any layer scrolls."""
+        return any(self.speeds)
+
+    def set_rect(self, pos, size):
+        """Move/resize all layers (e.g. on widget resize)."""
+        for rect in self.rects:
+            rect.pos = pos
+            rect.size = size
+
+    def start(self):
+        """Start scrolling (no-op for static backgrounds)."""
+        if self._event is None and self.animated:
+            self._event = Clock.schedule_interval(self.update, 0)
+
+    def stop(self):
+        """Stop scrolling."""
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def remove(self):
+        """Stop scrolling and take the layers off the canvas."""
+        self.stop()
+        for instruction in [self.color] + self.rects:
+            self.canvas.remove(instruction)
+        self.rects = []
+
+    def update(self, dt):
+        """Advance the scroll by real elapsed time."""
+        self.elapsed += dt
+        self._apply_offsets()
+
+    def _apply_offsets(self):
+        """Shift each layer's U coordinates by its scroll offset."""
+        for texture, speed, rect in zip(self.textures, self.speeds, self.rects):
+            if not speed:
+                continue
+            offset = (self.elapsed * speed / texture.width) % 1.0
+            u, v = texture.uvpos
+            uw, vh = texture.uvsize
+            u += offset * uw
+            rect.tex_coords = (u, v, u + uw, v, u + uw, v + vh, u, v + vh)
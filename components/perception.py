@@ -0,0 +1,95 @@
+"""
+Perception Buffer Component
+Fixed-size ring of compact opponent snapshots so a bot perceives the world
+a number of ticks late (its reaction time). Bots that simulate ahead can
+also keep the opponent's full state per tick.
+"""
+
+from array import array
+
+
+# Bits of the packed flags byte
+ATTACKING = 1
+DODGING = 2
+AIRBORNE = 4
+
+
+class OpponentView:
+    """Snapshot of the opponent fields the bot decides on (reused, never reallocated)."""
+
+    __slots__ = ('x', 'y', 'health', 'attack_cooldown', 'attacking', 'dodging', 'jump')
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.health = 0
+        self.attack_cooldown = 0
+        self.attacking = False
+        self.dodging = False
+        self.jump = False
+
+
+class PerceptionBuffer:
+    """Array-backed ring of the last delay + 1 opponent snapshots."""
+
+    def __init__(self, delay, keep_states=False):
+        self.delay = max(0, int(delay))
+        size = self.delay + 1
+        self.states = [None] * size if keep_states else None  # Full Fighter.get_state() snapshots
+        self.x = array('d', [0.0]) * size
+        self.y = array('d', [0.0]) * size
+        self.health = array('i', [0]) * size
+        self.attack_cooldown = array('i', [0]) * size
+        self.flags = array('b', [0]) * size
+        self.view = OpponentView()
+        self.clear()
+
+    def clear(self):
+        """Forget all snapshots (e.g. at the start of a match)."""
+        self.head = -1
+        self.count = 0
+
+    def record(self, target):
+        """Store this tick's opponent state, overwriting the oldest snapshot."""
+        head = self.head + 1
+        if head == len(self.x):
+            head = 0
+        self.head = head
+        self.x[head] = target.x
+        self.y[head] = target.y
+        self.health[head] = target.health
+        self.attack_cooldown[head] = target.attack_cooldown
+        self.flags[head] = (
+            (ATTACKING if target.attacking else 0) |
+            (DODGING if target.dodging else 0) |
+            (AIRBORNE if target.jump else 0))
+        if self.states is not None:
+            self.states[head] = target.get_state()
+        if self.count <= self.delay:
+            self.count += 1
+
+    def perceive(self):
+        """Opponent state delay ticks ago (the oldest known early on), in the shared view."""
+        index = self._perceived_index()
+        flags = self.flags[index]
+        view = self.view
+        view.x = self.x[index]
+        view.y = self.y[index]
+        view.health = self.health[index]
+        view.attack_cooldown = self.attack_cooldown[index]
+        view.attacking = (flags & ATTACKING) != 0
+        view.dodging = (flags & DODGING) != 0
+        view.jump = (flags & AIRBORNE) != 0
+        return view
+
+    def perceive_state(self):
+        """Full opponent state (see Fighter.get_state) as of perceive(); needs keep_states."""
+        return self.states[self._perceived_index()]
+
+    def _perceived_index(self):
+        """Ring index of the snapshot delay ticks ago (the oldest known early on)."""
+        age = min(self.delay, self.count - 1)
+        index = self.head - age
+        if index < 0:
+            index += len(self.x)
+        return index
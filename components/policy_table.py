@@ -0,0 +1,123 @@
+"""
+Policy Table Component
+Precomputed bot policy built offline by tools/train_policy.py: a discretized
+game state indexes a row of action slots, so a decision is one lookup
+"""
+
+import bisect
+import mmap
+import os
+import struct
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+POLICY_FILE = os.path.join(BASE_PATH, 'assets', 'data', 'bot_policy.bin')
+
+# State buckets
+DISTANCE_EDGES = (60, 120, 180, 260, 380)   # |dx| in base pixels
+HEIGHT_EDGES = (-40, 40)                    # opponent y - own y
+HEALTH_EDGES = (-30, -10, 10, 30)           # own health - opponent health
+OPPONENT_STATES = 4                         # neutral, airborne, attacking, dodging
+NEUTRAL, AIRBORNE, ATTACKING, DODGING = range(OPPONENT_STATES)
+
+DISTANCE_BUCKETS = len(DISTANCE_EDGES) + 1
+HEIGHT_BUCKETS = len(HEIGHT_EDGES) + 1
+HEALTH_BUCKETS = len(HEALTH_EDGES) + 1
+FLAG_COMBINATIONS = 8                       # own attack ready, own dodge ready, opponent recovering
+CELLS = DISTANCE_BUCKETS * HEIGHT_BUCKETS * OPPONENT_STATES * FLAG_COMBINATIONS * HEALTH_BUCKETS
+
+# Actions
+ACTIONS = ('attack1', 'attack2', 'attack3', 'dodge', 'jump', 'approach', 'back_off', 'wait')
+ATTACK1, ATTACK2, ATTACK3, DODGE, JUMP, APPROACH, BACK_OFF, WAIT = range(len(ACTIONS))
+
+# Each cell holds SLOTS action ids in proportion to its action distribution,
+# so sampling is a single random index into the row
+SLOTS = 64
+
+# File layout: magic, version, then the table dimensions, then CELLS * SLOTS bytes
+MAGIC = b'BPT1'
+VERSION = 1
+HEADER = struct.Struct('<4sH7H')
+
+
+def header_values():
+    """Dimensions written into (and checked against) the file header."""
+    return (MAGIC, VERSION, DISTANCE_BUCKETS, HEIGHT_BUCKETS, OPPONENT_STATES,
+            FLAG_COMBINATIONS, HEALTH_BUCKETS, len(ACTIONS), SLOTS)
+
+
+def opponent_state(view):
+    """Bucket an opponent (or perceived snapshot) by what it is doing."""
+    if view.attacking:
+        return ATTACKING
+    if view.dodging:
+        return DODGING
+    if view.jump:
+        return AIRBORNE
+    return NEUTRAL
+
+
+def encode_state(fighter, opponent):
+    """Table cell for a fighter facing a (perceived) opponent."""
+    distance = bisect.bisect_right(DISTANCE_EDGES, abs(opponent.x - fighter.x))
+    height = bisect.bisect_right(HEIGHT_EDGES, opponent.y - fighter.y)
+    health = bisect.bisect_right(HEALTH_EDGES, fighter.health - opponent.health)
+    flags = ((fighter.attack_cooldown == 0) << 2 |
+             (fighter.dodge_cooldown == 0) << 1 |
+             (opponent.attack_cooldown > 0))
+    cell = distance
+    cell = cell * HEIGHT_BUCKETS + height
+    cell = cell * OPPONENT_STATES + opponent_state(opponent)
+    cell = cell * FLAG_COMBINATIONS + flags
+    return cell * HEALTH_BUCKETS + health
+
+
+class PolicyTable:
+    """Read-only, memory-mapped policy table shared by all bots in the process."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = PolicyTable()
+        return cls._instance
+
+    def __init__(self, path=POLICY_FILE):
+        self.path = path
+        self.data = None
+        self._file = None
+        self._mmap = None
+        self._load()
+
+    def _load(self):
+        """Map the table file if it exists and matches this build's layout."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            self._file = open(self.path, 'rb')
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                buffer = self._mmap
+            except (OSError, ValueError):
+                buffer = self._file.read()
+            if HEADER.unpack_from(buffer, 0) != header_values():
+                print(f"Warning: Policy table {self.path} does not match this build, ignoring it")
+                return
+            data = memoryview(buffer)[HEADER.size:]
+            if len(data) != CELLS * SLOTS:
+                print(f"Warning: Policy table {self.path} is truncated, ignoring it")
+                return
+            self.data = data
+        except Exception as e:
+            print(f"Warning: Could not load policy table {self.path}: {e}")
+
+    @property
+    def available(self):
+        """True if a valid table is loaded."""
+        return self.data is not None
+
+    def choose(self, cell, rng):
+        """Sample an action for a cell: one indexed read."""
+        return self.data[cell * SLOTS + int(rng.random() * SLOTS)]
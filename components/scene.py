@@ -0,0 +1,43 @@
+"""
+Retained Scene Component
+Persistent per-layer instruction groups so the game canvas is built once
+and only updated in place each frame
+"""
+
+from kivy.graphics import InstructionGroup
+
+
+class RetainedScene:
+    """Layered retained-mode scene graph attached to a widget canvas."""
+
+    # Draw order (first layer is drawn at the back)
+    LAYERS = ('background', 'hud', 'fighters', 'overlays')
+
+    def __init__(self, canvas):
+        self.layers = {}
+        for name in self.LAYERS:
+            group = InstructionGroup()
+            canvas.add(group)
+            self.layers[name] = group
+
+        # Instruction creation statistics
+        self.instructions_created = 0       # Total since the scene was built
+        self.frame_instructions = 0         # Created since begin_frame()
+        self.last_frame_instructions = 0    # Created during the last full frame
+        self.frames = 0
+
+    def add(self, layer, instruction):
+        """Add a new instruction to a layer and return it."""
+        self.layers[layer].add(instruction)
+        self.instructions_created += 1
+        self.frame_instructions += 1
+        return instruction
+
+    def begin_frame(self):
+        """Start counting instructions created for a new frame."""
+        self.frame_instructions = 0
+
+    def end_frame(self):
+        """Finish the current frame and publish its instruction count."""
+        self.last_frame_instructions = self.frame_instructions
+        self.frames += 1
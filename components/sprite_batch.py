@@ -0,0 +1,180 @@
+"""
+Sprite Batch Component
+Batches every sprite that shares a texture page into a single Mesh so each
+page costs one draw call, no matter how many sprites are on screen
+"""
+
+from array import array
+
+from kivy.graphics import Color, Mesh
+from kivy.graphics.texture import Texture
+
+
+FLOATS_PER_VERTEX = 4      # x, y, u, v
+FLOATS_PER_SPRITE = 16     # 4 vertices per quad
+INDICES_PER_SPRITE = 6     # 2 triangles per quad
+
+
+class _PageBatch:
+    """Preallocated vertex storage and Mesh for one texture page.
+
+    texture may be any region of the page: tex_coords written to the
+    vertices are already in page space and the Mesh only binds its GL id.
+    """
+
+    def __init__(self, texture, capacity):
+        self.texture = texture
+        self.count = 0          # Sprites submitted this frame
+        self.used = 0           # Sprites submitted last frame (to clear leftovers)
+        self._allocate(capacity)
+        self.mesh = Mesh(vertices=self.vertices, indices=self.indices,
+                         mode='triangles', texture=texture)
+
+    def _allocate(self, capacity):
+        """Allocate vertex and index buffers for a number of sprites."""
+        self.capacity = capacity
+        self.vertices = array('f', bytes(4 * FLOATS_PER_SPRITE * capacity))
+        self.indices = array('H')
+        for i in range(capacity):
+            base = i * 4
+            self.indices.extend((base, base + 1, base + 2, base + 2, base + 3, base))
+
+    def grow(self):
+        """Double the capacity, keeping the sprites written so far."""
+        old = self.vertices
+        self._allocate(self.capacity * 2)
+        self.vertices[:len(old)] = old
+        self.mesh.indices = self.indices
+
+
+class SpriteBatch:
+    """Immediate-mode sprite batcher: begin(), draw() sprites, end().
+
+    Meshes are created once per texture page and added to a layer of a
+    RetainedScene, so pages draw in the order they were added. Pages are
+    identified by GL texture id, which atlas regions share with their page.
+    Add pages up front with add_pages() so the scene never grows while
+    drawing; a texture from an unknown page still gets one on first sight.
+    Each frame only rewrites the preallocated vertex arrays in place.
+    """
+
+    def __init__(self, scene, layer, capacity=16):
+        self.scene = scene
+        self.layer = layer
+        self.capacity = capacity
+        self._pages = {}  # GL texture id -> _PageBatch
+        self._page_list = []
+
+        # Statistics for the last frame
+        self.sprites = 0
+        self.draw_calls = 0
+
+        # Meshes are drawn untinted; colors come from the textures
+        scene.add(layer, Color(1, 1, 1, 1))
+
+    def add_pages(self, textures):
+        """Create the batches for the pages of textures (in order) ahead of drawing."""
+        for texture in textures:
+            self._get_page(texture)
+
+    def _get_page(self, texture):
+        """Get (or create on first sight) the batch for a texture's page."""
+        page = self._pages.get(texture.id)
+        if page is None:
+            page = _PageBatch(texture, self.capacity)
+            self._pages[texture.id] = page
+            self._page_list.append(page)
+            self.scene.add(self.layer, page.mesh)
+        return page
+
+    @property
+    def pages(self):
+        """Number of page batches (one Mesh each)."""
+        return len(self._page_list)
+
+    def begin(self):
+        """Start a new frame of sprites."""
+        for page in self._page_list:
+            page.count = 0
+
+    def draw(self, texture, x, y, width, height):
+        """Submit a textured quad; tex_coords (incl. mirroring) come from the texture."""
+        page = self._get_page(texture)
+        if page.count >= page.capacity:
+            page.grow()
+
+        u0, v0, u1, v1, u2, v2, u3, v3 = texture.tex_coords
+        right = x + width
+        top = y + height
+        v = page.vertices
+        i = page.count * FLOATS_PER_SPRITE
+
+        # Bottom left, bottom right, top right, top left
+        v[i] = x
+        v[i + 1] = y
+        v[i + 2] = u0
+        v[i + 3] = v0
+        v[i + 4] = right
+        v[i + 5] = y
+        v[i + 6] = u1
+        v[i + 7] = v1
+        v[i + 8] = right
+        v[i + 9] = top
+        v[i + 10] = u2
+        v[i + 11] = v2
+        v[i + 12] = x
+        v[i + 13] = top
+        v[i + 14] = u3
+        v[i + 15] = v3
+
+        page.count += 1
+
+    def end(self):
+        """Upload this frame's vertices; unused slots collapse to zero-area quads."""
+        sprites = 0
+        draw_calls = 0
+        for page in self._page_list:
+            if page.count < page.used:
+                start = page.count * FLOATS_PER_SPRITE
+                stop = page.used * FLOATS_PER_SPRITE
+                v = page.vertices
+                for i in range(start, stop):
+                    v[i] = 0.0
+            if page.count or page.used:
+                page.mesh.vertices = page.vertices
+            page.used = page.count
+            sprites += page.count
+            if page.count:
+                draw_calls += 1
+        self.sprites = sprites
+        self.draw_calls = draw_calls
+
+
+class ColorPalette:
+    """Small texture of solid color swatches for untextured (HUD) quads.
+
+    Each color gets a 4x4 texel block and its region samples only the inner
+    texels, so filtering never bleeds between swatches.
+    """
+
+    SWATCH = 4
+
+    def __init__(self, colors):
+        self.colors = [tuple(color) for color in colors]
+        width = self.SWATCH * len(self.colors)
+        self.texture = Texture.create(size=(width, self.SWATCH), colorfmt='rgba')
+
+        pixels = bytearray()
+        for _row in range(self.SWATCH):
+            for color in self.colors:
+                texel = bytes(int(max(0, min(1, c)) * 255) for c in color)
+                pixels.extend(texel * self.SWATCH)
+        self.texture.blit_buffer(bytes(pixels), colorfmt='rgba', bufferfmt='ubyte')
+
+        self.regions = {}
+        for index, color in enumerate(self.colors):
+            self.regions[color] = self.texture.get_region(index * self.SWATCH + 1, 1, 2, 2)
+
+    def get(self, color):
+        """Get the texture region for a palette color."""
+        return self.regions[tuple(color)]
@@ -9,10 +9,10 @@ from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.core.window import Window
-import os
 
 from config import COLORS
 from utils.settings import SettingsManager
+from utils.atlas import GameAtlas
 
 
 class TouchControls(Widget):
@@ -28,8 +28,8 @@ class TouchControls(Widget):
         # Track which attack buttons are pressed for combo
         self.attack_buttons_pressed = set()
         
-        # Base path for UI images
-        self.assets_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images', 'ui', 'fighting_screen')
+        # UI images come from the shared texture atlas when it is built
+        self.atlas = GameAtlas.get_instance()
         
         # Bind to window resize
         Window.bind(size=self.on_window_resize)
@@ -101,8 +101,8 @@ class TouchControls(Widget):
         left_size = self.get_button_size('left')
         left_opacity = self.get_button_opacity('left')
         left_btn = Button(
-            background_normal=os.path.join(self.assets_path, 'left move.png'),
-            background_down=os.path.join(self.assets_path, 'left move.png'),
+            background_normal=self.atlas.get_ui_source('left move.png'),
+            background_down=self.atlas.get_ui_source('left move.png'),
             size_hint=(None, None),
             size=left_size,
             pos=(left_pos['x'] * Window.width, left_pos['y'] * Window.height),
@@ -121,8 +121,8 @@ class TouchControls(Widget):
         right_size = self.get_button_size('right')
         right_opacity = self.get_button_opacity('right')
         right_btn = Button(
-            background_normal=os.path.join(self.assets_path, 'Right move.png'),
-            background_down=os.path.join(self.assets_path, 'Right move.png'),
+            background_normal=self.atlas.get_ui_source('Right move.png'),
+            background_down=self.atlas.get_ui_source('Right move.png'),
             size_hint=(None, None),
             size=right_size,
             pos=(right_pos['x'] * Window.width, right_pos['y'] * Window.height),
@@ -145,8 +145,8 @@ class TouchControls(Widget):
         atk1_size = self.get_button_size('atk1')
         atk1_opacity = self.get_button_opacity('atk1')
         atk1_btn = Button(
-            background_normal=os.path.join(self.assets_path, 'A1.png'),
-            background_down=os.path.join(self.assets_path, 'A1.png'),
+            background_normal=self.atlas.get_ui_source('A1.png'),
+            background_down=self.atlas.get_ui_source('A1.png'),
             size_hint=(None, None),
             size=atk1_size,
             pos=(atk1_pos['x'] * Window.width, atk1_pos['y'] * Window.height),
@@ -165,8 +165,8 @@ class TouchControls(Widget):
         atk2_size = self.get_button_size('atk2')
         atk2_opacity = self.get_button_opacity('atk2')
         atk2_btn = Button(
-            background_normal=os.path.join(self.assets_path, 'A2.png'),
-            background_down=os.path.join(self.assets_path, 'A2.png'),
+            background_normal=self.atlas.get_ui_source('A2.png'),
+            background_down=self.atlas.get_ui_source('A2.png'),
             size_hint=(None, None),
             size=atk2_size,
             pos=(atk2_pos['x'] * Window.width, atk2_pos['y'] * Window.height),
@@ -185,8 +185,8 @@ class TouchControls(Widget):
         jump_size = self.get_button_size('jump')
         jump_opacity = self.get_button_opacity('jump')
         jump_btn = Button(
-            background_normal=os.path.join(self.assets_path, 'Jump.png'),
-            background_down=os.path.join(self.assets_path, 'Jump.png'),
+            background_normal=self.atlas.get_ui_source('Jump.png'),
+            background_down=self.atlas.get_ui_source('Jump.png'),
             size_hint=(None, None),
             size=jump_size,
             pos=(jump_pos['x'] * Window.width, jump_pos['y'] * Window.height),
@@ -202,8 +202,8 @@ class TouchControls(Widget):
         dodge_size = self.get_button_size('dodge')
         dodge_opacity = self.get_button_opacity('dodge')
         dash_btn = Button(
-            background_normal=os.path.join(self.assets_path, 'Dash.png'),
-            background_down=os.path.join(self.assets_path, 'Dash.png'),
+            background_normal=self.atlas.get_ui_source('Dash.png'),
+            background_down=self.atlas.get_ui_source('Dash.png'),
             size_hint=(None, None),
             size=dodge_size,
             pos=(dodge_pos['x'] * Window.width, dodge_pos['y'] * Window.height),
@@ -1,18 +1,16 @@
 """
 Game Configuration and Constants
 All game settings, sprite configurations, and constants are defined here.
+Plain constants only: importing this module has no side effects and does not
+import Kivy, so headless tools and the simulation can use it directly.
 """
 
-from kivy.utils import platform
-from kivy.core.window import Window
-
 # =============================================================================
 # WINDOW SETTINGS
 # =============================================================================
 
-# Set window size for desktop testing only (mobile will use fullscreen automatically)
-if platform not in ('android', 'ios'):
-    Window.size = (1000, 600)
+# Desktop window size, applied by main.py (mobile uses fullscreen automatically)
+WINDOW_SIZE = (1000, 600)
 
 # =============================================================================
 # GAME SETTINGS
@@ -21,6 +19,13 @@ if platform not in ('android', 'ios'):
 # Frame rate
 FPS = 60
 
+# Fixed simulation tick rate (physics, AI and hit checks run exactly this often,
+# independent of render rate). Per-frame constants below are per tick.
+SIM_TICK_RATE = 60
+
+# Most simulation ticks run in one rendered frame before the backlog is dropped
+MAX_CATCHUP_STEPS = 5
+
 # Ground level (from bottom of screen)
 GROUND_Y = 110
 
@@ -136,34 +141,77 @@ SCREENS = {
 ASSET_PATHS = {
     'backgrounds': 'assets/images/backgrounds/',
     'characters': 'assets/images/characters/',
+    'sound_effects': 'assets/images/sound_effects/',
 }
 
 # Default background
 DEFAULT_BACKGROUND = 'FOREST.png'
 
+# Memory the shared asset cache may use for textures and sounds no longer in use
+# before evicting them (assets still in use are never evicted)
+ASSET_CACHE_BUDGET_MB = 128
+
 # =============================================================================
-# BOT DIFFICULTY SETTINGS (Future feature)
+# SOUND EFFECTS
 # =============================================================================
 
+# Sound effect cues: name -> (sample files in the sound effects folder, priority).
+# Cues with several samples play them in turn. When no voice is free, a cue
+# stops the oldest voice of the lowest priority not above its own.
+SFX_CUES = {
+    'footstep': ([f'Footsteps/Dirt/Dirt Run {i}.wav' for i in range(1, 6)], 1),
+    'jump': (['Footsteps/Dirt/Dirt Jump.wav'], 2),
+    'land': (['Footsteps/Dirt/Dirt Land.wav'], 2),
+    'sword1': (['sword_attacks_hits_and_blocks/Sword Attack 1.wav'], 3),
+    'sword2': (['sword_attacks_hits_and_blocks/Sword Attack 2.wav'], 3),
+    'sword3': (['sword_attacks_hits_and_blocks/Sword Attack 3.wav'], 3),
+}
+
+# Voices created per sample (how many copies of one sample can overlap)
+SFX_VOICES_PER_SAMPLE = 2
+
+# Most sound effects playing at once (SDL_mixer mixes 8 channels; music needs one)
+SFX_MAX_VOICES = 6
+
+# =============================================================================
+# BOT DIFFICULTY SETTINGS
+# =============================================================================
+
+# Default BotAI parameters per difficulty (decision_interval is a frame range).
+# A calibrated table written by tools/calibrate_bot.py to
+# assets/data/bot_difficulty.json overrides these at startup.
 BOT_DIFFICULTY = {
     'easy': {
-        'reaction_time': 30,  # frames before reacting
-        'attack_chance': 0.3,
-        'block_chance': 0.1,
+        'reaction_time': 20,  # frames before reacting
+        'attack_chance': 0.4,
+        'dodge_chance': 0.2,
+        'aggression': 0.4,
+        'decision_interval': (15, 30),
     },
     'medium': {
-        'reaction_time': 15,
-        'attack_chance': 0.5,
-        'block_chance': 0.3,
+        'reaction_time': 10,
+        'attack_chance': 0.6,
+        'dodge_chance': 0.4,
+        'aggression': 0.6,
+        'decision_interval': (8, 18),
     },
+    # Faster reactions and higher aggression; less spammable dodging
     'hard': {
-        'reaction_time': 5,
-        'attack_chance': 0.7,
-        'block_chance': 0.5,
+        'reaction_time': 3,
+        'attack_chance': 0.85,
+        'dodge_chance': 0.35,
+        'aggression': 0.9,
+        'decision_interval': (3, 10),
     },
+    # Very fast, highly aggressive, but don't dodge excessively — prefer punishes
     'nightmare': {
-        'reaction_time': 2,
-        'attack_chance': 0.85,
-        'block_chance': 0.7,
+        'reaction_time': 1,  # Nearly instant reactions
+        'attack_chance': 0.98,
+        'dodge_chance': 0.25,
+        'aggression': 0.995,
+        'decision_interval': (1, 3),  # Near-instant decisions
+        'policy_table': True,  # Use assets/data/bot_policy.bin when it has been trained
+        'search_budget_ms': 2.0,  # Lookahead search time per frame (replaces the rules above)
+        'decision_worker': None,  # 'thread' or 'process' runs the search off the game loop
     },
 }
@@ -13,23 +13,48 @@ Project Structure:
 - assets/          : Images, sounds, and other assets
 """
 
+import importlib
+import time
+from collections import deque
+
+# Launch reference for the time-to-first-frame metric (before Kivy starts up)
+LAUNCH_TIME = time.perf_counter()
+
 from kivy.app import App
 from kivy.uix.floatlayout import FloatLayout
 from kivy.core.window import Window
+from kivy.clock import Clock
+from kivy.utils import platform
+
+from config import SCREENS, WINDOW_SIZE
+
+# Set window size for desktop testing only (mobile will use fullscreen automatically),
+# before any screen is built
+if platform not in ('android', 'ios'):
+    Window.size = WINDOW_SIZE
+
+
+# Screen name -> (module, class); each screen is imported and built on first use
+SCREEN_REGISTRY = {
+    SCREENS['START']: ('screens.start_screen', 'StartScreen'),
+    SCREENS['GAME']: ('screens.game_screen', 'GameScreen'),
+    SCREENS['PAUSE']: ('screens.pause_screen', 'PauseScreen'),
+    SCREENS['CHARACTER_SELECT']: ('screens.character_select', 'CharacterSelectScreen'),
+    SCREENS['DIFFICULTY_SELECT']: ('screens.difficulty_select', 'DifficultySelectScreen'),
+    SCREENS['SETTINGS']: ('screens.settings_screen', 'SettingsScreen'),
+    SCREENS['CONTROL_LAYOUT']: ('screens.control_layout_screen', 'ControlLayoutScreen'),
+}
 
-# Import config first to set up window
-import config
+# Screens likely to be shown next, prewarmed while the user is on the key screen
+PREWARM_NEXT = {
+    SCREENS['START']: (SCREENS['DIFFICULTY_SELECT'], SCREENS['GAME']),
+    SCREENS['DIFFICULTY_SELECT']: (SCREENS['GAME'],),
+    SCREENS['GAME']: (SCREENS['PAUSE'],),
+    SCREENS['SETTINGS']: (SCREENS['CONTROL_LAYOUT'],),
+}
 
-from screens import (
-    StartScreen,
-    GameScreen, 
-    PauseScreen,
-    CharacterSelectScreen,
-    DifficultySelectScreen,
-    SettingsScreen,
-    ControlLayoutScreen,
-)
-from config import SCREENS
+# Seconds of prewarm work per frame (at least one step always runs)
+PREWARM_BUDGET = 0.004
 
 
 class FightingGameApp(App):
@@ -40,14 +65,20 @@ class FightingGameApp(App):
         # Create root layout
         self.root_layout = FloatLayout()
         
-        # Dictionary to store screen instances
+        # Screen instances built so far (see get_screen)
         self.screens = {}
         
-        # Create all screens
-        self._create_screens()
+        # Background screen construction, one small step per frame
+        self.prewarm_queue = deque()
+        self.prewarm_event = None
         
-        # Start with the start screen
+        # Seconds from launch until the first frame was drawn
+        self.time_to_first_frame = None
+        Window.bind(on_draw=self._on_first_frame)
+        
+        # Start with the start screen (the only one built before the first frame)
         self.current_screen = None
+        self.current_screen_name = None
         self.switch_screen(SCREENS['START'])
         
         # Bind to window resize
@@ -55,30 +86,80 @@ class FightingGameApp(App):
         
         return self.root_layout
     
-    def _create_screens(self):
-        """Create all screen instances."""
-        self.screens[SCREENS['START']] = StartScreen(self)
-        self.screens[SCREENS['GAME']] = GameScreen(self)
-        self.screens[SCREENS['PAUSE']] = PauseScreen(self)
-        self.screens[SCREENS['CHARACTER_SELECT']] = CharacterSelectScreen(self)
-        self.screens[SCREENS['DIFFICULTY_SELECT']] = DifficultySelectScreen(self)
-        self.screens[SCREENS['SETTINGS']] = SettingsScreen(self)
-        self.screens[SCREENS['CONTROL_LAYOUT']] = ControlLayoutScreen(self)
+    def _get_screen_class(self, screen_name):
+        """Import a registered screen's module and return its class."""
+        module_name, class_name = SCREEN_REGISTRY[screen_name]
+        return getattr(importlib.import_module(module_name), class_name)
+    
+    def get_screen(self, screen_name):
+        """Get a screen instance, building it on first use (None if unknown)."""
+        screen = self.screens.get(screen_name)
+        if screen is None and screen_name in SCREEN_REGISTRY:
+            screen = self._get_screen_class(screen_name)(self)
+            self.screens[screen_name] = screen
+        return screen
     
     def switch_screen(self, screen_name):
         """Switch to a different screen."""
+        # Get new screen
+        screen = self.get_screen(screen_name)
+        if screen is None:
+            print(f"Warning: Screen '{screen_name}' not found")
+            return
+        
         # Leave current screen
         if self.current_screen:
             self.current_screen.on_leave()
             self.root_layout.remove_widget(self.current_screen)
         
-        # Get new screen
-        if screen_name in self.screens:
-            self.current_screen = self.screens[screen_name]
-            self.root_layout.add_widget(self.current_screen)
-            self.current_screen.on_enter()
-        else:
-            print(f"Warning: Screen '{screen_name}' not found")
+        self.current_screen = screen
+        self.current_screen_name = screen_name
+        self.root_layout.add_widget(self.current_screen)
+        self.current_screen.on_enter()
+        
+        # Prewarming starts once the first frame is up
+        if self.time_to_first_frame is not None:
+            self._schedule_prewarm(screen_name)
+    
+    def _on_first_frame(self, *args):
+        """Record the time to first frame, then start prewarming."""
+        Window.unbind(on_draw=self._on_first_frame)
+        self.time_to_first_frame = time.perf_counter() - LAUNCH_TIME
+        print(f"Startup: first frame drawn {self.time_to_first_frame * 1000:.0f} ms after launch")
+        self._schedule_prewarm(self.current_screen_name)
+    
+    def _schedule_prewarm(self, screen_name):
+        """Replace queued prewarm work with the screens likely to follow screen_name."""
+        self.prewarm_queue.clear()
+        for next_name in PREWARM_NEXT.get(screen_name, ()):
+            if next_name not in self.screens:
+                self.prewarm_queue.append(self._prewarm_screen(next_name))
+        if self.prewarm_queue and self.prewarm_event is None:
+            self.prewarm_event = Clock.schedule_interval(self._run_prewarm, 0)
+    
+    def _prewarm_screen(self, screen_name):
+        """Import, warm and build a screen, yielding between steps."""
+        screen_class = self._get_screen_class(screen_name)
+        yield
+        for _ in screen_class.prewarm():
+            yield
+        self.get_screen(screen_name)
+    
+    def _run_prewarm(self, dt):
+        """Run queued prewarm steps until this frame's budget is spent."""
+        deadline = time.perf_counter() + PREWARM_BUDGET
+        while self.prewarm_queue:
+            try:
+                next(self.prewarm_queue[0])
+            except StopIteration:
+                self.prewarm_queue.popleft()
+            except Exception as e:
+                print(f"Warning: Could not prewarm screen: {e}")
+                self.prewarm_queue.popleft()
+            if time.perf_counter() >= deadline:
+                return
+        self.prewarm_event = None
+        return False
     
     def on_window_resize(self, window, size):
         """Handle window resize events."""
@@ -93,6 +174,17 @@ class FightingGameApp(App):
     def on_resume(self):
         """Called when app resumes (mobile)."""
         pass
+    
+    def on_stop(self):
+        """Release the screens' shared assets and report how much asset loading the cache saved."""
+        from utils.asset_cache import AssetCache
+        
+        for screen in self.screens.values():
+            screen.teardown()
+        
+        stats = AssetCache.get_instance().stats()
+        print(f"Assets: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions, "
+              f"{stats['bytes'] / (1024 * 1024):.1f} MB held in {stats['entries']} entries")
 
 
 if __name__ == '__main__':
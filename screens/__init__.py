@@ -1,16 +1,22 @@
 """
 Screens Package
-Contains all game screens
+Contains all game screens. Screen classes are imported on first access,
+so the app only loads the modules of screens it actually builds.
 """
 
-from screens.base_screen import BaseScreen
-from screens.start_screen import StartScreen
-from screens.game_screen import GameScreen
-from screens.pause_screen import PauseScreen
-from screens.character_select import CharacterSelectScreen
-from screens.difficulty_select import DifficultySelectScreen
-from screens.settings_screen import SettingsScreen
-from screens.control_layout_screen import ControlLayoutScreen
+import importlib
+
+# Exported name -> module defining it
+_EXPORTS = {
+    'BaseScreen': 'screens.base_screen',
+    'StartScreen': 'screens.start_screen',
+    'GameScreen': 'screens.game_screen',
+    'PauseScreen': 'screens.pause_screen',
+    'CharacterSelectScreen': 'screens.character_select',
+    'DifficultySelectScreen': 'screens.difficulty_select',
+    'SettingsScreen': 'screens.settings_screen',
+    'ControlLayoutScreen': 'screens.control_layout_screen',
+}
 
 __all__ = [
     'BaseScreen',
@@ -22,3 +28,12 @@ __all__ = [
     'SettingsScreen',
     'ControlLayoutScreen',
 ]
+
+
+def __getattr__(name):
+    """Import an exported screen the first time it is used."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'screens' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -10,6 +10,11 @@ from kivy.core.window import Window
 class BaseScreen(FloatLayout):
     """Base class for all game screens."""
     
+    @classmethod
+    def prewarm(cls):
+        """Fill shared caches before the screen is built, yielding between small steps."""
+        return iter(())
+    
     def __init__(self, app, **kwargs):
         super().__init__(**kwargs)
         self.app = app
@@ -30,6 +35,10 @@ class BaseScreen(FloatLayout):
         """Called when leaving this screen."""
         pass
     
+    def teardown(self):
+        """Release shared assets the screen holds (called when the app stops)."""
+        pass
+    
     def update(self, dt):
         """Update loop - override in subclasses if needed."""
         pass
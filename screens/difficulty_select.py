@@ -4,10 +4,10 @@ from kivy.uix.button import Button
 from kivy.uix.floatlayout import FloatLayout
 from kivy.graphics import Color, Rectangle
 from kivy.core.window import Window
-from kivy.core.image import Image as CoreImage
 from kivy.clock import Clock
 
 from screens.base_screen import BaseScreen
+from components.background_compositor import BackgroundCompositor
 from config import SCREENS
 
 
@@ -69,44 +69,48 @@ class DifficultySelectScreen(BaseScreen):
         Window.bind(on_resize=self._resize_ui)
 
     def _load_background(self):
-        """Load CloudyForest parallax layers."""
+        """Set up the CloudyForest background as one flattened texture."""
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-        self.bg_layers = []
-
-        for i in range(1, 6):
-            bg_path = os.path.join(base_path, f'assets/images/backgrounds/CloudyForest/bg-2_LAYER-{i}.png')
-            try:
-                tex = CoreImage(bg_path).texture
-                self.bg_layers.append(tex)
-            except Exception as e:
-                print(f"Error loading background layer {i}: {e}")
-
-        self._build_parallax_canvas()
-
-    def _build_parallax_canvas(self):
-        """Create rectangles for each layer stacked."""
-        self.canvas.before.clear()
+        # Layer 5 is the opaque sky, so stack from layer 5 (back) to layer 1 (front)
+        self.bg_layer_paths = [
+            os.path.join(base_path, f'assets/images/backgrounds/CloudyForest/bg-2_LAYER-{i}.png')
+            for i in range(5, 0, -1)
+        ]
+        self.bg_layer_paths = [p for p in self.bg_layer_paths if os.path.exists(p)]
+        if not self.bg_layer_paths:
+            print("Error loading background layers: CloudyForest not found")
+
+        # The layers never move, so they are composited into a single opaque
+        # quad per resolution (re-composited shortly after resizes settle)
+        self.compositor = BackgroundCompositor.get_instance()
+        self._recomposite_trigger = Clock.create_trigger(self._recomposite, 0.2)
         with self.canvas.before:
-            Color(1, 1, 1, 1)
-            
-            # Draw in reverse order so layer 5 (foreground) is on top
-            if self.bg_layers:
-                for i in range(len(self.bg_layers) - 1, -1, -1):
-                    tex = self.bg_layers[i]
-                    Rectangle(
-                        texture=tex,
-                        pos=(0, 0),
-                        size=self.size
-                    )
-            else:
-                # Fallback to solid color if no layers loaded
-                Color(0.1, 0.1, 0.15, 1)
-                Rectangle(pos=(0, 0), size=self.size)
+            # Solid color until the layers are loaded (or if there are none)
+            self.bg_color = Color(0.1, 0.1, 0.15, 1)
+            self.bg_rect = Rectangle(pos=(0, 0), size=self.size)
+
+    def _recomposite(self, *args):
+        """Swap in the flattened background for the current window size."""
+        if not self.bg_layer_paths:
+            return
+        texture = self.compositor.get_cached(self.bg_layer_paths, Window.size)
+        if texture is None:
+            # Decoded in the background
+            self.compositor.load_async(self.bg_layer_paths, Window.size, self._on_background_loaded)
+        else:
+            self._on_background_loaded(texture)
+
+    def _on_background_loaded(self, texture):
+        """Show the flattened background."""
+        if texture is not None:
+            self.bg_color.rgba = (1, 1, 1, 1)
+            self.bg_rect.texture = texture
 
     def _update_bg(self, *args):
         """Update background on resize."""
-        self._build_parallax_canvas()
+        self.bg_rect.size = self.size
+        self._recomposite_trigger()
 
     def _resize_ui(self, *args):
         """Rescale UI dynamically on window resize."""
@@ -165,10 +169,10 @@ class DifficultySelectScreen(BaseScreen):
             if hasattr(start_screen, 'fade_out_music'):
                 start_screen.fade_out_music(duration=0.5)
         
-        if hasattr(self.app, 'screens') and SCREENS['GAME'] in self.app.screens:
-            game = self.app.screens[SCREENS['GAME']]
-            game.set_difficulty(difficulty)
-            game.reset_game()
+        # Built now unless it was prewarmed while this screen was shown
+        game = self.app.get_screen(SCREENS['GAME'])
+        game.set_difficulty(difficulty)
+        game.reset_game()
 
         self.app.selected_difficulty = difficulty
         self.app.switch_screen(SCREENS['GAME'])
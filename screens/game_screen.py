@@ -6,12 +6,10 @@ The main fighting gameplay screen
 import os
 from kivy.uix.widget import Widget
 from kivy.uix.button import Button
-from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 from kivy.graphics import Rectangle, Color, RoundedRectangle
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.core.image import Image as CoreImage
 from kivy.core.audio import SoundLoader
 from kivy.utils import platform
 
@@ -20,7 +18,21 @@ from components.fighter import Fighter
 from components.touch_controls import TouchControls
 from components.health_bar import HealthBar
 from components.bot_ai import BotAI
-from config import SCREENS, GROUND_Y, FPS
+from components.match import Match
+from components.scene import RetainedScene
+from components.sprite_batch import SpriteBatch, ColorPalette
+from components.background_compositor import BackgroundCompositor
+from utils.text_cache import TextTextureCache
+from utils.atlas import GameAtlas
+from utils.sfx_mixer import SfxMixer
+from config import SCREENS, GROUND_Y, MAX_CATCHUP_STEPS
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKGROUND_PATH = os.path.join(BASE_PATH, 'assets/images/backgrounds/FOREST.png')
+
+# Match timer digits, rasterized up front
+TIMER_TEXTS = [str(i) for i in range(41)]
 
 
 class GameWidget(Widget):
@@ -47,27 +59,30 @@ class GameWidget(Widget):
         self.health_bar_1 = HealthBar(is_flipped=False)
         self.health_bar_2 = HealthBar(is_flipped=True)
         
-        # Game over state
-        self.game_over = False
-        self.game_over_timer = 0
-        self.slow_motion_factor = 1.0
-        self.winner = None  # 'player' or 'bot'
+        # Fixed-step match simulation (countdown, physics, AI, hits, timer, game over)
+        self.match = Match(self.fighter_1, self.fighter_2, self.bot_ai, seed=self.bot_ai.seed)
+        self._accumulator = 0.0
+        self.ticks_dropped = 0  # Ticks skipped when catch-up hit MAX_CATCHUP_STEPS
         
-        # Match timer (40 seconds)
-        self.match_time = 40.0
-        
-        # Countdown state (3, 2, 1, FIGHT!)
-        self.countdown_active = True
-        self.countdown_time = 1.9  # Total countdown duration
-        self.countdown_text = "3"
+        # Idle-frame suppression: skip drawing when nothing visible changed
+        self._last_fingerprint = None
+        self.frames_drawn = 0
+        self.frames_skipped = 0
         
         # Load background
         self._load_background()
         
-        # Keyboard input (for desktop testing only - not on mobile)
+        # Rasterize the countdown texts once up front
+        self.text_cache = TextTextureCache.get_instance()
+        self.text_cache.prewarm(["3", "2", "1"], 120, bold=True)
+        self.text_cache.prewarm(["FIGHT!"], 100, bold=True)
+        
+        # Build the retained scene graph (background, HUD, fighters, overlays)
+        self._build_scene()
+        
+        # Keyboard input (for desktop testing only - not on mobile), requested on enter
         self._keyboard = None
         self.keys_pressed = set()
-        self._setup_keyboard()
         
         # Bind to window size
         Window.bind(size=self.on_window_resize)
@@ -101,22 +116,54 @@ class GameWidget(Widget):
         return min(width_scale, height_scale)
     
     def _load_background(self):
-        """Load background texture."""
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        bg_path = os.path.join(base_path, 'assets/images/backgrounds/FOREST.png')
-        
-        try:
-            self.bg_texture = CoreImage(bg_path).texture
-        except:
-            self.bg_texture = None
-            print(f"Warning: Could not load background from {bg_path}")
+        """Load the background as an opaque texture flattened at window resolution.
+        
+        Unless it is already in memory it is decoded in the background; the
+        plain fallback color shows until it arrives.
+        """
+        self.bg_path = BACKGROUND_PATH
+        self.compositor = BackgroundCompositor.get_instance()
+        size = (self.screen_width, self.screen_height)
+        
+        # Re-flattened only once resizes settle; meanwhile the old texture is stretched
+        self._refit_trigger = Clock.create_trigger(self._refit_background, 0.2)
+        
+        self.bg_texture = None
+        if os.path.exists(self.bg_path):
+            self.bg_texture = self.compositor.get_cached([self.bg_path], size)
+            if self.bg_texture is None:
+                self.compositor.load_async([self.bg_path], size, self._on_background_loaded)
+        else:
+            print(f"Warning: Could not load background from {self.bg_path}")
+    
+    def _refit_background(self, *args):
+        """Swap in the background flattened at the current window size."""
+        size = (self.screen_width, self.screen_height)
+        texture = self.compositor.get_cached([self.bg_path], size)
+        if texture is None:
+            self.compositor.load_async([self.bg_path], size, self._on_background_loaded)
+        else:
+            self._on_background_loaded(texture)
+    
+    def _on_background_loaded(self, texture):
+        """Swap the fallback color (or a stretched texture) for the loaded background."""
+        if texture is None:
+            return
+        self.bg_texture = texture
+        self.bg_color.rgba = (1, 1, 1, 1)
+        self.bg_rect.texture = texture
+        # Redraw even if nothing else changed
+        self._last_fingerprint = None
+        # The window may have been resized while it was loading
+        if tuple(texture.size) != (self.screen_width, self.screen_height):
+            self._refit_trigger()
     
     def on_window_resize(self, window, size):
         """Handle window resize."""
         self.screen_width = size[0]
         self.screen_height = size[1]
         self.size = size
-        # Health bars auto-update their positions in draw()
+        # Health bars are re-laid out by draw_game() when the size changes
     
     def _on_keyboard_closed(self):
         if self._keyboard:
@@ -150,59 +197,69 @@ class GameWidget(Widget):
         
         return True
     
+    # Match state lives in the simulation; expose it for the screen and controls
+    @property
+    def game_over(self):
+        return self.match.game_over
+    
+    @property
+    def game_over_timer(self):
+        return self.match.game_over_timer
+    
+    @property
+    def winner(self):
+        return self.match.winner
+    
+    @property
+    def match_time(self):
+        return self.match.match_time
+    
+    @property
+    def countdown_active(self):
+        return self.match.countdown_active
+    
+    @property
+    def countdown_text(self):
+        return self.match.countdown_text
+    
     def update(self, dt):
-        """Main game loop."""
+        """Main game loop: run whole simulation ticks for the elapsed time, then draw."""
         self.screen_width = Window.width
         self.screen_height = Window.height
         
-        # Handle countdown
-        if self.countdown_active:
-            self.countdown_time -= dt
-            
-            # Determine countdown text based on remaining time
-            # 1.9 -> 1.425: "3", 1.425 -> 0.95: "2", 0.95 -> 0.475: "1", 0.475 -> 0: "FIGHT!"
-            if self.countdown_time > 1.425:
-                self.countdown_text = "3"
-            elif self.countdown_time > 0.95:
-                self.countdown_text = "2"
-            elif self.countdown_time > 0.475:
-                self.countdown_text = "1"
-            elif self.countdown_time > 0:
-                self.countdown_text = "FIGHT!"
-            else:
-                self.countdown_active = False
-                self.countdown_text = ""
-            
-            # During countdown, just draw the game (fighters idle)
-            self.fighter_1.update_animation()
-            self.fighter_2.update_animation()
-            self.draw_game()
-            return
+        tick_dt = self.match.tick_dt
+        self._accumulator += dt
         
-        # Apply slow motion to dt
-        effective_dt = dt * self.slow_motion_factor
+        # The bot's search budget is per rendered frame, shared by its ticks
+        ticks = min(int(self._accumulator / tick_dt), MAX_CATCHUP_STEPS)
+        if ticks:
+            self.match.begin_frame(ticks)
         
-        # If game is over, only update slow motion timer and animations
-        if self.game_over:
-            self.game_over_timer += dt
-            
-            # Gradually slow down
-            if self.slow_motion_factor > 0.2:
-                self.slow_motion_factor -= dt * 0.8  # Slow down over ~1 second
-                self.slow_motion_factor = max(0.2, self.slow_motion_factor)
-            
-            # Continue applying gravity so fighters land on the ground
-            self.fighter_1.move(self.screen_width, self.screen_height, self.fighter_2)
-            self.fighter_2.move(self.screen_width, self.screen_height, self.fighter_1)
-            
-            # Update animations in slow motion
-            self.fighter_1.update_animation(self.slow_motion_factor)
-            self.fighter_2.update_animation(self.slow_motion_factor)
-            
-            # Redraw
-            self.draw_game()
-            return
+        steps = 0
+        while self._accumulator >= tick_dt and steps < MAX_CATCHUP_STEPS:
+            self._tick()
+            self._accumulator -= tick_dt
+            steps += 1
+        
+        # Too far behind (e.g. app was suspended): drop the backlog instead of spiralling
+        if self._accumulator >= tick_dt:
+            self.ticks_dropped += int(self._accumulator / tick_dt)
+            self._accumulator %= tick_dt
         
+        self._present(dt)
+    
+    def _tick(self):
+        """Advance the match by one fixed step."""
+        if self.match.in_play:
+            self._apply_keyboard_input()
+        
+        self.match.step(self.screen_width, self.screen_height)
+        
+        if self.match.game_over:
+            self.keys_pressed.clear()
+    
+    def _apply_keyboard_input(self):
+        """Apply held keys to Player 1 for this tick."""
         # Handle keyboard movement for Player 1
         if 'a' in self.keys_pressed:
             self.fighter_1.move_left = True
@@ -217,155 +274,152 @@ class GameWidget(Widget):
             self.fighter_1.do_attack(1)
         elif 'k' in self.keys_pressed:
             self.fighter_1.do_attack(2)
-        
-        # Update bot AI (controls fighter 2)
-        self.bot_ai.update(self.fighter_1, self.screen_width)
-        
-        # Update fighters
-        self.fighter_1.move(self.screen_width, self.screen_height, self.fighter_2)
-        self.fighter_2.move(self.screen_width, self.screen_height, self.fighter_1)
-        
-        # Update animations
-        self.fighter_1.update_animation()
-        self.fighter_2.update_animation()
-        
-        # Check attacks
-        self.fighter_1.check_attack_hit(self.fighter_2)
-        self.fighter_2.check_attack_hit(self.fighter_1)
-        
-        # Update match timer
-        self.match_time -= dt
-        if self.match_time <= 0:
-            self.match_time = 0
-            # Determine winner by health
-            if self.fighter_1.health > self.fighter_2.health:
-                self._trigger_game_over('player')
-            elif self.fighter_2.health > self.fighter_1.health:
-                self._trigger_game_over('bot')
-            else:
-                # Tie - bot wins by default
-                self._trigger_game_over('bot')
-        
-        # Check for game over
-        if not self.fighter_1.alive and not self.game_over:
-            self._trigger_game_over('bot')
-        elif not self.fighter_2.alive and not self.game_over:
-            self._trigger_game_over('player')
-        
-        # Redraw
-        self.draw_game()
     
-    def draw_game(self):
-        """Draw the game."""
-        self.canvas.clear()
+    def _build_scene(self):
+        """Build the retained scene graph once; frames only update it in place."""
+        self.scene = RetainedScene(self.canvas)
         
-        with self.canvas:
-            # Draw background
+        # Background layer
+        if self.bg_texture:
+            self.bg_color = self.scene.add('background', Color(1, 1, 1, 1))
+            self.bg_rect = self.scene.add('background', Rectangle(
+                texture=self.bg_texture, pos=(0, 0),
+                size=(self.screen_width, self.screen_height)))
+        else:
+            self.bg_color = self.scene.add('background', Color(0.2, 0.4, 0.3, 1))
+            self.bg_rect = self.scene.add('background', Rectangle(
+                pos=(0, 0), size=(self.screen_width, self.screen_height)))
+        self._bg_size = (self.screen_width, self.screen_height)
+        
+        # HUD layer: solid color quads batched through one palette texture
+        self.palette = ColorPalette(HealthBar.COLORS)
+        self.hud_batch = SpriteBatch(self.scene, 'hud')
+        self.hud_batch.add_pages([self.palette.texture])
+        self.health_bar_1.build(self.palette)
+        self.health_bar_2.build(self.palette)
+        
+        # Fighters layer: one Mesh per atlas page, all created now so the
+        # scene never grows mid-match (fighter 2's pages come last, on top)
+        self.fighter_batch = SpriteBatch(self.scene, 'fighters')
+        self._add_fighter_pages()
+        
+        # Overlays layer (countdown)
+        self.countdown_bg_color = self.scene.add('overlays', Color(0, 0, 0, 0))
+        self.countdown_bg_rect = self.scene.add('overlays', RoundedRectangle(
+            pos=(0, 0), size=(0, 0), radius=[15]))
+        self.countdown_color = self.scene.add('overlays', Color(1, 1, 1, 0))
+        self.countdown_rect = self.scene.add('overlays', Rectangle(pos=(0, 0), size=(0, 0)))
+        self._countdown_shown_text = None
+    
+    def _add_fighter_pages(self):
+        """Create the fighter batch's page meshes for every frame loaded so far."""
+        for fighter in (self.fighter_1, self.fighter_2):
+            for frames in fighter.animations.values():
+                self.fighter_batch.add_pages(frames)
+    
+    def _state_fingerprint(self):
+        """Everything that affects what is drawn this frame."""
+        f1 = self.fighter_1
+        f2 = self.fighter_2
+        return (
+            self.screen_width, self.screen_height,
+            f1.x, f1.y, f1.current_action, f1.frame_index, f1.flip, f1.health, f1.current_texture,
+            f2.x, f2.y, f2.current_action, f2.frame_index, f2.flip, f2.health, f2.current_texture,
+            int(self.match_time), self.countdown_text,
+        )
+    
+    def _present(self, dt):
+        """Draw the frame unless the visible state is unchanged since the last draw."""
+        fingerprint = self._state_fingerprint()
+        hud_animating = self.health_bar_1.animating or self.health_bar_2.animating
+        if fingerprint == self._last_fingerprint and not hud_animating:
+            self.frames_skipped += 1
+            return
+        self._last_fingerprint = fingerprint
+        self.frames_drawn += 1
+        self.draw_game(dt)
+    
+    def draw_game(self, dt=0.0):
+        """Update the retained scene for the current frame."""
+        self.scene.begin_frame()
+        
+        # Background and HUD layout only change with the window size
+        size = (self.screen_width, self.screen_height)
+        if size != self._bg_size:
+            self.bg_rect.size = size
             if self.bg_texture:
-                Rectangle(texture=self.bg_texture, pos=(0, 0), 
-                         size=(self.screen_width, self.screen_height))
-            else:
-                Color(0.2, 0.4, 0.3, 1)
-                Rectangle(pos=(0, 0), size=(self.screen_width, self.screen_height))
-        
-        # Draw health bars
-        self.health_bar_1.draw(self.canvas, self.fighter_1.health)
-        self.health_bar_2.draw(self.canvas, self.fighter_2.health)
-        
-        # Draw fighters
+                self._refit_trigger()
+            self._bg_size = size
+            self.health_bar_1.set_viewport(*size)
+            self.health_bar_2.set_viewport(*size)
+        
+        # Health bars (quads only rebuilt and resubmitted when something changed)
+        hud_changed = self.health_bar_1.update(self.fighter_1.health, dt)
+        hud_changed = self.health_bar_2.update(self.fighter_2.health, dt) or hud_changed
+        if hud_changed:
+            self.hud_batch.begin()
+            self.health_bar_1.draw(self.hud_batch)
+            self.health_bar_2.draw(self.hud_batch)
+            self.hud_batch.end()
+        
+        # Fighters (sprite sheets still loading get their pages before the fight starts)
+        if self.countdown_active:
+            self._add_fighter_pages()
+        self.fighter_batch.begin()
         self._draw_fighter(self.fighter_1)
         self._draw_fighter(self.fighter_2)
+        self.fighter_batch.end()
         
-        # Draw countdown text if active
-        if self.countdown_active and self.countdown_text:
-            self._draw_countdown()
+        # Countdown text
+        self._draw_countdown()
+        
+        self.scene.end_frame()
     
     def _draw_countdown(self):
-        """Draw the countdown text in the center of the screen."""
-        from kivy.core.text import Label as CoreLabel
-        
-        # Create label with large font
-        font_size = 120 if self.countdown_text != "FIGHT!" else 100
-        label = CoreLabel(
-            text=self.countdown_text,
-            font_size=font_size,
-            bold=True
-        )
-        label.refresh()
-        
-        # Get texture from label
-        texture = label.texture
-        
-        # Calculate center position
-        center_x = self.screen_width // 2 - texture.width // 2
-        center_y = self.screen_height // 2 - texture.height // 2
+        """Show, update or hide the countdown text in the center of the screen."""
+        if not (self.countdown_active and self.countdown_text):
+            if self._countdown_shown_text is not None:
+                self.countdown_bg_color.a = 0
+                self.countdown_color.a = 0
+                self._countdown_shown_text = None
+            return
         
-        with self.canvas:
-            # Draw semi-transparent background for better visibility
-            Color(0, 0, 0, 0.5)
-            RoundedRectangle(
-                pos=(center_x - 20, center_y - 10),
-                size=(texture.width + 40, texture.height + 20),
-                radius=[15]
-            )
+        # Only swap textures when the text actually changes
+        if self.countdown_text != self._countdown_shown_text:
+            # Cached large-font texture (rasterized once per text)
+            font_size = 120 if self.countdown_text != "FIGHT!" else 100
+            self.countdown_rect.texture = self.text_cache.get(self.countdown_text, font_size, bold=True)
+            self._countdown_shown_text = self.countdown_text
             
             # Draw text with color based on countdown
             if self.countdown_text == "FIGHT!":
-                Color(1, 0.3, 0.3, 1)  # Red for FIGHT
+                self.countdown_color.rgba = (1, 0.3, 0.3, 1)  # Red for FIGHT
             else:
-                Color(1, 1, 1, 1)  # White for numbers
+                self.countdown_color.rgba = (1, 1, 1, 1)  # White for numbers
             
-            Rectangle(texture=texture, pos=(center_x, center_y), size=texture.size)
+            # Semi-transparent background for better visibility
+            self.countdown_bg_color.rgba = (0, 0, 0, 0.5)
+        
+        texture = self.countdown_rect.texture
+        
+        # Calculate center position
+        center_x = self.screen_width // 2 - texture.width // 2
+        center_y = self.screen_height // 2 - texture.height // 2
+        
+        self.countdown_bg_rect.pos = (center_x - 20, center_y - 10)
+        self.countdown_bg_rect.size = (texture.width + 40, texture.height + 20)
+        self.countdown_rect.pos = (center_x, center_y)
+        self.countdown_rect.size = texture.size
     
     def _draw_fighter(self, fighter):
-        """Draw a fighter."""
-        if fighter.current_texture is None:
+        """Submit a fighter's current frame to the sprite batch."""
+        # Pre-mirrored frame for the facing direction (no per-frame flipping)
+        texture = fighter.get_frame_texture()
+        if texture is None:
             return
         
         draw_x, draw_y = fighter.get_draw_pos()
-        
-        with self.canvas:
-            Color(1, 1, 1, 1)
-            
-            texture = fighter.current_texture
-            
-            # Handle flip
-            if fighter.flip:
-                texture = texture.get_region(0, 0, texture.width, texture.height)
-                texture.flip_horizontal()
-            
-            Rectangle(
-                texture=texture,
-                pos=(draw_x, draw_y),
-                size=(fighter.scale_width, fighter.scale_height)
-            )
-    
-    def _trigger_game_over(self, winner):
-        """Trigger game over state."""
-        self.game_over = True
-        self.game_over_timer = 0
-        self.slow_motion_factor = 1.0
-        self.winner = winner
-        
-        # Disable player movement
-        self.fighter_1.move_left = False
-        self.fighter_1.move_right = False
-        self.fighter_2.move_left = False
-        self.fighter_2.move_right = False
-        
-        # Stop any ongoing attacks and reset to idle (except for the dead fighter)
-        if self.fighter_1.alive:
-            self.fighter_1.attacking = False
-            self.fighter_1.current_action = 'Idle'
-            self.fighter_1.frame_index = 0
-            self.fighter_1.animation_counter = 0
-        if self.fighter_2.alive:
-            self.fighter_2.attacking = False
-            self.fighter_2.current_action = 'Idle'
-            self.fighter_2.frame_index = 0
-            self.fighter_2.animation_counter = 0
-        
-        self.keys_pressed.clear()
+        self.fighter_batch.draw(texture, draw_x, draw_y, fighter.scale_width, fighter.scale_height)
     
     def reset_game(self):
         """Reset the game to initial state."""
@@ -373,25 +427,53 @@ class GameWidget(Widget):
         ground_y = int(GROUND_Y * scale)
         self.fighter_1.reset(int(200 * scale), ground_y)
         self.fighter_2.reset(int(self.screen_width - 300 * scale), ground_y)
+        self.health_bar_1.reset(self.fighter_1.health)
+        self.health_bar_2.reset(self.fighter_2.health)
         
-        # Reset game over state
-        self.game_over = False
-        self.game_over_timer = 0
-        self.slow_motion_factor = 1.0
-        self.winner = None
-        
-        # Reset match timer
-        self.match_time = 40.0
+        # Reset countdown, match timer and game over state; new AI seed per match
+        self.bot_ai.reset()
+        self.match.seed = self.bot_ai.seed
+        self.match.reset()
+        self._accumulator = 0.0
         
-        # Reset countdown
-        self.countdown_active = True
-        self.countdown_time = 1.9
-        self.countdown_text = "3"
+        # Force a redraw of the reset state
+        self._last_fingerprint = None
 
 
 class GameScreen(BaseScreen):
     """The main game screen."""
     
+    @classmethod
+    def prewarm(cls):
+        """Rasterize the HUD texts, flatten the background and load fighter assets and sounds a few at a time."""
+        text_cache = TextTextureCache.get_instance()
+        text_cache.prewarm(["3", "2", "1"], 120, bold=True)
+        text_cache.prewarm(["FIGHT!"], 100, bold=True)
+        yield
+        
+        for start in range(0, len(TIMER_TEXTS), 8):
+            text_cache.prewarm(TIMER_TEXTS[start:start + 8], 36, bold=True, outline_width=2)
+            yield
+        
+        # Decoded in the background; the game widget finds it in memory if it is done by then
+        compositor = BackgroundCompositor.get_instance()
+        size = (Window.width, Window.height)
+        if os.path.exists(BACKGROUND_PATH) and compositor.get_cached([BACKGROUND_PATH], size) is None:
+            compositor.load_async([BACKGROUND_PATH], size, lambda texture: None)
+            yield
+        
+        # Fighter sprite sheets, decoded in the background into the shared asset cache
+        for name in ('fantasy_warrior', 'knight'):
+            Fighter.preload_assets(name)
+            yield
+        
+        # Sound effect voices, and a silent play to wake the audio device
+        SfxMixer.get_instance().prewarm()
+        yield
+        
+        # Upload the atlas pages (when built) the fighters and pause button draw from
+        GameAtlas.get_instance().get_frames('fantasy_warrior', 'Idle')
+    
     def __init__(self, app, **kwargs):
         super().__init__(app, **kwargs)
         
@@ -411,25 +493,21 @@ class GameScreen(BaseScreen):
         self.touch_controls = TouchControls(self.game_widget)
         self.touch_controls.create_controls(self)
         
-        # Create timer label at top center
-        self.timer_label = Label(
-            text='60',
-            size_hint=(None, None),
-            size=(80, 50),
-            pos=(Window.width // 2 - 40, Window.height - 50),
-            font_size=36,
-            bold=True,
-            color=(1, 1, 1, 1),
-            outline_color=(0, 0, 0, 1),
-            outline_width=2
-        )
-        self.add_widget(self.timer_label)
+        # Create timer display at top center (textures come from the shared text cache)
+        self.text_cache = TextTextureCache.get_instance()
+        self.text_cache.prewarm(TIMER_TEXTS, 36, bold=True, outline_width=2)
+        self.timer_display = Widget(size_hint=(None, None), size=(80, 50))
+        with self.timer_display.canvas:
+            self.timer_color = Color(1, 1, 1, 1)
+            self.timer_rect = Rectangle(pos=(0, 0), size=(0, 0))
+        self.timer_shown = None  # (seconds, is_low, window size) currently displayed
+        self.add_widget(self.timer_display)
         
         # Create pause button with UI image (below timer)
-        assets_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images', 'ui', 'fighting_screen')
+        atlas = GameAtlas.get_instance()
         self.pause_btn = Button(
-            background_normal=os.path.join(assets_path, 'Pause.png'),
-            background_down=os.path.join(assets_path, 'Pause.png'),
+            background_normal=atlas.get_ui_source('Pause.png'),
+            background_down=atlas.get_ui_source('Pause.png'),
             size_hint=(None, None),
             size=(110, 90),
             pos=(Window.width // 2 - 80, Window.height - 180),
@@ -456,7 +534,8 @@ class GameScreen(BaseScreen):
         self.touch_controls.reposition_controls()
         # Re-setup keyboard input
         self.game_widget._setup_keyboard()
-        self.game_event = Clock.schedule_interval(self.update, 1.0 / FPS)
+        # Run every rendered frame; the game widget steps the simulation at its fixed tick rate
+        self.game_event = Clock.schedule_interval(self.update, 0)
         # Apply saved audio settings
         sfx_volume = self.settings.get_sfx_volume()
         self.apply_sfx_volume(sfx_volume)
@@ -471,6 +550,12 @@ class GameScreen(BaseScreen):
         # Release keyboard when leaving
         self.game_widget._release_keyboard()
     
+    def teardown(self):
+        """Release the fighters' sprite sheets and the sound effect voices."""
+        self.game_widget.fighter_1.unload_animations()
+        self.game_widget.fighter_2.unload_animations()
+        SfxMixer.get_instance().release()
+    
     def update(self, dt):
         """Update the game."""
         self.game_widget.update(dt)
@@ -491,24 +576,41 @@ class GameScreen(BaseScreen):
                 self.bg_music.stop()
                 self.music_fading = False
         
-        # Update timer and pause button positions for dynamic scaling
-        self.timer_label.pos = (Window.width // 2 - 40, Window.height - 50)
+        # Update pause button position for dynamic scaling
         self.pause_btn.pos = (Window.width // 2 - 56, Window.height - 120)
         
         # Update timer display (just seconds)
+        self._update_timer_display()
+        
+        # Check if we need to show game over popup
+        if self.game_widget.game_over and self.game_widget.game_over_timer > 3.0 and self.game_over_popup is None:
+            self._show_game_over_popup()
+    
+    def _update_timer_display(self):
+        """Update the match timer only when the shown second, color or layout changes."""
         match_time = self.game_widget.match_time
         seconds = int(match_time)
-        self.timer_label.text = str(seconds)
+        is_low = match_time <= 10
+        state = (seconds, is_low, Window.width, Window.height)
+        if state == self.timer_shown:
+            return
+        self.timer_shown = state
+        
+        texture = self.text_cache.get(str(seconds), 36, bold=True, outline_width=2)
         
         # Change timer color when low
-        if match_time <= 10:
-            self.timer_label.color = (1, 0.2, 0.2, 1)  # Red when low
+        if is_low:
+            self.timer_color.rgba = (1, 0.2, 0.2, 1)  # Red when low
         else:
-            self.timer_label.color = (1, 1, 1, 1)
+            self.timer_color.rgba = (1, 1, 1, 1)
         
-        # Check if we need to show game over popup
-        if self.game_widget.game_over and self.game_widget.game_over_timer > 3.0 and self.game_over_popup is None:
-            self._show_game_over_popup()
+        # Center the text in the 80x50 box at the top of the screen
+        box_x = Window.width // 2 - 40
+        box_y = Window.height - 50
+        self.timer_display.pos = (box_x, box_y)
+        self.timer_rect.texture = texture
+        self.timer_rect.size = texture.size
+        self.timer_rect.pos = (box_x + (80 - texture.width) // 2, box_y + (50 - texture.height) // 2)
     
     def _show_game_over_popup(self):
         """Show the game over popup."""
@@ -535,16 +637,18 @@ class GameScreen(BaseScreen):
             result_text = 'YOU LOSE'
             result_color = (0.9, 0.2, 0.2, 1)  # Red
         
-        result_label = Label(
-            text=result_text,
-            font_size=int(48 * scale),
-            color=result_color,
-            bold=True,
-            size_hint=(None, None),
-            size=(popup_width, int(60 * scale)),
-            pos=(popup_x, popup_y + popup_height - int(90 * scale))
-        )
-        self.game_over_popup.add_widget(result_label)
+        # Result text texture from the shared text cache, tinted and centered in its row
+        result_texture = self.text_cache.get(result_text, 48, scale=scale, bold=True)
+        row_y = popup_y + popup_height - int(90 * scale)
+        row_height = int(60 * scale)
+        with self.game_over_popup.canvas:
+            Color(*result_color)
+            Rectangle(
+                texture=result_texture,
+                pos=(popup_x + (popup_width - result_texture.width) // 2,
+                     row_y + (row_height - result_texture.height) // 2),
+                size=result_texture.size
+            )
         
         # Retry button
         btn_width = int(150 * scale)
@@ -681,24 +785,8 @@ class GameScreen(BaseScreen):
             self.bg_music.stop()
     
     def apply_sfx_volume(self, volume):
-        """Apply SFX volume to all fighter sounds."""
-        # Apply to fighter 1
-        fighter1 = self.game_widget.fighter_1
-        for sound in fighter1.sounds.values():
-            if sound:
-                sound.volume = volume
-        for sound in fighter1.footstep_sounds:
-            if sound:
-                sound.volume = volume
-        
-        # Apply to fighter 2
-        fighter2 = self.game_widget.fighter_2
-        for sound in fighter2.sounds.values():
-            if sound:
-                sound.volume = volume
-        for sound in fighter2.footstep_sounds:
-            if sound:
-                sound.volume = volume
+        """Apply SFX volume to all sound effects."""
+        SfxMixer.get_instance().set_volume(volume)
     
     def on_window_resize(self, window, size):
         """Handle window resize."""
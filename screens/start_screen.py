@@ -5,17 +5,24 @@ Tap anywhere to start the game
 """
 
 import os
+from functools import partial
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.graphics import Rectangle, Color
-from kivy.core.image import Image as CoreImage
 from kivy.core.audio import SoundLoader
 from kivy.animation import Animation
 from kivy.clock import Clock
 
 from screens.base_screen import BaseScreen
+from components.parallax import ParallaxBackground
 from config import SCREENS
 from utils.settings import SettingsManager
+from utils.asset_cache import AssetCache
+
+
+# Parallax scroll speeds in texture pixels per second (rear -> front)
+PARALLAX_SPEEDS = [6, 15, 27, 45]
+
+START_TEXT = 'Tap anywhere to start'
 
 
 class StartScreen(BaseScreen):
@@ -34,9 +41,6 @@ class StartScreen(BaseScreen):
         # Bind resize events
         self.bind(size=self._on_size_change, pos=self._on_size_change)
 
-        # Load background layers
-        self._load_background()
-
         # Load pixel fonts
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.pixelmax_font = os.path.join(base_path, 'assets/fonts/Pixelmax-Regular.otf')
@@ -57,7 +61,7 @@ class StartScreen(BaseScreen):
 
         # START LABEL
         self.start_label = Label(
-            text='Tap anywhere to start',
+            text=START_TEXT,
             font_size=32,
             font_name=self.pixelade_font,
             color=(1, 1, 1, 0.8),
@@ -67,6 +71,10 @@ class StartScreen(BaseScreen):
         )
         self.start_label.bind(size=self.start_label.setter('text_size'))
         self.add_widget(self.start_label)
+        
+        # Load background layers (progress shows in place of the prompt)
+        self._bg_generation = 0
+        self._load_background()
 
         # OPTIONS BUTTON (Image)
         options_img_path = os.path.join(base_path, 'assets/images/ui/Options.png')
@@ -90,56 +98,72 @@ class StartScreen(BaseScreen):
     # -------------------------------------------------------
 
     def _load_background(self):
-        """Load 4 parallax layers."""
+        """Decode 4 parallax layers in the background; the parallax is built once all arrive."""
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cache = AssetCache.get_instance()
+        self.parallax = None
+
+        # Layer 4 is the opaque sky, layer 1 the nearest foreground
+        self._bg_paths = [os.path.join(base_path, f'assets/images/backgrounds/forestBackground/{i}.png')
+                          for i in range(4, 0, -1)]
+        self._bg_textures = [None] * len(PARALLAX_SPEEDS)
+        self._bg_pending = len(PARALLAX_SPEEDS)
+        self._show_load_progress()
+        generation = self._bg_generation
+        for index, bg_path in enumerate(self._bg_paths):
+            cache.acquire(bg_path, partial(self._on_layer_loaded, generation, index))
+
+    def _release_background(self):
+        """Remove the parallax and give its layers back to the asset cache.
+
+        Layers still loading are released as soon as they arrive.
+        """
+        if self._bg_textures is None:
+            return
+        if self.parallax:
+            self.parallax.remove()
+            self.parallax = None
+        cache = AssetCache.get_instance()
+        for path, texture in zip(self._bg_paths, self._bg_textures):
+            if texture is not None:
+                cache.release(path)
+        self._bg_textures = None
+        self._bg_pending = 0
+        self._bg_generation += 1
+
+    def _on_layer_loaded(self, generation, index, texture):
+        """Collect a decoded layer and build the scrolling background after the last one."""
+        if generation != self._bg_generation:
+            # The screen was left while this layer loaded
+            if texture is not None:
+                AssetCache.get_instance().release(self._bg_paths[index])
+            return
+        self._bg_textures[index] = texture
+        self._bg_pending -= 1
+        self._show_load_progress()
+        if self._bg_pending:
+            return
 
-        self.bg_layers = []
-        self.bg_x = [0, 0, 0, 0]  # X positions
-
-        for i in range(1, 5):
-            bg_path = os.path.join(base_path, f'assets/images/backgrounds/forestBackground/{i}.png')
-            try:
-                tex = CoreImage(bg_path).texture
-                tex.wrap = 'repeat'
-                self.bg_layers.append(tex)
-            except:
-                print(f"Error loading background layer: {bg_path}")
-
-        # Parallax speeds (rear → front)
-        self.parallax_speed = [0.1, 0.25, 0.45, 0.75]
-
-        self._build_parallax_canvas()
-
-    def _build_parallax_canvas(self):
-        """Create rectangles for each layer with tiling support."""
-        self.canvas.before.clear()
-        with self.canvas.before:
-            Color(1, 1, 1, 1)
-            self.bg_rects = []
-            
-            # Draw in reverse order so layer 4 (foreground) is on top
-            for i in range(len(self.bg_layers) - 1, -1, -1):
-                tex = self.bg_layers[i]
-                # Draw two copies of each texture for seamless scrolling
-                for offset in [0, tex.width]:
-                    rect = Rectangle(
-                        texture=tex,
-                        pos=(self.bg_x[i] + offset, 0),
-                        size=self.size
-                    )
-                    self.bg_rects.append((i, offset, rect))
-
-    def _update_parallax(self, dt):
-        """Scroll parallax layers each frame."""
-        for i in range(len(self.bg_layers)):
-            self.bg_x[i] -= self.parallax_speed[i]
-
-            # Loop when past edge
-            if self.bg_x[i] <= -self.bg_layers[i].width:
-                self.bg_x[i] = 0
-
-        # Rebuild canvas with new positions
-        self._build_parallax_canvas()
+        textures = []
+        speeds = []
+        for texture, speed in zip(self._bg_textures, PARALLAX_SPEEDS):
+            if texture is not None:
+                textures.append(texture)
+                speeds.append(speed)
+        self.parallax = ParallaxBackground(self.canvas.before, textures, speeds,
+                                           pos=self.pos, size=self.size)
+
+        # Already on screen: start scrolling right away
+        if self.parent is not None:
+            self.parallax.start()
+
+    def _show_load_progress(self):
+        """Show how many of this screen's layers have loaded in place of the start prompt."""
+        if self._bg_pending:
+            loaded = len(PARALLAX_SPEEDS) - self._bg_pending
+            self.start_label.text = f'Loading {loaded * 100 // len(PARALLAX_SPEEDS)}%'
+        else:
+            self.start_label.text = START_TEXT
 
     # -------------------------------------------------------
     # UI + EVENTS
@@ -173,12 +197,17 @@ class StartScreen(BaseScreen):
 
     def _on_size_change(self, *args):
         """Resize parallax background."""
-        if hasattr(self, "bg_rects"):
-            self._build_parallax_canvas()
+        if getattr(self, "parallax", None):
+            self.parallax.set_rect(self.pos, self.size)
 
     def on_enter(self):
         """Start animations on screen entry."""
-        self._build_parallax_canvas()
+        # Layers are released while the screen is not shown
+        if self._bg_textures is None:
+            self._load_background()
+        if self.parallax:
+            self.parallax.set_rect(self.pos, self.size)
+            self.parallax.start()
 
         # Pulse title
         anim = Animation(font_size=70, duration=0.6) + Animation(font_size=64, duration=0.6)
@@ -189,9 +218,14 @@ class StartScreen(BaseScreen):
         self.play_music()
 
     def on_leave(self):
-        """Stop animations when leaving screen."""
+        """Stop animations and release the background layers when leaving screen."""
+        self._release_background()
         Animation.cancel_all(self.start_label)
         Animation.cancel_all(self.title_label)
+
+    def teardown(self):
+        """Release the background layers."""
+        self._release_background()
     
     def _load_background_music(self):
         """Load the Travelers Quest music for the start screen."""
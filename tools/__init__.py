@@ -0,0 +1,5 @@
+"""
+Offline Tools Package
+Build steps and developer utilities that are not shipped in the APK
+Run them from the project root, e.g. ``python -m tools.build_atlas``
+"""
@@ -0,0 +1,709 @@
+"""
+Batch Match Simulator
+Struct-of-arrays NumPy engine that advances thousands of headless matches
+in lockstep, for tuning config constants over large match counts.
+
+Usage (from the project root):
+    python -m tools.batch_sim [--matches 10000] [--p1 hard] [--p2 hard] [--set ATTACK_RANGE=90 ...]
+    python -m tools.batch_sim --check [--matches 64] [--seed 0]
+
+Every fighter field is an (N, 2) array (column 0 = fighter 1, column 1 =
+fighter 2) updated with masked operations that mirror Fighter.move,
+Fighter.update_animation, Fighter.check_attack_hit and the Match rules at
+scale 1.0. Matches freeze on game over. --check replays the same random
+inputs through the scalar Fighter/Match and this engine and compares every
+field after every tick. Requires NumPy.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import config
+from components.bot_ai import get_difficulty_settings, uses_search
+from components.fighter import Fighter, IMPACT_FRAMES
+from components.match import Match
+from tools.headless_match import BASE_WIDTH, BASE_HEIGHT, RULE_DIFFICULTIES, TUNABLE, parse_overrides
+
+
+ACTIONS = ('Idle', 'Run', 'Jump', 'Attack1', 'Attack2', 'Attack3', 'Death')
+IDLE, RUN, JUMP, ATTACK1, ATTACK2, ATTACK3, DEATH = range(len(ACTIONS))
+
+# Winner codes (Match uses 'player' for fighter 1 and 'bot' for fighter 2)
+NO_WINNER, P1_WINS, P2_WINS = 0, 1, 2
+WINNER_NAMES = {P1_WINS: 'player', P2_WINS: 'bot'}
+
+
+def default_params():
+    """Current config values of the tunable constants (plus ATTACK_DAMAGE)."""
+    params = {name: getattr(config, name) for name in TUNABLE}
+    params['ATTACK_DAMAGE'] = dict(config.ATTACK_DAMAGE)
+    return params
+
+
+class BatchSim:
+    """N matches of two fighters stored as (N, 2) arrays and stepped together."""
+
+    def __init__(self, num_matches, p1_character='fantasy_warrior', p2_character='knight',
+                 params=None, tick_rate=config.SIM_TICK_RATE):
+        self.n = num_matches
+        self.characters = (p1_character, p2_character)
+        self.params = default_params()
+        if params:
+            self.params.update(params)
+        self.tick_dt = 1.0 / tick_rate
+        self._build_tables()
+        self.reset()
+
+    def _build_tables(self):
+        """Per-side lookup tables: frame counts, impact frames and damage."""
+        counts = []
+        for name in self.characters:
+            sprite_config = config.SPRITE_CONFIG.get(name, config.SPRITE_CONFIG['fantasy_warrior'])
+            counts.append([sprite_config['animations'].get(action, 0) for action in ACTIONS])
+        self.frame_counts = np.array(counts, dtype=np.int64)
+
+        self.impacts = np.zeros((2, len(ACTIONS), self.frame_counts.max() + 1), dtype=bool)
+        for side, name in enumerate(self.characters):
+            for action, frames in IMPACT_FRAMES.get(name, {}).items():
+                for frame in frames:
+                    self.impacts[side, ACTIONS.index(action), frame] = True
+
+        damage = self.params['ATTACK_DAMAGE']
+        self.damage = np.array([damage.get(t, 15) for t in range(4)], dtype=np.int64)
+
+        self._side = np.array([[0, 1]])
+        self.rect_width = Fighter.BASE_RECT_WIDTH
+        self.rect_height = Fighter.BASE_RECT_HEIGHT
+
+    def _start_values(self):
+        """Start-of-match value of each fighter field as (fighter 1, fighter 2, dtype).
+
+        Same start positions as the game at scale 1.0.
+        """
+        ground_y = float(config.GROUND_Y)
+        return {
+            'x': (200.0, BASE_WIDTH - 300.0, float),
+            'y': (ground_y, ground_y, float),
+            'vel_y': (0.0, 0.0, float),
+            'jump': (False, False, bool),
+            'jump_count': (0, 0, np.int64),
+            'attack_type': (0, 0, np.int64),
+            'attacking': (False, False, bool),
+            'hits_registered': (0, 0, np.int64),  # Bit per impact frame
+            'health': (100, 100, np.int64),
+            'hit_cooldown': (0, 0, np.int64),
+            'attack_cooldown': (0, 0, np.int64),
+            'alive': (True, True, bool),
+            'death_animation_done': (False, False, bool),
+            'action': (IDLE, IDLE, np.int64),
+            'frame_index': (0, 0, np.int64),
+            'animation_counter': (0.0, 0.0, float),
+            'move_left': (False, False, bool),
+            'move_right': (False, False, bool),
+            'dodging': (False, False, bool),
+            'dodge_cooldown': (0, 0, np.int64),
+            'dodge_timer': (0, 0, np.int64),
+            'dodge_direction': (1, 1, np.int64),
+            'flip': (False, True, bool),
+        }
+
+    def reset(self):
+        """Put every match at the start of its countdown."""
+        shape = (self.n, 2)
+        for field, (_, _, dtype) in self._start_values().items():
+            setattr(self, field, np.empty(shape, dtype=dtype))
+
+        self.tick = 0
+        self.countdown_active = np.empty(self.n, dtype=bool)
+        self.countdown_time = np.empty(self.n)
+        self.match_time = np.empty(self.n)
+        self.game_over = np.empty(self.n, dtype=bool)
+        self.timeout = np.empty(self.n, dtype=bool)
+        self.winner = np.empty(self.n, dtype=np.int8)
+        self.end_tick = np.empty(self.n, dtype=np.int64)
+        self.reset_matches(np.ones(self.n, dtype=bool))
+
+    def reset_matches(self, mask, countdown=True):
+        """Restart the masked matches, at their countdown or (countdown=False) already in play."""
+        for field, (first, second, _) in self._start_values().items():
+            values = getattr(self, field)
+            values[mask, 0] = first
+            values[mask, 1] = second
+
+        self.countdown_active[mask] = countdown
+        self.countdown_time[mask] = Match.COUNTDOWN_TIME if countdown else 0.0
+        self.match_time[mask] = Match.MATCH_TIME
+        self.game_over[mask] = False
+        self.timeout[mask] = False
+        self.winner[mask] = NO_WINNER
+        self.end_tick[mask] = 0
+
+    @property
+    def in_play(self):
+        """Per-match mask of matches accepting input."""
+        return ~self.countdown_active & ~self.game_over
+
+    def step(self, controllers=(None, None)):
+        """Advance every unfinished match by one tick (mirrors Match.step).
+
+        controllers: per side object with update(sim, side, mask), called in
+        side order on in-play matches, like Match's player_ai and bot_ai.
+        """
+        self.tick += 1
+        dt = self.tick_dt
+        countdown = self.countdown_active & ~self.game_over
+        play = self.in_play
+
+        if countdown.any():
+            self.countdown_time[countdown] -= dt
+            self.countdown_active[countdown & (self.countdown_time <= 0)] = False
+            self._update_animation(np.broadcast_to(countdown[:, None], self.x.shape))
+
+        if not play.any():
+            return
+
+        for side, controller in enumerate(controllers):
+            if controller is not None:
+                controller.update(self, side, play)
+
+        live = np.broadcast_to(play[:, None], self.x.shape)
+        self._move(live)
+        self._update_animation(live)
+        self._check_attack_hits(live)
+
+        # Match timer (ties go to fighter 2)
+        self.match_time[play] -= dt
+        timeout = play & (self.match_time <= 0)
+        if timeout.any():
+            self.match_time[timeout] = 0
+            self.timeout |= timeout
+            p1_ahead = self.health[:, 0] > self.health[:, 1]
+            self._end_matches(timeout & p1_ahead, P1_WINS)
+            self._end_matches(timeout & ~p1_ahead, P2_WINS)
+
+        self._end_matches(play & ~self.game_over & ~self.alive[:, 0], P2_WINS)
+        self._end_matches(play & ~self.game_over & ~self.alive[:, 1], P1_WINS)
+
+    def run(self, controllers=(None, None)):
+        """Step until every match is over."""
+        while not self.game_over.all():
+            self.step(controllers)
+
+    def _end_matches(self, mask, winner):
+        """Mirror Match.trigger_game_over for the masked matches."""
+        if not mask.any():
+            return
+        self.game_over |= mask
+        self.winner[mask] = winner
+        self.end_tick[mask] = self.tick
+
+        self.move_left[mask] = False
+        self.move_right[mask] = False
+        standing = mask[:, None] & self.alive
+        self.attacking[standing] = False
+        self.action[standing] = IDLE
+        self.frame_index[standing] = 0
+        self.animation_counter[standing] = 0
+
+    def _move(self, m):
+        """Mirror Fighter.move for the masked fighters."""
+        p = self.params
+        speed = p['FIGHTER_SPEED'] * 1.0
+        gravity = p['GRAVITY'] * 1.0
+        ground_y = int(config.GROUND_Y * 1.0)
+        dodge_speed = (p['DODGE_DISTANCE'] / p['DODGE_DURATION']) * 1.0
+        width = self.rect_width
+        screen_width = BASE_WIDTH
+
+        # Health depleted: die and fall to the ground
+        dead = m & (self.health <= 0)
+        self.health[dead] = 0
+        self.alive[dead] = False
+        start_death = dead & (self.action != DEATH)
+        self.action[start_death] = DEATH
+        self.frame_index[start_death] = 0
+        self.animation_counter[start_death] = 0
+
+        living = m & ~dead
+        for cooldown in (self.hit_cooldown, self.attack_cooldown, self.dodge_cooldown):
+            cooldown -= living & (cooldown > 0)
+
+        # Dodge movement
+        dodge = living & self.dodging
+        self.dodge_timer -= dodge
+        dx = np.where(dodge, dodge_speed * self.dodge_direction, 0.0)
+        self.dodging[dodge & (self.dodge_timer <= 0)] = False
+
+        # Input movement and action state
+        normal = living & ~dodge
+        free = normal & ~self.attacking
+        left = free & self.move_left
+        right = free & self.move_right
+        dx = np.where(left, -speed, dx)
+        self.flip[left] = True
+        dx = np.where(right, speed, dx)
+        self.flip[right] = False
+        running = left | right
+
+        airborne = free & ((self.vel_y > 0) | ((self.vel_y < 0) & self.jump))
+        enter_jump = airborne & (self.action != JUMP)
+        self.frame_index[enter_jump] = 0
+        self.animation_counter[enter_jump] = 0
+        self.action[airborne] = JUMP
+        self.action[free & ~airborne & running] = RUN
+        self.action[free & ~airborne & ~running] = IDLE
+
+        # Gravity
+        self.vel_y -= np.where(m, gravity, 0.0)
+        dy = np.where(m, self.vel_y, 0.0)
+
+        # Horizontal boundaries
+        dx = np.where(living & (self.x + dx < 0), -self.x, dx)
+        dx = np.where(living & (self.x + width + dx > screen_width), screen_width - self.x - width, dx)
+
+        # Ground collision
+        land = m & (self.y + dy < ground_y)
+        self.vel_y[land] = 0
+        dy = np.where(land, ground_y - self.y, dy)
+        grounded = land & living
+        self.jump_count[grounded] = 0
+        self.jump[grounded] = False
+        self.jump[normal & ~land] = True
+
+        self.x += dx
+        self.y += dy
+
+    def _update_animation(self, m, slow_motion_factor=1.0):
+        """Mirror Fighter.update_animation for the masked fighters."""
+        max_frames = self.frame_counts[self._side, self.action]
+        active = m & (max_frames > 0) & ~((self.action == DEATH) & self.death_animation_done)
+        self.animation_counter += np.where(active, slow_motion_factor, 0.0)
+
+        advance = active & (self.animation_counter >= self.params['FRAMES_PER_ANIMATION'])
+        self.animation_counter[advance] = 0
+        self.frame_index += advance
+
+        wrap = advance & (self.frame_index >= max_frames)
+        death_wrap = wrap & (self.action == DEATH)
+        self.frame_index[:] = np.where(death_wrap, max_frames - 1, np.where(wrap, 0, self.frame_index))
+        self.death_animation_done |= death_wrap
+
+        attack_end = wrap & (self.action >= ATTACK1) & (self.action <= ATTACK3)
+        self.attacking[attack_end] = False
+        self.attack_cooldown[attack_end] = self.params['ATTACK_COOLDOWN']
+
+    def _check_attack_hits(self, m):
+        """Mirror Fighter.check_attack_hit for both fighters of the masked matches.
+
+        Neither fighter's check reads state the other's check writes, so both
+        sides are resolved at once.
+        """
+        frame = np.minimum(self.frame_index, self.impacts.shape[2] - 1)
+        impact = self.impacts[self._side, self.action, frame]
+        registered = (self.hits_registered >> self.frame_index) & 1
+        candidates = m & self.attacking & self.alive & impact & (registered == 0)
+        if not candidates.any():
+            return
+
+        attack_range = int(self.params['ATTACK_RANGE'] * 1.0)
+        width = self.rect_width
+        height = self.rect_height
+        target_x = self.x[:, ::-1]
+        target_y = self.y[:, ::-1]
+
+        attack_x = np.where(self.flip, self.x - attack_range, self.x + width)
+        overlap = ((attack_x < target_x + width) &
+                   (attack_x + attack_range > target_x) &
+                   (self.y < target_y + height) &
+                   (self.y + height > target_y))
+        hit = candidates & overlap & (self.hit_cooldown[:, ::-1] == 0)
+
+        received = hit[:, ::-1]
+        damage = self.damage[self.attack_type][:, ::-1]
+        self.health -= np.where(received, damage, 0)
+        self.hit_cooldown[received] = self.params['HIT_COOLDOWN']
+        self.hits_registered |= np.where(hit, np.left_shift(1, self.frame_index), 0)
+
+    # Input commands (mirror Fighter.do_* for one side of the masked matches)
+
+    def set_movement(self, side, mask, left, right):
+        """Set movement input flags."""
+        self.move_left[mask, side] = np.broadcast_to(left, (self.n,))[mask]
+        self.move_right[mask, side] = np.broadcast_to(right, (self.n,))[mask]
+
+    def do_jump(self, side, mask):
+        """Mirror Fighter.do_jump."""
+        ok = mask & ~self.attacking[:, side] & (self.jump_count[:, side] < self.params['MAX_JUMPS'])
+        self.vel_y[ok, side] = self.params['JUMP_VELOCITY'] * 1.0
+        self.jump_count[ok, side] += 1
+
+    def do_dodge(self, side, mask):
+        """Mirror Fighter.do_dodge."""
+        ok = (mask & ~self.dodging[:, side] & ~self.attacking[:, side] &
+              (self.dodge_cooldown[:, side] == 0) & self.alive[:, side])
+        self.dodging[ok, side] = True
+        self.dodge_timer[ok, side] = self.params['DODGE_DURATION']
+        self.dodge_cooldown[ok, side] = self.params['DODGE_COOLDOWN']
+        self.dodge_direction[ok, side] = np.where(self.flip[ok, side], -1, 1)
+
+    def do_attack(self, side, mask, attack_type):
+        """Mirror Fighter.do_attack (attack_type is a scalar or per-match array)."""
+        ok = mask & ~self.attacking[:, side] & (self.attack_cooldown[:, side] == 0) & self.alive[:, side]
+        attack_type = np.broadcast_to(attack_type, (self.n,))[ok]
+        self.attacking[ok, side] = True
+        self.hits_registered[ok, side] = 0
+        self.attack_type[ok, side] = attack_type
+        self.action[ok, side] = ATTACK1 + attack_type - 1
+        self.frame_index[ok, side] = 0
+        self.animation_counter[ok, side] = 0
+
+
+class BotPolicy:
+    """Vectorized BotAI: the same decision rules per match on a NumPy random stream.
+
+    Statistically equivalent to BotAI, not bit-identical (different RNG).
+    Each side is a difficulty name or a settings dict like BOT_DIFFICULTY's,
+    whose values may be per-match arrays (decision_interval as (lows, highs)).
+    Search-driven difficulties are refused by name: in game they ignore the
+    rule parameters this would model (pass their settings dict to play the
+    rules deliberately).
+    Like BotAI's PerceptionBuffer, decisions see the opponent reaction_time
+    ticks late.
+    """
+
+    def __init__(self, sim, difficulties, rng):
+        self.rng = rng
+        self.settings = [self._side_settings(d, sim.n) for d in difficulties]
+        shape = (sim.n, 2)
+        self.decision_timer = np.zeros(shape, dtype=np.int64)
+        self.decision_interval = np.stack([self._intervals(side, sim.n) for side in (0, 1)], axis=1)
+        self.action_timer = np.zeros(shape, dtype=np.int64)
+        self.moving = np.zeros(shape, dtype=bool)  # current_action is move_left/move_right
+
+        # Opponent snapshot rings: [slot, match, side]
+        self.depth = int(max(settings['reaction_time'].max() for settings in self.settings)) + 1
+        self.seen = {
+            'x': np.zeros((self.depth,) + shape),
+            'y': np.zeros((self.depth,) + shape),
+            'health': np.zeros((self.depth,) + shape, dtype=np.int64),
+            'attack_cooldown': np.zeros((self.depth,) + shape, dtype=np.int64),
+            'attacking': np.zeros((self.depth,) + shape, dtype=bool),
+            'dodging': np.zeros((self.depth,) + shape, dtype=bool),
+            'jump': np.zeros((self.depth,) + shape, dtype=bool),
+        }
+        self.recorded = np.zeros(shape, dtype=np.int64)
+        self._rows = np.arange(sim.n)
+
+    @staticmethod
+    def _side_settings(difficulty, n):
+        """Per-match parameter arrays for one side."""
+        if isinstance(difficulty, str):
+            if uses_search(difficulty):
+                raise ValueError(f"{difficulty} plays by lookahead search, which BotPolicy does not model; "
+                                 "use tools.headless_match for it")
+            difficulty = get_difficulty_settings(difficulty)
+        settings = {key: np.broadcast_to(np.asarray(difficulty[key], dtype=float), (n,))
+                    for key in ('attack_chance', 'dodge_chance', 'aggression')}
+        low, high = difficulty['decision_interval']
+        settings['interval_low'] = np.broadcast_to(np.asarray(low, dtype=np.int64), (n,))
+        settings['interval_high'] = np.broadcast_to(np.asarray(high, dtype=np.int64), (n,))
+        settings['reaction_time'] = np.broadcast_to(np.asarray(difficulty.get('reaction_time', 0), dtype=np.int64), (n,))
+        return settings
+
+    def reset_matches(self, mask):
+        """Forget decision state and perception for the masked (restarted) matches."""
+        self.decision_timer[mask] = 0
+        for side in (0, 1):
+            self.decision_interval[mask, side] = self._intervals(side, self.decision_timer.shape[0])[mask]
+        self.action_timer[mask] = 0
+        self.moving[mask] = False
+        self.recorded[mask] = 0
+
+    def _intervals(self, side, n):
+        """Random decision intervals for one side."""
+        settings = self.settings[side]
+        return self.rng.integers(settings['interval_low'], settings['interval_high'] + 1, n)
+
+    def update(self, sim, side, mask):
+        """Mirror BotAI.update for one side of the masked matches."""
+        other = 1 - side
+        self._record(sim, side, mask)
+
+        both_alive = sim.alive[:, side] & sim.alive[:, other]
+        sim.set_movement(side, mask & ~both_alive, False, False)
+        m = mask & both_alive
+
+        timer = self.decision_timer[:, side]
+        timer += m
+        decide = m & (timer >= self.decision_interval[:, side])
+        timer[decide] = 0
+        self.decision_interval[decide, side] = self._intervals(side, sim.n)[decide]
+        self._decide(sim, side, decide)
+
+        action_timer = self.action_timer[:, side]
+        counting = m & (action_timer > 0)
+        action_timer -= counting
+        expired = m & ~counting & self.moving[:, side]
+        sim.set_movement(side, expired, False, False)
+        self.moving[expired, side] = False
+
+    def _record(self, sim, side, mask):
+        """Mirror PerceptionBuffer.record: store the opponent's state this tick."""
+        other = 1 - side
+        rows = np.nonzero(mask)[0]
+        slot = self.recorded[rows, side] % self.depth
+        for field, history in self.seen.items():
+            history[slot, rows, side] = getattr(sim, field)[rows, other]
+        self.recorded[rows, side] += 1
+
+    def _perceive(self, side):
+        """Mirror PerceptionBuffer.perceive: per-match opponent fields as seen."""
+        recorded = self.recorded[:, side]
+        age = np.minimum(self.settings[side]['reaction_time'], np.maximum(recorded - 1, 0))
+        slot = (recorded - 1 - age) % self.depth
+        rows = self._rows
+        return {field: history[slot, rows, side] for field, history in self.seen.items()}
+
+    def _decide(self, sim, side, decide):
+        """Mirror BotAI._make_decision and its range-specific branches."""
+        settings = self.settings[side]
+        attack_chance = settings['attack_chance']
+        dodge_chance = settings['dodge_chance']
+        aggression = settings['aggression']
+        n = sim.n
+        rng = self.rng
+
+        target = self._perceive(side)
+        target_x = target['x']
+        towards_right = sim.x[:, side] < target_x
+        distance = np.abs(sim.x[:, side] - target_x)
+        attack_range = sim.params['ATTACK_RANGE']
+        d = decide & ~sim.attacking[:, side]
+        close = d & (distance < attack_range + 50)
+        medium = d & ~close & (distance < attack_range + 200)
+        far = d & ~close & ~medium
+        roll = rng.random(n)
+
+        # Close range: punish recovery, react to attacks, else attack/back off/jump attack
+        punish = close & (target['attack_cooldown'] > 0) & (roll < np.minimum(1.0, attack_chance + 0.25))
+        rest = close & ~punish
+        under_attack = rest & target['attacking']
+        dodge = under_attack & (roll < np.maximum(0.15, dodge_chance * 0.5))
+        counter = under_attack & ~dodge & (roll < attack_chance)
+        default = rest & ~dodge & ~counter
+        attack = punish | counter | (default & (roll < attack_chance))
+        back_off = default & (roll >= attack_chance) & (roll < attack_chance + 0.2)
+        jump_attack = default & (roll >= attack_chance + 0.2) & (roll < attack_chance + 0.3)
+
+        # Medium range: approach, jump approach or wait
+        approach = medium & (roll < aggression)
+        jump_approach = medium & ~approach & (roll < aggression + 0.2)
+        wait = medium & ~approach & ~jump_approach
+
+        # Far range: approach, occasionally jumping
+        far_jump = far & (rng.random(n) >= 0.8)
+        approach |= far & ~far_jump
+        jump_approach |= far_jump
+
+        # Dodge: dash away when off cooldown, else back off (maybe jumping)
+        dash = dodge & (sim.dodge_cooldown[:, side] == 0) & (rng.random(n) < dodge_chance)
+        sim.flip[dash, side] = towards_right[dash]
+        sim.do_dodge(side, dash)
+        fallback = dodge & ~dash
+        back_off |= fallback
+
+        sim.do_jump(side, jump_attack | jump_approach)
+
+        self._approach(sim, side, approach | jump_approach, towards_right)
+        self._back_off(sim, side, back_off, towards_right)
+        sim.do_jump(side, fallback & (rng.random(n) < 0.35))
+
+        self.action_timer[counter, side] = rng.integers(2, 7, n)[counter]
+
+        # Attacks: Attack1/2, occasionally the moving Attack3
+        attack |= jump_attack
+        attack_type = rng.integers(1, 3, n)
+        special = attack & (rng.random(n) < 0.15)
+        attack_type[special] = 3
+        sim.set_movement(side, special, ~towards_right, towards_right)
+        sim.do_attack(side, attack, attack_type)
+        self.moving[attack, side] = False
+
+        self._wait(sim, side, wait)
+
+    def _approach(self, sim, side, mask, towards_right):
+        """Mirror BotAI._approach."""
+        sim.set_movement(side, mask, ~towards_right, towards_right)
+        self.moving[mask, side] = True
+        self.action_timer[mask, side] = self.rng.integers(10, 31, sim.n)[mask]
+
+    def _back_off(self, sim, side, mask, towards_right):
+        """Mirror BotAI._back_off."""
+        sim.set_movement(side, mask, towards_right, ~towards_right)
+        self.moving[mask, side] = True
+        self.action_timer[mask, side] = self.rng.integers(5, 16, sim.n)[mask]
+
+    def _wait(self, sim, side, mask):
+        """Stop moving (BotAI's idle branch)."""
+        sim.set_movement(side, mask, False, False)
+        self.moving[mask, side] = False
+
+
+# Consistency check against the scalar Fighter/Match
+
+CHECK_FIELDS = (
+    'x', 'y', 'vel_y', 'jump', 'jump_count', 'attack_type', 'attacking', 'health',
+    'hit_cooldown', 'attack_cooldown', 'alive', 'death_animation_done', 'frame_index',
+    'animation_counter', 'move_left', 'move_right', 'dodging', 'dodge_cooldown',
+    'dodge_timer', 'dodge_direction', 'flip',
+)
+
+
+def random_inputs(rng, ticks, num_matches):
+    """Random per-tick inputs: move bits (1 = left, 2 = right), jump, dodge, attack type."""
+    shape = (ticks, num_matches, 2)
+    return {
+        'move': rng.choice(4, size=shape, p=[0.3, 0.3, 0.3, 0.1]),
+        'jump': rng.random(shape) < 0.03,
+        'dodge': rng.random(shape) < 0.03,
+        'attack': np.where(rng.random(shape) < 0.1, rng.integers(1, 4, shape), 0),
+    }
+
+
+class ScriptedInputs:
+    """Batch controller replaying random_inputs()."""
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+
+    def update(self, sim, side, mask):
+        """Apply this tick's inputs for one side."""
+        t = sim.tick
+        move = self.inputs['move'][t, :, side]
+        sim.set_movement(side, mask, (move & 1) > 0, (move & 2) > 0)
+        sim.do_jump(side, mask & self.inputs['jump'][t, :, side])
+        sim.do_dodge(side, mask & self.inputs['dodge'][t, :, side])
+        attack = self.inputs['attack'][t, :, side]
+        sim.do_attack(side, mask & (attack > 0), attack)
+
+
+class _ScalarScriptedInput:
+    """Scalar controller (BotAI interface) replaying the same inputs for one fighter."""
+
+    def __init__(self, fighter, inputs, match_index, side):
+        self.fighter = fighter
+        self.inputs = inputs
+        self.match_index = match_index
+        self.side = side
+        self.match = None
+
+    def update(self, target, screen_width, screen_height=BASE_HEIGHT):
+        """Apply this tick's inputs."""
+        t, n, side = self.match.tick, self.match_index, self.side
+        move = int(self.inputs['move'][t, n, side])
+        self.fighter.move_left = bool(move & 1)
+        self.fighter.move_right = bool(move & 2)
+        if self.inputs['jump'][t, n, side]:
+            self.fighter.do_jump()
+        if self.inputs['dodge'][t, n, side]:
+            self.fighter.do_dodge()
+        attack = int(self.inputs['attack'][t, n, side])
+        if attack:
+            self.fighter.do_attack(attack)
+
+
+def _compare(sim, n, match):
+    """Describe the first difference between batch match n and a scalar match, or None."""
+    for side, fighter in enumerate((match.fighter_1, match.fighter_2)):
+        for field in CHECK_FIELDS:
+            batch_value = getattr(sim, field)[n, side]
+            if batch_value != getattr(fighter, field):
+                return f"fighter {side + 1} {field}: batch {batch_value} != scalar {getattr(fighter, field)}"
+        if ACTIONS[sim.action[n, side]] != fighter.current_action:
+            return f"fighter {side + 1} action: batch {ACTIONS[sim.action[n, side]]} != scalar {fighter.current_action}"
+    if sim.game_over[n] != match.game_over:
+        return f"game_over: batch {sim.game_over[n]} != scalar {match.game_over}"
+    if WINNER_NAMES.get(int(sim.winner[n])) != match.winner:
+        return f"winner: batch {WINNER_NAMES.get(int(sim.winner[n]))} != scalar {match.winner}"
+    return None
+
+
+def run_check(num_matches, seed, p1_character, p2_character):
+    """Step batch and scalar matches on identical inputs; True if they never diverge."""
+    ticks = int((Match.COUNTDOWN_TIME + Match.MATCH_TIME) * config.SIM_TICK_RATE) + 10
+    inputs = random_inputs(np.random.default_rng(seed), ticks + 1, num_matches)
+
+    sim = BatchSim(num_matches, p1_character, p2_character)
+    batch_inputs = ScriptedInputs(inputs)
+
+    matches = []
+    for n in range(num_matches):
+        fighter_1 = Fighter(200, config.GROUND_Y, p1_character, is_player_2=False, headless=True)
+        fighter_2 = Fighter(BASE_WIDTH - 300, config.GROUND_Y, p2_character, is_player_2=True, headless=True)
+        input_1 = _ScalarScriptedInput(fighter_1, inputs, n, 0)
+        input_2 = _ScalarScriptedInput(fighter_2, inputs, n, 1)
+        match = Match(fighter_1, fighter_2, bot_ai=input_2, player_ai=input_1)
+        input_1.match = input_2.match = match
+        matches.append(match)
+
+    compared = 0
+    while not sim.game_over.all() and sim.tick < ticks:
+        sim.step((batch_inputs, batch_inputs))
+        for n, match in enumerate(matches):
+            if match.game_over:
+                continue
+            match.step(BASE_WIDTH, BASE_HEIGHT)
+            compared += 1
+            difference = _compare(sim, n, match)
+            if difference:
+                print(f"MISMATCH in match {n} at tick {sim.tick}: {difference}")
+                return False
+
+    hits = int((sim.health < 100).sum())
+    print(f"OK: {num_matches} matches, {compared} match ticks identical "
+          f"({hits} fighters took damage, {int((~sim.alive).sum())} KOs, {int(sim.timeout.sum())} timeouts)")
+    return True
+
+
+def main():
+    characters = sorted(config.SPRITE_CONFIG)
+    parser = argparse.ArgumentParser(description='Simulate many headless matches at once with NumPy.')
+    parser.add_argument('--matches', type=int, default=None, help='Matches per batch (10000, or 64 with --check)')
+    parser.add_argument('--p1', choices=RULE_DIFFICULTIES, default='hard', help='Player 1 bot difficulty')
+    parser.add_argument('--p2', choices=RULE_DIFFICULTIES, default='hard', help='Player 2 bot difficulty')
+    parser.add_argument('--p1-character', choices=characters, default='fantasy_warrior')
+    parser.add_argument('--p2-character', choices=characters, default='knight')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a config constant for this batch (repeatable)')
+    parser.add_argument('--check', action='store_true',
+                        help='Compare against the scalar Fighter on random inputs instead')
+    args = parser.parse_args()
+
+    if args.check:
+        ok = run_check(args.matches or 64, args.seed, args.p1_character, args.p2_character)
+        sys.exit(0 if ok else 1)
+
+    num_matches = args.matches or 10000
+    sim = BatchSim(num_matches, args.p1_character, args.p2_character, params=parse_overrides(args.set))
+    policy = BotPolicy(sim, (args.p1, args.p2), np.random.default_rng(args.seed))
+
+    start = time.perf_counter()
+    sim.run((policy, policy))
+    elapsed = time.perf_counter() - start
+
+    p1_wins = int((sim.winner == P1_WINS).sum())
+    p2_wins = int((sim.winner == P2_WINS).sum())
+    total_ticks = int(sim.end_tick.sum())
+    print(f"P1 {args.p1_character} ({args.p1}): {p1_wins} wins ({100.0 * p1_wins / num_matches:.1f}%)")
+    print(f"P2 {args.p2_character} ({args.p2}): {p2_wins} wins ({100.0 * p2_wins / num_matches:.1f}%)")
+    print(f"Timeouts: {int(sim.timeout.sum())} (ties go to P2)")
+    print(f"Average match: {total_ticks / num_matches:.0f} ticks")
+    print(f"Simulated {total_ticks} match ticks in {elapsed:.2f}s ({total_ticks / max(elapsed, 1e-9):.0f} match ticks/sec)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Training Environment Benchmark
+Measures environment steps per second (and per core) of VectorFightEnv in
+process and SubprocVectorEnv across worker processes, with random actions.
+
+Usage (from the project root):
+    python -m tools.bench_env [--envs 1024] [--workers 4] [--seconds 5] [--frame-skip 1]
+
+One environment step is one action per agent for every environment, so a
+batch of 1024 environments counts 1024 steps per call.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from tools.fight_env import NUM_ACTIONS, SubprocVectorEnv, VectorFightEnv
+
+
+def measure(env, seconds, rng):
+    """Step env with random actions for about seconds; returns (env steps/sec, episodes)."""
+    env.reset()
+    action_shape = (env.num_envs, len(env.agents))
+    # Pre-drawn actions so the benchmark measures the environment, not the RNG
+    actions = rng.integers(NUM_ACTIONS, size=(64,) + action_shape)
+    steps = 0
+    episodes = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        _, _, dones, _ = env.step(actions[steps % len(actions)])
+        episodes += int(dones.sum())
+        steps += 1
+    elapsed = time.perf_counter() - start
+    return steps * env.num_envs / elapsed, episodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the training environment in env steps/sec.')
+    parser.add_argument('--envs', type=int, default=1024, help='Environments (in total for subprocess runs)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes (0 to skip)')
+    parser.add_argument('--seconds', type=float, default=5.0, help='Duration of each measurement')
+    parser.add_argument('--frame-skip', type=int, default=1, help='Ticks per environment step')
+    parser.add_argument('--agents', default='1', help='Controlled sides, e.g. 1 or 0,1')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    env_kwargs = {
+        'agents': tuple(int(side) for side in args.agents.split(',')),
+        'frame_skip': args.frame_skip,
+        'seed': args.seed,
+    }
+
+    for num_envs in sorted({1, 64, args.envs}):
+        rate, episodes = measure(VectorFightEnv(num_envs, **env_kwargs), args.seconds, rng)
+        print(f"in-process  {num_envs:>6} envs:              {rate:>12,.0f} env steps/sec "
+              f"(per core {rate:,.0f}, {episodes} episodes)")
+
+    if args.workers > 0:
+        per_worker = max(1, args.envs // args.workers)
+        env = SubprocVectorEnv(args.workers, per_worker, **env_kwargs)
+        try:
+            rate, episodes = measure(env, args.seconds, rng)
+        finally:
+            env.close()
+        cores = min(args.workers, os.cpu_count() or 1)
+        print(f"subprocess  {env.num_envs:>6} envs, {args.workers:>2} workers: {rate:>12,.0f} env steps/sec "
+              f"(per core {rate / cores:,.0f}, {episodes} episodes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Headless Import Benchmark
+Times importing the simulation modules in a fresh interpreter with Kivy
+blocked, and fails if they need Kivy or take longer than the limit.
+
+Usage (from the project root):
+    python -m tools.bench_import [--runs 5] [--limit-ms 50]
+
+Each run is a new process, so nothing is cached between measurements except
+the compiled bytecode. Exits with status 1 when the median import time is
+over the limit or a module could not be imported without Kivy.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the headless tools and the game loop's simulation depend on
+MODULES = ('components.fighter', 'components.bot_ai')
+
+# Run in the child: block Kivy (importing it raises ImportError), then time the imports
+CHILD_CODE = """
+import sys, time
+sys.modules['kivy'] = None
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+print((time.perf_counter() - start) * 1000.0)
+"""
+
+
+def time_import(modules):
+    """Milliseconds to import modules in a fresh interpreter, or None if it failed."""
+    result = subprocess.run([sys.executable, '-c', CHILD_CODE] + list(modules),
+                            cwd=BASE_PATH, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr.strip())
+        return None
+    return float(result.stdout.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the simulation modules import quickly without Kivy.')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to time')
+    parser.add_argument('--limit-ms', type=float, default=50.0, help='Largest allowed median import time')
+    args = parser.parse_args()
+
+    # Warm-up run also writes the bytecode cache
+    if time_import(MODULES) is None:
+        print(f"FAIL: {', '.join(MODULES)} could not be imported without Kivy")
+        sys.exit(1)
+
+    times = sorted(time_import(MODULES) for _ in range(args.runs))
+    median = times[len(times) // 2]
+    print(f"import {', '.join(MODULES)}: median {median:.1f} ms, "
+          f"best {times[0]:.1f} ms, worst {times[-1]:.1f} ms over {args.runs} runs (limit {args.limit_ms:.0f} ms)")
+
+    if median > args.limit_ms:
+        print("FAIL: import time over the limit")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Texture Atlas Builder
+Packs every character animation frame and the fighting screen UI buttons
+into a few power-of-two Kivy atlas pages plus a frame manifest.
+
+Usage (from the project root):
+    python -m tools.build_atlas [--page-size 2048] [--padding 2]
+
+Outputs assets/atlas/game.atlas, assets/atlas/game-<n>.png and
+assets/atlas/manifest.json. Requires Pillow.
+"""
+
+import argparse
+import json
+import os
+
+from PIL import Image
+
+from config import SPRITE_CONFIG
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHARACTERS_PATH = os.path.join(BASE_PATH, 'assets', 'images', 'characters')
+UI_PATH = os.path.join(BASE_PATH, 'assets', 'images', 'ui', 'fighting_screen')
+ATLAS_PATH = os.path.join(BASE_PATH, 'assets', 'atlas')
+ATLAS_NAME = 'game'
+
+
+def frame_id(character, action, index):
+    """Atlas id for one animation frame."""
+    return f'{character}-{action}-{index}'
+
+
+def ui_id(filename):
+    """Atlas id for a UI image."""
+    return 'ui-' + os.path.splitext(filename)[0]
+
+
+def collect_images():
+    """Collect (atlas id, PIL image) pairs and the manifest describing them."""
+    images = []
+    manifest = {'atlas': f'{ATLAS_NAME}.atlas', 'characters': {}, 'ui': {}}
+
+    # Character frames (only configured actions are used by the game)
+    for character, config in SPRITE_CONFIG.items():
+        frames_by_action = manifest['characters'][character] = {}
+        for action, num_frames in config['animations'].items():
+            sheet_path = os.path.join(CHARACTERS_PATH, character, f'{action}.png')
+            if not os.path.exists(sheet_path):
+                print(f"Warning: Could not find {sheet_path}")
+                continue
+
+            sheet = Image.open(sheet_path).convert('RGBA')
+            frame_width = sheet.width // num_frames
+            ids = []
+            for index in range(num_frames):
+                frame = sheet.crop((index * frame_width, 0, (index + 1) * frame_width, sheet.height))
+                ids.append(frame_id(character, action, index))
+                images.append((ids[-1], frame))
+            frames_by_action[action] = ids
+
+    # Fighting screen buttons
+    for filename in sorted(os.listdir(UI_PATH)):
+        if filename.lower().endswith('.png'):
+            image = Image.open(os.path.join(UI_PATH, filename)).convert('RGBA')
+            manifest['ui'][filename] = ui_id(filename)
+            images.append((ui_id(filename), image))
+
+    return images, manifest
+
+
+def next_power_of_two(value):
+    """Smallest power of two >= value."""
+    size = 1
+    while size < value:
+        size *= 2
+    return size
+
+
+def pack_shelves(images, page_size, padding):
+    """Shelf-pack images (tallest first) into pages.
+
+    Returns a list of pages, each a list of (id, image, x, y) with y measured
+    from the top of the page.
+    """
+    pages = []
+    page = None
+    shelf_x = shelf_y = shelf_height = 0
+
+    for uid, image in sorted(images, key=lambda item: (item[1].height, item[1].width), reverse=True):
+        width = image.width + padding * 2
+        height = image.height + padding * 2
+        if width > page_size or height > page_size:
+            raise ValueError(f'{uid} ({image.width}x{image.height}) is larger than the atlas page')
+
+        if page is not None and shelf_x + width > page_size:
+            # Start a new shelf
+            shelf_y += shelf_height
+            shelf_x = shelf_height = 0
+        if page is None or shelf_y + height > page_size:
+            # Start a new page
+            page = []
+            pages.append(page)
+            shelf_x = shelf_y = shelf_height = 0
+
+        page.append((uid, image, shelf_x + padding, shelf_y + padding))
+        shelf_x += width
+        shelf_height = max(shelf_height, height)
+
+    return pages
+
+
+def write_atlas(pages, manifest, padding):
+    """Write page images, the Kivy .atlas file and the manifest."""
+    os.makedirs(ATLAS_PATH, exist_ok=True)
+    atlas = {}
+    manifest['pages'] = []
+
+    for page_index, page in enumerate(pages):
+        # Shrink each page to the smallest power of two that holds its contents
+        width = next_power_of_two(max(x + image.width + padding for _, image, x, _ in page))
+        height = next_power_of_two(max(y + image.height + padding for _, image, _, y in page))
+
+        page_image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        page_name = f'{ATLAS_NAME}-{page_index}.png'
+        regions = atlas[page_name] = {}
+        for uid, image, x, y in page:
+            page_image.paste(image, (x, y))
+            # Kivy atlas coordinates have their origin at the bottom left
+            regions[uid] = [x, height - y - image.height, image.width, image.height]
+
+        page_image.save(os.path.join(ATLAS_PATH, page_name))
+        manifest['pages'].append({'file': page_name, 'size': [width, height], 'regions': len(page)})
+
+    with open(os.path.join(ATLAS_PATH, f'{ATLAS_NAME}.atlas'), 'w') as f:
+        json.dump(atlas, f)
+    with open(os.path.join(ATLAS_PATH, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack sprite sheets and UI images into Kivy atlas pages.')
+    parser.add_argument('--page-size', type=int, default=2048, help='Maximum atlas page size (power of two)')
+    parser.add_argument('--padding', type=int, default=2, help='Transparent padding around each region')
+    args = parser.parse_args()
+
+    images, manifest = collect_images()
+    pages = pack_shelves(images, args.page_size, args.padding)
+    write_atlas(pages, manifest, args.padding)
+
+    print(f"Packed {len(images)} images into {len(pages)} page(s) in {ATLAS_PATH}")
+    for page in manifest['pages']:
+        print(f"  {page['file']}: {page['size'][0]}x{page['size'][1]}, {page['regions']} regions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Bot Difficulty Calibration
+Searches BotAI parameters (reaction time, attack/dodge chances, aggression
+and decision interval) per difficulty so each tier wins a target share
+of matches against a reference policy, using batched headless simulation
+and successive halving.
+
+Usage (from the project root):
+    python -m tools.calibrate_bot [--candidates 64] [--matches 32] [--reference medium]
+                                  [--target easy=0.2 ...] [--dry-run]
+
+The bot plays fighter 2 (knight) against a reference tier's config
+default settings on fighter 1 (fantasy_warrior), as in the game. The search
+starts from each tier's current settings plus random candidates, all within
+the tier's own parameter ranges (TIER_RANGES), so a harder tier always
+reacts faster, attacks more readily and decides no slower. Every
+round plays all surviving candidates of all tiers in one BatchSim, adds the
+results to the matches they already played, keeps the half closest to
+their tier's target and doubles the matches per candidate. The winners are
+written to assets/data/bot_difficulty.json, which BotAI loads at startup.
+Only rule-driven tiers are calibrated: search-driven ones (nightmare) ignore
+these parameters in game. Requires NumPy.
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from components.bot_ai import DIFFICULTY_FILE, get_difficulty_settings
+from config import BOT_DIFFICULTY
+from tools.batch_sim import BatchSim, BotPolicy, P2_WINS
+from tools.headless_match import RULE_DIFFICULTIES
+
+
+# Bot win rate against the reference policy per tier
+DEFAULT_TARGETS = {'easy': 0.2, 'medium': 0.45, 'hard': 0.7}
+
+# Parameter ranges per tier: reaction_time (ticks, inclusive), chances as
+# (low, high), and the decision interval ranges (frames) the search picks from.
+# Harder tiers get strictly faster reactions and higher attack chance and
+# aggression, and never slower decisions; dodging is left free, since dodging
+# more is not harder.
+TIER_RANGES = {
+    'easy': {
+        'reaction_time': (17, 24),
+        'attack_chance': (0.2, 0.4),
+        'dodge_chance': (0.0, 0.6),
+        'aggression': (0.2, 0.4),
+        'decision_interval': ((12, 24), (15, 30)),
+    },
+    'medium': {
+        'reaction_time': (11, 16),
+        'attack_chance': (0.4, 0.6),
+        'dodge_chance': (0.0, 0.6),
+        'aggression': (0.4, 0.6),
+        'decision_interval': ((8, 18), (12, 24)),
+    },
+    'hard': {
+        'reaction_time': (2, 10),
+        'attack_chance': (0.6, 1.0),
+        'dodge_chance': (0.0, 0.6),
+        'aggression': (0.6, 1.0),
+        'decision_interval': ((3, 10), (5, 14), (8, 18)),
+    },
+}
+
+SCALAR_KEYS = ('reaction_time', 'attack_chance', 'dodge_chance', 'aggression')
+
+
+def sample_candidates(rng, tier, count):
+    """The tier's current settings (clamped to its ranges) plus count - 1 random parameter sets."""
+    ranges = TIER_RANGES[tier]
+    current = get_difficulty_settings(tier)
+    interval = tuple(current['decision_interval'])
+    candidates = [{
+        'reaction_time': int(np.clip(current['reaction_time'], *ranges['reaction_time'])),
+        'attack_chance': float(np.clip(current['attack_chance'], *ranges['attack_chance'])),
+        'dodge_chance': float(np.clip(current['dodge_chance'], *ranges['dodge_chance'])),
+        'aggression': float(np.clip(current['aggression'], *ranges['aggression'])),
+        'decision_interval': interval if interval in ranges['decision_interval'] else ranges['decision_interval'][0],
+    }]
+    for _ in range(count - 1):
+        low, high = ranges['reaction_time']
+        candidates.append({
+            'reaction_time': int(rng.integers(low, high + 1)),
+            'attack_chance': round(float(rng.uniform(*ranges['attack_chance'])), 3),
+            'dodge_chance': round(float(rng.uniform(*ranges['dodge_chance'])), 3),
+            'aggression': round(float(rng.uniform(*ranges['aggression'])), 3),
+            'decision_interval': ranges['decision_interval'][rng.integers(len(ranges['decision_interval']))],
+        })
+    return candidates
+
+
+def evaluate(candidates, matches_each, reference, rng):
+    """Play matches_each matches per candidate in one batch; returns bot wins per candidate."""
+    index = np.repeat(np.arange(len(candidates)), matches_each)
+    bot = {key: np.array([c[key] for c in candidates])[index] for key in SCALAR_KEYS}
+    bot['decision_interval'] = (
+        np.array([c['decision_interval'][0] for c in candidates])[index],
+        np.array([c['decision_interval'][1] for c in candidates])[index],
+    )
+
+    sim = BatchSim(len(index), 'fantasy_warrior', 'knight')
+    policy = BotPolicy(sim, (reference, bot), rng)
+    sim.run((policy, policy))
+    return np.bincount(index, weights=sim.winner == P2_WINS, minlength=len(candidates))
+
+
+def calibrate(targets, reference, num_candidates, first_matches, seed):
+    """Successive halving over all tiers at once; returns {tier: (settings, win_rate, matches)}."""
+    rng = np.random.default_rng(seed)
+    pool = {}
+    for tier in targets:
+        candidates = sample_candidates(rng, tier, num_candidates)
+        pool[tier] = {
+            'candidates': candidates,
+            'wins': np.zeros(len(candidates)),
+            'games': np.zeros(len(candidates)),
+        }
+
+    matches = first_matches
+    round_number = 0
+    start = time.perf_counter()
+    while any(len(entry['candidates']) > 1 for entry in pool.values()):
+        round_number += 1
+        racing = {tier: entry for tier, entry in pool.items() if len(entry['candidates']) > 1}
+        batch = []
+        for entry in racing.values():
+            batch.extend(entry['candidates'])
+        wins = evaluate(batch, matches, reference, rng)
+
+        offset = 0
+        for tier, entry in racing.items():
+            count = len(entry['candidates'])
+            entry['wins'] += wins[offset:offset + count]
+            entry['games'] += matches
+            offset += count
+
+            error = np.abs(entry['wins'] / entry['games'] - targets[tier])
+            keep = np.argsort(error, kind='stable')[:max(1, count // 2)]
+            best = keep[0]
+            print(f"  round {round_number} {tier:<10} {count:>3} candidates x {int(entry['games'][best])} matches: "
+                  f"best win rate {entry['wins'][best] / entry['games'][best]:.3f} (target {targets[tier]:.2f})")
+
+            entry['candidates'] = [entry['candidates'][i] for i in keep]
+            entry['wins'] = entry['wins'][keep]
+            entry['games'] = entry['games'][keep]
+        print(f"  ({len(batch) * matches} matches, {time.perf_counter() - start:.1f}s elapsed)")
+        matches *= 2
+
+    return {tier: (entry['candidates'][0], entry['wins'][0] / entry['games'][0], int(entry['games'][0]))
+            for tier, entry in pool.items()}
+
+
+def parse_targets(items):
+    """Parse TIER=RATE target overrides."""
+    targets = dict(DEFAULT_TARGETS)
+    for item in items:
+        tier, _, rate = item.partition('=')
+        if tier not in TIER_RANGES:
+            raise SystemExit(f"Unknown or search-driven difficulty {tier!r} "
+                             f"(calibrated tiers: {', '.join(TIER_RANGES)})")
+        targets[tier] = float(rate)
+    return targets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calibrate BotAI difficulty tiers against target win rates.')
+    parser.add_argument('--candidates', type=int, default=64, help='Random parameter sets per tier')
+    parser.add_argument('--matches', type=int, default=32, help='Matches per candidate in the first round')
+    parser.add_argument('--reference', choices=RULE_DIFFICULTIES, default='medium',
+                        help='Policy the bot is measured against (config default settings)')
+    parser.add_argument('--target', action='append', default=[], metavar='TIER=RATE',
+                        help='Override a tier\'s target bot win rate (repeatable)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--output', default=DIFFICULTY_FILE, help='Data file to write')
+    parser.add_argument('--dry-run', action='store_true', help='Print the result without writing it')
+    args = parser.parse_args()
+
+    targets = parse_targets(args.target)
+    reference = dict(BOT_DIFFICULTY[args.reference])
+    print(f"Calibrating against {args.reference}: " +
+          ', '.join(f'{tier} {rate:.2f}' for tier, rate in targets.items()))
+    results = calibrate(targets, reference, args.candidates, args.matches, args.seed)
+
+    data = {'reference': args.reference, 'difficulties': {}, 'calibration': {}}
+    for tier, (settings, win_rate, games) in results.items():
+        data['difficulties'][tier] = {
+            'reaction_time': settings['reaction_time'],
+            'attack_chance': settings['attack_chance'],
+            'dodge_chance': settings['dodge_chance'],
+            'aggression': settings['aggression'],
+            'decision_interval': list(settings['decision_interval']),
+        }
+        data['calibration'][tier] = {'target': targets[tier], 'win_rate': round(float(win_rate), 4), 'matches': games}
+        print(f"{tier:<10} win rate {win_rate:.3f} over {games} matches: {data['difficulties'][tier]}")
+
+    if args.dry_run:
+        return
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(data, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""
+Fighting Game Training Environment
+Gym-style reset()/step(actions) API over the batched headless engine
+(tools/batch_sim.py), for training learned opponents to replace BotAI.
+
+    env = VectorFightEnv(num_envs=256, agents=(1,), opponent='hard')
+    obs = env.reset()                        # (num_envs, len(agents), OBS_SIZE) float32
+    obs, rewards, dones, info = env.step(actions)   # actions: (num_envs, len(agents)) ints
+
+Each controlled side (0 = fighter 1, 1 = fighter 2) picks one of
+NUM_ACTIONS controller inputs per step: a movement (none, left, right)
+combined with a button (none, jump, dodge, attack 1, attack 2), where
+attack 2 while moving is Attack 3 as on the keyboard. Uncontrolled sides
+are played by the vectorized rule-based bot. Rewards are the damage dealt
+minus damage taken over the step (per 100 health) plus 1 for a win and -1
+for a loss. Finished matches are restarted automatically, so the returned
+observation of a done environment is the first one of its next match.
+
+SubprocVectorEnv runs several VectorFightEnvs in worker processes that
+write observations, rewards and dones straight into shared memory. Requires
+NumPy.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import config
+from components.match import Match
+from tools.batch_sim import BatchSim, BotPolicy, NO_WINNER, P1_WINS, P2_WINS
+from tools.headless_match import BASE_WIDTH, BASE_HEIGHT
+
+
+# Controller inputs: action = move * len(BUTTONS) + button
+MOVES = ('none', 'left', 'right')
+BUTTONS = ('none', 'jump', 'dodge', 'attack1', 'attack2')
+NUM_ACTIONS = len(MOVES) * len(BUTTONS)
+
+# Per-fighter observation features (own fighter first, then the opponent)
+FIGHTER_FEATURES = (
+    'x', 'height', 'vel_y', 'health', 'facing', 'jump', 'jump_count', 'attacking',
+    'attack_type', 'frame_index', 'attack_cooldown', 'hit_cooldown', 'dodging', 'dodge_cooldown',
+)
+# Followed by the signed distance to the opponent and the match time left
+OBS_SIZE = 2 * len(FIGHTER_FEATURES) + 2
+
+
+class _AgentInputs:
+    """BatchSim controller applying the agents' current actions each tick."""
+
+    def __init__(self):
+        self.actions = {}
+
+    def update(self, sim, side, mask):
+        """Mirror GameWidget._apply_keyboard_input and the jump/dodge keys."""
+        actions = self.actions[side]
+        move = actions // len(BUTTONS)
+        button = actions % len(BUTTONS)
+        moving = move != 0
+        sim.set_movement(side, mask, move == 1, move == 2)
+        sim.do_jump(side, mask & (button == 1))
+        sim.do_dodge(side, mask & (button == 2))
+        attack_type = np.where(button == 3, 1, np.where(moving, 3, 2))
+        sim.do_attack(side, mask & (button >= 3), attack_type)
+
+
+class VectorFightEnv:
+    """num_envs matches stepped in lockstep in this process."""
+
+    def __init__(self, num_envs, agents=(1,), opponent='hard', p1_character='fantasy_warrior',
+                 p2_character='knight', frame_skip=1, countdown=False, seed=None, obs_buffer=None):
+        self.num_envs = num_envs
+        self.agents = tuple(agents)
+        self.frame_skip = frame_skip
+        self.countdown = countdown
+        self.rng = np.random.default_rng(seed)
+        self.sim = BatchSim(num_envs, p1_character, p2_character)
+
+        # Rule-based bot for the sides no agent controls
+        self.bot = BotPolicy(self.sim, (opponent, opponent), self.rng)
+        self.inputs = _AgentInputs()
+        self.controllers = tuple(self.inputs if side in self.agents else self.bot for side in (0, 1))
+
+        self.observation_shape = (num_envs, len(self.agents), OBS_SIZE)
+        if obs_buffer is None:
+            obs_buffer = np.zeros(self.observation_shape, dtype=np.float32)
+        self.obs = obs_buffer
+        self._scales = self._feature_scales()
+
+    def _feature_scales(self):
+        """Divisors bringing each fighter feature to roughly [-1, 1]."""
+        p = self.sim.params
+        scales = {
+            'x': BASE_WIDTH, 'height': BASE_HEIGHT, 'vel_y': p['JUMP_VELOCITY'], 'health': 100,
+            'facing': 1, 'jump': 1, 'jump_count': p['MAX_JUMPS'], 'attacking': 1, 'attack_type': 3,
+            'frame_index': 10, 'attack_cooldown': p['ATTACK_COOLDOWN'], 'hit_cooldown': p['HIT_COOLDOWN'],
+            'dodging': 1, 'dodge_cooldown': p['DODGE_COOLDOWN'],
+        }
+        return np.array([scales[feature] for feature in FIGHTER_FEATURES], dtype=np.float32)
+
+    def reset(self):
+        """Restart every match; returns the first observations."""
+        everything = np.ones(self.num_envs, dtype=bool)
+        self.sim.reset_matches(everything, self.countdown)
+        self.bot.reset_matches(everything)
+        self._observe()
+        return self.obs
+
+    def step(self, actions):
+        """Apply one action per agent for frame_skip ticks.
+
+        Returns (obs, rewards, dones, info); rewards is (num_envs, agents)
+        float32, dones and info['winner'] are per env (winner 1 = fighter 1,
+        2 = fighter 2, 0 = still playing).
+        """
+        sim = self.sim
+        actions = np.asarray(actions).reshape(self.num_envs, len(self.agents))
+        for i, side in enumerate(self.agents):
+            self.inputs.actions[side] = actions[:, i]
+
+        health_before = np.maximum(sim.health, 0)
+        for _ in range(self.frame_skip):
+            sim.step(self.controllers)
+            if sim.game_over.all():
+                break
+
+        # Damage dealt minus damage taken, plus the match result
+        lost = (health_before - np.maximum(sim.health, 0)).astype(np.float32) / 100.0
+        rewards = np.empty((self.num_envs, len(self.agents)), dtype=np.float32)
+        winner = np.where(sim.game_over, sim.winner, NO_WINNER)
+        for i, side in enumerate(self.agents):
+            won = winner == (P1_WINS if side == 0 else P2_WINS)
+            beaten = (winner != NO_WINNER) & ~won
+            rewards[:, i] = lost[:, 1 - side] - lost[:, side] + won - beaten
+
+        dones = sim.game_over.copy()
+        info = {'winner': winner}
+        if dones.any():
+            sim.reset_matches(dones, self.countdown)
+            self.bot.reset_matches(dones)
+        self._observe()
+        return self.obs, rewards, dones, info
+
+    def _observe(self):
+        """Write every agent's observation into the (possibly shared) buffer."""
+        sim = self.sim
+        fighters = np.stack([
+            sim.x, sim.y - config.GROUND_Y, sim.vel_y, sim.health, np.where(sim.flip, -1.0, 1.0),
+            sim.jump, sim.jump_count, sim.attacking, sim.attack_type, sim.frame_index,
+            sim.attack_cooldown, sim.hit_cooldown, sim.dodging, sim.dodge_cooldown,
+        ], axis=-1).astype(np.float32) / self._scales
+        count = len(FIGHTER_FEATURES)
+        time_left = sim.match_time / Match.MATCH_TIME
+        for i, side in enumerate(self.agents):
+            obs = self.obs[:, i]
+            obs[:, :count] = fighters[:, side]
+            obs[:, count:2 * count] = fighters[:, 1 - side]
+            obs[:, -2] = (sim.x[:, 1 - side] - sim.x[:, side]) / BASE_WIDTH
+            obs[:, -1] = time_left
+
+
+def _shared_array(shape, dtype, name=None):
+    """NumPy view on a (new, or existing by name) shared memory block."""
+    size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    block = shared_memory.SharedMemory(name=name, create=name is None, size=size if name is None else 0)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _worker(conn, names, start, count, env_kwargs):
+    """Worker process: one VectorFightEnv over a slice of the shared arrays."""
+    blocks = []
+    views = {}
+    for key, (name, shape, dtype) in names.items():
+        block, array = _shared_array(shape, dtype, name)
+        blocks.append(block)
+        views[key] = array[start:start + count]
+    env = VectorFightEnv(count, obs_buffer=views['obs'], **env_kwargs)
+
+    try:
+        while True:
+            command = conn.recv()
+            if command == 'step':
+                _, rewards, dones, info = env.step(views['actions'])
+                views['rewards'][:] = rewards
+                views['dones'][:] = dones
+                views['winner'][:] = info['winner']
+            elif command == 'reset':
+                env.reset()
+            else:
+                break
+            conn.send(True)
+    finally:
+        del views
+        for block in blocks:
+            block.close()
+
+
+class SubprocVectorEnv:
+    """VectorFightEnv sharded over worker processes with shared-memory buffers.
+
+    Same API as VectorFightEnv. The returned arrays are views on shared
+    memory that the next step() overwrites.
+    """
+
+    def __init__(self, num_workers, envs_per_worker, **env_kwargs):
+        self.num_envs = num_workers * envs_per_worker
+        self.agents = tuple(env_kwargs.get('agents', (1,)))
+        agents = len(self.agents)
+        self.observation_shape = (self.num_envs, agents, OBS_SIZE)
+
+        specs = {
+            'obs': (self.observation_shape, np.float32),
+            'actions': ((self.num_envs, agents), np.int64),
+            'rewards': ((self.num_envs, agents), np.float32),
+            'dones': ((self.num_envs,), bool),
+            'winner': ((self.num_envs,), np.int8),
+        }
+        self._blocks = []
+        self.arrays = {}
+        names = {}
+        for key, (shape, dtype) in specs.items():
+            block, array = _shared_array(shape, dtype)
+            self._blocks.append(block)
+            self.arrays[key] = array
+            names[key] = (block.name, shape, dtype)
+
+        self._connections = []
+        self._workers = []
+        for i in range(num_workers):
+            # Each worker gets its own random stream
+            kwargs = dict(env_kwargs)
+            if kwargs.get('seed') is not None:
+                kwargs['seed'] = kwargs['seed'] * num_workers + i
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_worker, daemon=True,
+                                             args=(child, names, i * envs_per_worker, envs_per_worker, kwargs))
+            worker.start()
+            child.close()
+            self._connections.append(parent)
+            self._workers.append(worker)
+
+    def _broadcast(self, command):
+        """Send a command to every worker and wait until all have finished it."""
+        for conn in self._connections:
+            conn.send(command)
+        for conn in self._connections:
+            conn.recv()
+
+    def reset(self):
+        """Restart every match; returns the first observations."""
+        self._broadcast('reset')
+        return self.arrays['obs']
+
+    def step(self, actions):
+        """Step every worker's environments once (see VectorFightEnv.step)."""
+        self.arrays['actions'][:] = np.asarray(actions).reshape(self.arrays['actions'].shape)
+        self._broadcast('step')
+        return (self.arrays['obs'], self.arrays['rewards'], self.arrays['dones'],
+                {'winner': self.arrays['winner']})
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        for conn in self._connections:
+            conn.send('close')
+        for worker in self._workers:
+            worker.join(timeout=5.0)
+        self.arrays = {}
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
@@ -0,0 +1,180 @@
+"""
+Round-Robin Tournament Runner
+Plays every pairing of bot difficulties and character matchups over a range
+of seeds on all CPU cores, streaming results into a SQLite database.
+
+Usage (from the project root):
+    python -m tools.tournament [--seeds 100] [--workers 8] [--db tournament.sqlite3]
+                               [--set ATTACK_RANGE=90 ...]
+
+Each result row is keyed by parameter set, matchup and seed, so an
+interrupted run picks up where it stopped when started again with the same
+arguments. Worker processes each play a chunk of seeds for one matchup and
+share nothing, so throughput scales with the number of cores.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import SPRITE_CONFIG
+from tools.headless_match import (
+    DIFFICULTIES, apply_overrides, create_match, parse_overrides, run_match
+)
+
+
+CHARACTERS = tuple(sorted(SPRITE_CONFIG))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS param_sets (
+    param_set TEXT PRIMARY KEY,
+    params TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    param_set TEXT NOT NULL,
+    p1_difficulty TEXT NOT NULL,
+    p2_difficulty TEXT NOT NULL,
+    p1_character TEXT NOT NULL,
+    p2_character TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    winner TEXT NOT NULL,
+    ticks INTEGER NOT NULL,
+    timeout INTEGER NOT NULL,
+    p1_health INTEGER NOT NULL,
+    p2_health INTEGER NOT NULL,
+    PRIMARY KEY (param_set, p1_difficulty, p2_difficulty, p1_character, p2_character, seed)
+);
+CREATE INDEX IF NOT EXISTS idx_results_matchup
+    ON results (p1_difficulty, p2_difficulty, p1_character, p2_character);
+CREATE INDEX IF NOT EXISTS idx_results_param_set
+    ON results (param_set);
+"""
+
+INSERT_RESULT = "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def param_set_id(params):
+    """Stable id for a set of constant overrides ('default' for none)."""
+    if not params:
+        return 'default'
+    text = json.dumps(params, sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]
+
+
+def all_matchups():
+    """Every ordered pairing of difficulties and characters."""
+    return list(itertools.product(DIFFICULTIES, DIFFICULTIES, CHARACTERS, CHARACTERS))
+
+
+def open_db(path):
+    """Open (and create if needed) the results database."""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def pending_tasks(conn, param_set, seeds, chunk_size):
+    """Chunks of (matchup, seeds) that have no stored result yet."""
+    done = set(conn.execute(
+        'SELECT p1_difficulty, p2_difficulty, p1_character, p2_character, seed '
+        'FROM results WHERE param_set = ?', (param_set,)))
+    tasks = []
+    for matchup in all_matchups():
+        missing = [seed for seed in seeds if matchup + (seed,) not in done]
+        for i in range(0, len(missing), chunk_size):
+            tasks.append((matchup, missing[i:i + chunk_size]))
+    return tasks
+
+
+def run_chunk(param_set, matchup, seeds):
+    """Worker: play one matchup for a list of seeds; returns result rows."""
+    p1_difficulty, p2_difficulty, p1_character, p2_character = matchup
+    rows = []
+    for seed in seeds:
+        result = run_match(create_match(p1_difficulty, p2_difficulty, p1_character, p2_character, seed))
+        rows.append((param_set,) + matchup + (
+            result['seed'], result['winner'], result['ticks'], int(result['timeout']),
+            result['p1_health'], result['p2_health']))
+    return rows
+
+
+def print_summary(conn, param_set):
+    """Print per-matchup win rates for a parameter set."""
+    print(f"\n{'P1':<28} {'P2':<28} {'matches':>8} {'P1 win%':>8} {'timeouts':>9}")
+    query = (
+        "SELECT p1_difficulty, p1_character, p2_difficulty, p2_character, COUNT(*), "
+        "SUM(winner = 'player'), SUM(timeout) FROM results WHERE param_set = ? "
+        "GROUP BY p1_difficulty, p2_difficulty, p1_character, p2_character "
+        "ORDER BY p1_character, p2_character, p1_difficulty, p2_difficulty")
+    for p1_difficulty, p1_character, p2_difficulty, p2_character, count, p1_wins, timeouts in conn.execute(query, (param_set,)):
+        print(f"{p1_character + ' (' + p1_difficulty + ')':<28} {p2_character + ' (' + p2_difficulty + ')':<28} "
+              f"{count:>8} {100.0 * p1_wins / count:>7.1f}% {timeouts:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a resumable multi-core BotAI round-robin tournament.')
+    parser.add_argument('--seeds', type=int, default=100, help='Seeds (matches) per matchup')
+    parser.add_argument('--first-seed', type=int, default=0, help='First seed')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes')
+    parser.add_argument('--chunk-size', type=int, default=25, help='Matches per worker task')
+    parser.add_argument('--batch-size', type=int, default=500, help='Rows per database transaction')
+    parser.add_argument('--db', default='tournament.sqlite3', help='SQLite results file')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a config constant for this run (repeatable)')
+    args = parser.parse_args()
+
+    params = parse_overrides(args.set)
+    param_set = param_set_id(params)
+
+    conn = open_db(args.db)
+    with conn:
+        conn.execute('INSERT OR IGNORE INTO param_sets VALUES (?, ?)',
+                     (param_set, json.dumps(params, sort_keys=True)))
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    tasks = pending_tasks(conn, param_set, seeds, args.chunk_size)
+    total = sum(len(task_seeds) for _, task_seeds in tasks)
+    print(f"Parameter set {param_set}: {total} matches to play "
+          f"({len(all_matchups()) * len(seeds) - total} already stored) on {args.workers} workers")
+
+    pending = []
+    played = 0
+    start = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=args.workers, initializer=apply_overrides, initargs=(params,))
+    try:
+        futures = [executor.submit(run_chunk, param_set, matchup, task_seeds) for matchup, task_seeds in tasks]
+        for future in as_completed(futures):
+            pending.extend(future.result())
+            if len(pending) >= args.batch_size:
+                with conn:
+                    conn.executemany(INSERT_RESULT, pending)
+                played += len(pending)
+                pending = []
+                elapsed = time.perf_counter() - start
+                print(f"  {played}/{total} matches ({played / elapsed:.0f} matches/sec)")
+    except KeyboardInterrupt:
+        print("Interrupted - completed matches are saved; run again to resume")
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        executor.shutdown()
+    finally:
+        if pending:
+            with conn:
+                conn.executemany(INSERT_RESULT, pending)
+            played += len(pending)
+
+    elapsed = time.perf_counter() - start
+    print(f"Played {played} matches in {elapsed:.1f}s")
+    print_summary(conn, param_set)
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
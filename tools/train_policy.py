@@ -0,0 +1,236 @@
+"""
+Policy Table Trainer
+Builds the nightmare bot's policy table (components/policy_table.py) from
+batched headless self-play.
+
+Usage (from the project root):
+    python -m tools.train_policy [--iterations 12] [--matches 1024] [--seed 0]
+
+Every iteration the learner (knight, fighter 2, as in the game) plays one
+batch against each opponent: the rule-based hard and nightmare bots and its
+own current table. A decision's return is the damage dealt minus damage
+taken over the next HORIZON ticks, plus a bonus or penalty if the match is
+decided within that window. Returns accumulate per (cell, action) across
+iterations, and the table becomes a softmax over their shrunk means, with
+epsilon exploration while training. The result is quantized to SLOTS action
+ids per cell and written to assets/data/bot_policy.bin. Requires NumPy.
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+
+from components.bot_ai import get_difficulty_settings
+from components.policy_table import (
+    ACTIONS, CELLS, DISTANCE_EDGES, HEIGHT_EDGES, HEALTH_EDGES, HEIGHT_BUCKETS,
+    OPPONENT_STATES, FLAG_COMBINATIONS, HEALTH_BUCKETS, SLOTS, HEADER, POLICY_FILE,
+    NEUTRAL, AIRBORNE, ATTACKING, DODGING, ATTACK1, ATTACK3, DODGE, JUMP, APPROACH,
+    BACK_OFF, WAIT, encode_state, header_values
+)
+from tools.batch_sim import BatchSim, BotPolicy, P2_WINS
+
+
+LEARNER_SIDE = 1
+HORIZON = 60             # Ticks a decision is credited for (1 second)
+WIN_BONUS = 50.0         # Added (or subtracted) when the match is decided within the horizon
+PRIOR_WEIGHT = 5.0       # Pseudo-visits pulling sparse cells towards the action's global mean
+TEMPERATURE = 2.0        # Softmax temperature over mean returns (damage points)
+OPPONENTS = ('hard', 'nightmare', 'self')
+
+
+def encode_states(sim, side, target):
+    """Vectorized policy_table.encode_state for one side of every match."""
+    distance = np.searchsorted(DISTANCE_EDGES, np.abs(target['x'] - sim.x[:, side]), side='right')
+    height = np.searchsorted(HEIGHT_EDGES, target['y'] - sim.y[:, side], side='right')
+    health = np.searchsorted(HEALTH_EDGES, sim.health[:, side] - target['health'], side='right')
+    state = np.where(target['attacking'], ATTACKING,
+                     np.where(target['dodging'], DODGING,
+                              np.where(target['jump'], AIRBORNE, NEUTRAL)))
+    flags = ((sim.attack_cooldown[:, side] == 0) * 4 +
+             (sim.dodge_cooldown[:, side] == 0) * 2 +
+             (target['attack_cooldown'] > 0))
+    cell = distance
+    cell = cell * HEIGHT_BUCKETS + height
+    cell = cell * OPPONENT_STATES + state
+    cell = cell * FLAG_COMBINATIONS + flags
+    return cell * HEALTH_BUCKETS + health
+
+
+def verify_encoding(rng, count=2000):
+    """Check encode_states against the scalar encode_state on random states."""
+    sim = BatchSim(count)
+    sim.x[:] = rng.uniform(0, 900, sim.x.shape)
+    sim.y[:] = rng.uniform(110, 400, sim.y.shape)
+    sim.health[:] = rng.integers(0, 101, sim.health.shape)
+    sim.attack_cooldown[:] = rng.integers(0, 3, sim.attack_cooldown.shape)
+    sim.dodge_cooldown[:] = rng.integers(0, 3, sim.dodge_cooldown.shape)
+    target = {
+        'x': sim.x[:, 0], 'y': sim.y[:, 0], 'health': sim.health[:, 0],
+        'attack_cooldown': sim.attack_cooldown[:, 0],
+        'attacking': rng.random(count) < 0.3, 'dodging': rng.random(count) < 0.3,
+        'jump': rng.random(count) < 0.3,
+    }
+    cells = encode_states(sim, 1, target)
+    for i in range(count):
+        fighter = SimpleNamespace(x=sim.x[i, 1], y=sim.y[i, 1], health=sim.health[i, 1],
+                                  attack_cooldown=sim.attack_cooldown[i, 1],
+                                  dodge_cooldown=sim.dodge_cooldown[i, 1])
+        view = SimpleNamespace(**{field: values[i] for field, values in target.items()})
+        if encode_state(fighter, view) != cells[i]:
+            raise SystemExit(f"Vectorized state encoding differs from encode_state at sample {i}")
+
+
+class TablePolicy(BotPolicy):
+    """Vectorized BotAI playing a policy table (mirrors BotAI._table_decision).
+
+    With a decisions list, every decision is logged as (tick, rows, cells,
+    actions, own health, opponent health) for credit assignment.
+    """
+
+    def __init__(self, sim, difficulty, rng, table, epsilon=0.0, decisions=None):
+        # The tier's rule parameters (timing and fallbacks), even for a search-driven tier
+        rules = get_difficulty_settings(difficulty)
+        super().__init__(sim, (rules, rules), rng)
+        self.table = table
+        self.epsilon = epsilon
+        self.decisions = decisions
+
+    def _decide(self, sim, side, decide):
+        """Sample table actions for deciding matches and apply them."""
+        d = decide & ~sim.attacking[:, side]
+        if not d.any():
+            return
+        n = sim.n
+        rng = self.rng
+        target = self._perceive(side)
+        cells = encode_states(sim, side, target)
+        actions = self.table[cells, rng.integers(SLOTS, size=n)]
+        if self.epsilon:
+            explore = rng.random(n) < self.epsilon
+            actions = np.where(explore, rng.integers(len(ACTIONS), size=n), actions)
+
+        if self.decisions is not None:
+            rows = np.nonzero(d)[0]
+            self.decisions.append((sim.tick, rows, cells[rows], actions[rows],
+                                   sim.health[rows, side].copy(), sim.health[rows, 1 - side].copy()))
+
+        towards_right = sim.x[:, side] < target['x']
+
+        attack = d & (actions <= ATTACK3)
+        sim.set_movement(side, attack & (actions == ATTACK3), ~towards_right, towards_right)
+        sim.do_attack(side, attack, actions - ATTACK1 + 1)
+        self.moving[attack, side] = False
+
+        dodge = d & (actions == DODGE)
+        dash = dodge & (sim.dodge_cooldown[:, side] == 0)
+        sim.flip[dash, side] = towards_right[dash]
+        sim.do_dodge(side, dash)
+
+        sim.do_jump(side, d & (actions == JUMP))
+        self._approach(sim, side, d & (actions == APPROACH), towards_right)
+        self._back_off(sim, side, (dodge & ~dash) | (d & (actions == BACK_OFF)), towards_right)
+        self._wait(sim, side, d & (actions == WAIT))
+
+
+def credit(decision, sim, q_sum, q_count):
+    """Add one logged decision batch's returns to the (cell, action) statistics."""
+    _tick, rows, cells, actions, own_health, opponent_health = decision
+    dealt = opponent_health - sim.health[rows, 1 - LEARNER_SIDE]
+    taken = own_health - sim.health[rows, LEARNER_SIDE]
+    returns = (dealt - taken).astype(float)
+    decided = sim.game_over[rows]
+    won = sim.winner[rows] == P2_WINS
+    returns += np.where(decided, np.where(won, WIN_BONUS, -WIN_BONUS), 0.0)
+    np.add.at(q_sum, (cells, actions), returns)
+    np.add.at(q_count, (cells, actions), 1)
+
+
+def play_batch(matches, opponent, table, rng, epsilon, q_sum, q_count):
+    """Play one training batch; returns the learner's win rate."""
+    sim = BatchSim(matches, 'fantasy_warrior', 'knight')
+    decisions = deque()
+    learner = TablePolicy(sim, 'nightmare', rng, table, epsilon, decisions)
+    if opponent == 'self':
+        rival = TablePolicy(sim, 'nightmare', rng, table)
+    else:
+        rules = get_difficulty_settings(opponent)
+        rival = BotPolicy(sim, (rules, rules), rng)
+
+    while not sim.game_over.all():
+        sim.step((rival, learner))
+        while decisions and decisions[0][0] + HORIZON <= sim.tick:
+            credit(decisions.popleft(), sim, q_sum, q_count)
+    while decisions:
+        credit(decisions.popleft(), sim, q_sum, q_count)
+    return float((sim.winner == P2_WINS).mean())
+
+
+def action_probabilities(q_sum, q_count):
+    """Softmax over shrunk mean returns per cell."""
+    prior = q_sum.sum(axis=0) / np.maximum(q_count.sum(axis=0), 1)
+    mean = (q_sum + PRIOR_WEIGHT * prior) / (q_count + PRIOR_WEIGHT)
+    logits = (mean - mean.max(axis=1, keepdims=True)) / TEMPERATURE
+    weights = np.exp(logits)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def quantize(probabilities):
+    """Turn per-cell distributions into SLOTS action ids per cell (largest remainders)."""
+    scaled = probabilities * SLOTS
+    counts = np.floor(scaled).astype(np.int64)
+    missing = SLOTS - counts.sum(axis=1)
+    order = np.argsort(counts - scaled, axis=1)  # Largest fractional part first
+    rank = np.argsort(order, axis=1)
+    counts += rank < missing[:, None]
+    actions = np.tile(np.arange(len(ACTIONS), dtype=np.uint8), CELLS)
+    return np.repeat(actions, counts.ravel()).reshape(CELLS, SLOTS)
+
+
+def write_table(path, table):
+    """Write the header and table bytes."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(*header_values()))
+        f.write(table.astype(np.uint8).tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the nightmare bot policy table by self-play.')
+    parser.add_argument('--iterations', type=int, default=12, help='Training iterations')
+    parser.add_argument('--matches', type=int, default=1024, help='Matches per opponent per iteration')
+    parser.add_argument('--epsilon', type=float, default=0.1, help='Exploration rate while training')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--output', default=POLICY_FILE, help='Table file to write')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    verify_encoding(rng)
+
+    q_sum = np.zeros((CELLS, len(ACTIONS)))
+    q_count = np.zeros((CELLS, len(ACTIONS)))
+    table = quantize(np.full((CELLS, len(ACTIONS)), 1.0 / len(ACTIONS)))
+
+    start = time.perf_counter()
+    for iteration in range(1, args.iterations + 1):
+        win_rates = [play_batch(args.matches, opponent, table, rng, args.epsilon, q_sum, q_count)
+                     for opponent in OPPONENTS]
+        table = quantize(action_probabilities(q_sum, q_count))
+        visited = int((q_count.sum(axis=1) > 0).sum())
+        print(f"Iteration {iteration}: win rate " +
+              ', '.join(f'{opponent} {rate:.3f}' for opponent, rate in zip(OPPONENTS, win_rates)) +
+              f" | {visited}/{CELLS} cells visited | {time.perf_counter() - start:.0f}s")
+
+    print("Final table (no exploration): " + ', '.join(
+        f"{opponent} {play_batch(args.matches, opponent, table, rng, 0.0, q_sum.copy(), q_count.copy()):.3f}"
+        for opponent in OPPONENTS[:-1]))
+
+    write_table(args.output, table)
+    print(f"Wrote {args.output} ({HEADER.size + table.size} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Asset Cache
+Process-wide cache of loaded textures and sounds keyed by path and variant,
+so each file is decoded and uploaded once however many users share it.
+Assets are reference counted; unreferenced ones stay cached until the
+memory budget is exceeded and are then evicted least recently used first.
+"""
+
+import os
+from collections import OrderedDict
+
+from config import ASSET_CACHE_BUDGET_MB
+from utils.asset_loader import AssetLoader
+
+
+# Variants the cache can load, with the AssetLoader method that loads them.
+# A variant may also be a tuple starting with one of these, e.g. ('sound', 1)
+# for a second, independent copy of a sound.
+VARIANTS = {
+    'texture': 'load_image',
+    'sound': 'load_sound',
+}
+
+
+def variant_kind(variant):
+    """The VARIANTS key a (possibly tuple) variant loads as."""
+    return variant[0] if isinstance(variant, tuple) else variant
+
+
+class AssetCache:
+    """Shared reference-counted cache of textures and sounds."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = AssetCache()
+        return cls._instance
+
+    def __init__(self, budget_bytes=ASSET_CACHE_BUDGET_MB * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # (path, variant) -> [asset, refs, bytes], least recently used first
+        self._pending = {}  # (path, variant) -> callbacks waiting on the loader
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_held = 0
+
+    def acquire(self, path, callback, variant='texture'):
+        """Take a reference to an asset; callback(asset or None) runs on the main thread.
+
+        Cached assets are handed over right away, others once the
+        AssetLoader has loaded them. Requests for an asset that is already
+        loading share that load. Every asset received must be released once.
+        """
+        key = (path, variant)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            entry[1] += 1
+            self._entries.move_to_end(key)
+            callback(entry[0])
+            return
+
+        if key in self._pending:
+            self.hits += 1
+            self._pending[key].append(callback)
+            return
+
+        self.misses += 1
+        self._pending[key] = [callback]
+        load = getattr(AssetLoader.get_instance(), VARIANTS[variant_kind(variant)])
+        load(path, lambda asset: self._on_loaded(key, asset))
+
+    def release(self, path, variant='texture'):
+        """Drop a reference taken by acquire; the asset may then be evicted."""
+        entry = self._entries.get((path, variant))
+        if entry is None or entry[1] == 0:
+            print(f"Warning: Released {variant} {path} more often than acquired")
+            return
+        entry[1] -= 1
+        if entry[1] == 0:
+            self._evict()
+
+    def preload(self, path, variant='texture'):
+        """Load an asset into the cache without keeping a reference to it."""
+        def on_loaded(asset):
+            if asset is not None:
+                self.release(path, variant)
+
+        self.acquire(path, on_loaded, variant)
+
+    def stats(self):
+        """Hit/miss counts and memory held, for logging."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes_held,
+            'budget': self.budget_bytes,
+        }
+
+    def _on_loaded(self, key, asset):
+        """Cache a loaded asset with one reference per waiting requester."""
+        callbacks = self._pending.pop(key)
+        if asset is not None:
+            size = self._asset_bytes(key, asset)
+            self._entries[key] = [asset, len(callbacks), size]
+            self.bytes_held += size
+            self._evict()
+
+        for callback in callbacks:
+            try:
+                callback(asset)
+            except Exception as e:
+                print(f"Warning: Asset callback for {key[0]} failed: {e}")
+
+    def _evict(self):
+        """Drop unreferenced assets, least recently used first, until under budget."""
+        if self.bytes_held <= self.budget_bytes:
+            return
+        for key in [key for key, entry in self._entries.items() if entry[1] == 0]:
+            self.bytes_held -= self._entries.pop(key)[2]
+            self.evictions += 1
+            if self.bytes_held <= self.budget_bytes:
+                return
+
+    @staticmethod
+    def _asset_bytes(key, asset):
+        """Approximate memory held by an asset."""
+        path, variant = key
+        if variant_kind(variant) == 'texture':
+            # GPU copy plus the pixels kept for reloading after a GL context loss
+            width, height = asset.size
+            return 2 * width * height * len(asset.colorfmt)
+        try:
+            # Uncompressed WAV data is about the size of the file
+            return os.path.getsize(path)
+        except OSError:
+            return 0
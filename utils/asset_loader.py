@@ -0,0 +1,210 @@
+"""
+Asset Loader
+Decodes images and sounds on worker threads and hands them to the main
+thread, which uploads textures in bands of rows within a per-frame time
+budget
+"""
+
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, NumericProperty
+from kivy.utils import platform
+
+
+# Main-thread seconds per frame spent uploading finished assets (at least one band always goes through)
+UPLOAD_BUDGET = 0.004
+
+# Bytes of pixel rows sent to the GPU per upload step
+UPLOAD_BAND_BYTES = 256 * 1024
+
+# Decoded pixel formats uploaded band by band (others go up in one step)
+BANDED_FORMATS = ('rgba', 'bgra', 'rgb', 'bgr')
+
+# Mobile audio providers talk to Java and must create sounds on the main thread
+THREADED_SOUNDS = platform not in ('android', 'ios')
+
+
+class AssetLoader(EventDispatcher):
+    """Shared background loader; completion callbacks run on the main thread.
+
+    Screens can bind to progress (0..1 over the assets requested since the
+    loader was last idle) and loading.
+    """
+
+    progress = NumericProperty(1.0)
+    loading = BooleanProperty(False)
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = AssetLoader()
+        return cls._instance
+
+    def __init__(self, workers=None, **kwargs):
+        super().__init__(**kwargs)
+        self.workers = workers or max(2, min(4, os.cpu_count() or 1))
+        self._executor = None
+        self._decoded = queue.SimpleQueue()  # (kind, path, data, callback) ready for the main thread
+        self._current = None  # (upload steps, path, callback) of the texture being uploaded
+        self._event = None
+
+        # Current batch (reset whenever everything requested has been delivered)
+        self.requested = 0
+        self.delivered = 0
+
+        # Statistics
+        self.uploads = 0
+        self.longest_upload_frame = 0.0  # Seconds of main-thread work in the busiest frame
+
+    def load_image(self, path, callback):
+        """Decode an image in the background; callback(texture or None) on the main thread."""
+        self._request('image', path, callback)
+
+    def load_sound(self, path, callback):
+        """Load a sound in the background; callback(sound or None) on the main thread."""
+        self._request('sound', path, callback)
+
+    def submit(self, func, *args):
+        """Run func(*args) on a worker thread (e.g. encoding a file to write)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix='asset-loader')
+        return self._executor.submit(func, *args)
+
+    def _request(self, kind, path, callback):
+        """Queue one asset and make sure the upload step runs every frame."""
+        self.requested += 1
+        self._update_progress()
+
+        if kind == 'sound' and not THREADED_SOUNDS:
+            # Created by the upload step itself
+            self._decoded.put((kind, path, None, callback))
+        else:
+            self.submit(self._decode, kind, path, callback)
+
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._upload, 0)
+
+    def _decode(self, kind, path, callback):
+        """Worker thread: decode the file into CPU memory."""
+        data = None
+        try:
+            if kind == 'image':
+                from kivy.core.image import ImageLoader
+                # Keep the pixels so the texture can be rebuilt after a GL context loss
+                data = ImageLoader.load(path, keep_data=True)
+            else:
+                from kivy.core.audio import SoundLoader
+                data = SoundLoader.load(path)
+        except Exception as e:
+            print(f"Warning: Could not load {path}: {e}")
+        self._decoded.put((kind, path, data, callback))
+
+    def _load_sound(self, path, data):
+        """Main thread: the loaded sound (created here when threads can't)."""
+        if data is None and not THREADED_SOUNDS:
+            try:
+                from kivy.core.audio import SoundLoader
+                return SoundLoader.load(path)
+            except Exception as e:
+                print(f"Warning: Could not load {path}: {e}")
+        return data
+
+    def _upload_image(self, image):
+        """Main thread: upload a decoded image band by band, yielding between bands.
+
+        Returns the texture (as StopIteration value) once every row is on the GPU.
+        """
+        from kivy.core.image import Image as CoreImage
+        from kivy.graphics.texture import Texture
+
+        if image is None:
+            return None
+
+        # Single-frame, uncompressed images without mipmaps are split into bands
+        frames = image._data
+        data = frames[0] if len(frames) == 1 else None
+        if data is None or data.fmt not in BANDED_FORMATS or len(data.mipmaps) > 1:
+            return CoreImage(image).texture
+
+        width, height, fmt, rowlength = data.width, data.height, data.fmt, data.rowlength
+        stride = rowlength or width * len(fmt)  # Bytes per row
+        pixels = data.data
+        if not isinstance(pixels, bytes) or len(pixels) < stride * height:
+            return CoreImage(image).texture
+
+        texture = Texture.create(size=(width, height), colorfmt=fmt)
+        rows = max(1, UPLOAD_BAND_BYTES // stride)
+        for y in range(0, height, rows):
+            band = min(rows, height - y)
+            texture.blit_buffer(pixels[y * stride:(y + band) * stride], size=(width, band),
+                                colorfmt=fmt, pos=(0, y), rowlength=rowlength)
+            yield
+        if data.flip_vertical:
+            texture.flip_vertical()
+
+        def reload(texture):
+            """Upload the kept pixels again after a GL context loss."""
+            texture.blit_buffer(pixels, size=(width, height), colorfmt=fmt, rowlength=rowlength)
+
+        texture.add_reload_observer(reload)
+        return texture
+
+    def _deliver(self, path, asset, callback):
+        """Hand a finished asset to its requester."""
+        self.delivered += 1
+        self.uploads += 1
+        try:
+            callback(asset)
+        except Exception as e:
+            print(f"Warning: Asset callback for {path} failed: {e}")
+
+    def _upload(self, dt):
+        """Upload and deliver decoded assets until this frame's budget is spent."""
+        start = time.perf_counter()
+        deadline = start + UPLOAD_BUDGET
+        while True:
+            if self._current is None:
+                try:
+                    kind, path, data, callback = self._decoded.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'image':
+                    self._current = (self._upload_image(data), path, callback)
+                    continue
+                self._deliver(path, self._load_sound(path, data), callback)
+            else:
+                steps, path, callback = self._current
+                try:
+                    next(steps)
+                except StopIteration as done:
+                    self._current = None
+                    self._deliver(path, done.value, callback)
+                except Exception as e:
+                    print(f"Warning: Could not upload {path}: {e}")
+                    self._current = None
+                    self._deliver(path, None, callback)
+
+            if time.perf_counter() >= deadline:
+                break
+
+        self.longest_upload_frame = max(self.longest_upload_frame, time.perf_counter() - start)
+        self._update_progress()
+        if self.delivered >= self.requested:
+            self.requested = 0
+            self.delivered = 0
+            self._event = None
+            return False
+
+    def _update_progress(self):
+        """Refresh the progress and loading properties."""
+        self.loading = self.delivered < self.requested
+        self.progress = self.delivered / self.requested if self.loading else 1.0
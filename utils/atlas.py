@@ -0,0 +1,94 @@
+"""
+Game Atlas
+Shared access to the packed texture atlas built by tools/build_atlas.py
+Falls back to the loose PNG files when the atlas has not been built
+"""
+
+import json
+import os
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ATLAS_PATH = os.path.join(BASE_PATH, 'assets', 'atlas')
+MANIFEST_FILE = os.path.join(ATLAS_PATH, 'manifest.json')
+UI_PATH = os.path.join(BASE_PATH, 'assets', 'images', 'ui', 'fighting_screen')
+
+
+class GameAtlas:
+    """Process-wide atlas loader; pages are decoded and uploaded once."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = GameAtlas()
+        return cls._instance
+
+    def __init__(self):
+        self.manifest = None
+        self._atlas = None
+        self._atlas_file = None
+        self._load_manifest()
+
+    def _load_manifest(self):
+        """Read the frame manifest if the atlas has been built."""
+        if not os.path.exists(MANIFEST_FILE):
+            return
+        try:
+            with open(MANIFEST_FILE, 'r') as f:
+                self.manifest = json.load(f)
+            self._atlas_file = os.path.join(ATLAS_PATH, self.manifest['atlas'])
+            if not os.path.exists(self._atlas_file):
+                self.manifest = None
+        except Exception as e:
+            print(f"Warning: Could not read atlas manifest {MANIFEST_FILE}: {e}")
+            self.manifest = None
+
+    @property
+    def available(self):
+        """True if a built atlas is present."""
+        return self.manifest is not None
+
+    def _get_atlas(self):
+        """Load the Kivy atlas (all pages) on first use.
+
+        The atlas is shared through Kivy's 'kv.atlas' cache so atlas:// image
+        sources (e.g. button backgrounds) reuse the same uploaded pages.
+        """
+        if self._atlas is None:
+            from kivy.atlas import Atlas
+            from kivy.cache import Cache
+            import kivy.core.image  # noqa: F401 - registers the 'kv.atlas' cache
+
+            atlas_base = os.path.splitext(self._atlas_file)[0]
+            self._atlas = Cache.get('kv.atlas', atlas_base)
+            if self._atlas is None:
+                self._atlas = Atlas(self._atlas_file)
+                Cache.append('kv.atlas', atlas_base, self._atlas)
+        return self._atlas
+
+    def get_frames(self, character, action):
+        """Get the animation frame textures for a character action, or None."""
+        if not self.available:
+            return None
+        ids = self.manifest['characters'].get(character, {}).get(action)
+        if not ids:
+            return None
+        try:
+            textures = self._get_atlas().textures
+            return [textures[uid] for uid in ids]
+        except Exception as e:
+            print(f"Warning: Could not load atlas frames for {character}/{action}: {e}")
+            return None
+
+    def get_ui_source(self, filename):
+        """Get an image source for a fighting screen UI image.
+
+        Returns an atlas:// URL when the image is packed, else the PNG path.
+        """
+        if self.available and filename in self.manifest['ui']:
+            atlas_base = os.path.splitext(self._atlas_file)[0]
+            return f"atlas://{atlas_base}/{self.manifest['ui'][filename]}"
+        return os.path.join(UI_PATH, filename)
@@ -6,11 +6,12 @@ Handles loading and saving game settings including control layouts
 import copy
 import json
 import os
-from kivy.utils import platform
 
 
 def get_settings_path():
     """Get the path to the settings file based on platform."""
+    from kivy.utils import platform
+
     if platform == 'android':
         from android.storage import app_storage_path
         return os.path.join(app_storage_path(), 'settings.json')
@@ -0,0 +1,166 @@
+"""
+SFX Mixer
+Plays named sound effect cues (config.SFX_CUES) on a pool of voices created
+ahead of time, so a cue fired again overlaps instead of restarting. When no
+voice is free a cue steals the oldest, lowest-priority voice, and no more
+than a fixed number of voices ever play at once.
+"""
+
+import os
+from functools import partial
+
+from kivy.clock import Clock
+
+from config import ASSET_PATHS, SFX_CUES, SFX_MAX_VOICES, SFX_VOICES_PER_SAMPLE
+from utils.asset_cache import AssetCache
+
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SFX_PATH = os.path.join(BASE_PATH, ASSET_PATHS['sound_effects'])
+
+
+class SfxMixer:
+    """Shared pool of sound effect voices."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = SfxMixer()
+        return cls._instance
+
+    def __init__(self, cues=SFX_CUES, voices_per_sample=SFX_VOICES_PER_SAMPLE, max_voices=SFX_MAX_VOICES):
+        self.cues = cues
+        self.voices_per_sample = voices_per_sample
+        self.max_voices = max_voices
+        self.volume = 1.0
+
+        self._samples = {}  # cue -> one list of loaded voices per sample file
+        self._held = []  # (path, variant) of voices taken from the asset cache
+        self._generation = 0  # Bumped by release() so voices still loading are given back
+        self._next_sample = {}  # cue -> index of the sample it plays next
+        self._playing = []  # (priority, play number, voice) of started voices, oldest first
+        self._primed = False  # Audio device woken by a silent play
+        self._warned = set()  # Cues whose playback failure has been reported
+
+        # Statistics
+        self.plays = 0
+        self.steals = 0
+        self.drops = 0
+        self.failures = 0
+
+    def prewarm(self):
+        """Load every cue's voices in the background and wake the audio device.
+
+        Safe to call repeatedly; only the first call after construction or
+        release() loads anything.
+        """
+        if self._samples:
+            return
+        cache = AssetCache.get_instance()
+        for cue, (files, _) in self.cues.items():
+            self._samples[cue] = [[] for _ in files]
+            self._next_sample[cue] = 0
+            for index, file in enumerate(files):
+                path = os.path.join(SFX_PATH, file)
+                if not os.path.exists(path):
+                    print(f"Warning: Could not find {path}")
+                    continue
+                # Every voice is its own Sound, cached under its own variant
+                for voice in range(self.voices_per_sample):
+                    cache.acquire(path, partial(self._on_voice_loaded, self._generation, cue, index, path, voice),
+                                  ('sound', voice))
+
+    def release(self):
+        """Stop every voice and give them back to the asset cache (prewarm() loads them again)."""
+        cache = AssetCache.get_instance()
+        for _, _, voice in self._playing:
+            voice.stop()
+        for path, variant in self._held:
+            cache.release(path, variant)
+        self._samples = {}
+        self._next_sample = {}
+        self._playing = []
+        self._held = []
+        self._generation += 1
+
+    def play(self, cue):
+        """Play a cue on a free or stolen voice; False if it could not play."""
+        samples = self._samples.get(cue)
+        if not samples:
+            return False
+
+        # Cues with several samples play them in turn
+        index = self._next_sample[cue]
+        self._next_sample[cue] = (index + 1) % len(samples)
+        voices = samples[index]
+        if not voices:
+            return False  # Still loading
+
+        priority = self.cues[cue][1]
+        self._playing = [entry for entry in self._playing if entry[2].state == 'play']
+
+        victim = None
+        voice = next((voice for voice in voices if voice.state != 'play'), None)
+        if voice is None:
+            # Every copy of this sample is busy: restart the oldest one
+            victim = next((entry for entry in self._playing if entry[2] in voices), None)
+            voice = victim[2] if victim else voices[0]
+        elif len(self._playing) >= self.max_voices:
+            # Steal the oldest voice of the lowest priority not above this cue's
+            victim = min((entry for entry in self._playing if entry[0] <= priority),
+                         key=lambda entry: entry[0], default=None)
+            if victim is None:
+                self.drops += 1
+                return False
+
+        if victim is not None:
+            self._playing.remove(victim)
+            victim[2].stop()
+            self.steals += 1
+
+        try:
+            voice.volume = self.volume
+            voice.play()
+        except Exception as e:
+            self.failures += 1
+            # Reported once per cue; this runs every time a sound plays
+            if cue not in self._warned:
+                self._warned.add(cue)
+                print(f"Warning: Could not play sound effect '{cue}': {e}")
+            return False
+
+        self.plays += 1
+        self._playing.append((priority, self.plays, voice))
+        return True
+
+    def set_volume(self, volume):
+        """Set the volume of all sound effects, including those playing."""
+        self.volume = volume
+        for _, _, voice in self._playing:
+            voice.volume = volume
+
+    def _on_voice_loaded(self, generation, cue, index, path, number, voice):
+        """Add a loaded voice to its sample's pool."""
+        if voice is None:
+            return
+        if generation != self._generation:
+            # Released while this voice loaded
+            AssetCache.get_instance().release(path, ('sound', number))
+            return
+        self._held.append((path, ('sound', number)))
+        self._samples[cue][index].append(voice)
+        if not self._primed:
+            self._prime(voice)
+
+    def _prime(self, voice):
+        """Play a voice silently for a frame so the first real play starts at once."""
+        self._primed = True
+        try:
+            voice.volume = 0
+            voice.play()
+            Clock.schedule_once(lambda dt: voice.stop(), 0)
+        except Exception as e:
+            print(f"Warning: Could not start the audio device: {e}")
@@ -0,0 +1,96 @@
+"""
+Text Texture Cache
+Rasterizes text labels once and reuses their textures (LRU eviction)
+"""
+
+from collections import OrderedDict
+
+
+# Scale factors are rounded to this step so small window changes reuse textures
+SCALE_BUCKET_STEP = 0.25
+
+
+class TextTextureCache:
+    """Shared LRU cache of rasterized text textures."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = TextTextureCache()
+        return cls._instance
+
+    def __init__(self, max_entries=96):
+        self.max_entries = max_entries
+        self._textures = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def scale_bucket(scale):
+        """Round a scale factor to its cache bucket."""
+        steps = max(1, round(scale / SCALE_BUCKET_STEP))
+        return steps * SCALE_BUCKET_STEP
+
+    def get(self, text, font_size, font_name=None, scale=1.0, bold=False,
+            outline_width=0, outline_color=(0, 0, 0, 1)):
+        """Get the texture for a piece of text, rasterizing it only on a miss.
+
+        Text is rendered white so callers can tint it with a Color instruction.
+        """
+        bucket = self.scale_bucket(scale)
+        key = (text, font_name, font_size, bucket, bold, outline_width, tuple(outline_color))
+
+        texture = self._textures.get(key)
+        if texture is not None:
+            self.hits += 1
+            self._textures.move_to_end(key)
+            return texture
+
+        self.misses += 1
+        texture = self._rasterize(text, int(font_size * bucket), font_name, bold,
+                                  int(outline_width * bucket), outline_color)
+        self._textures[key] = texture
+
+        # Evict least recently used entries
+        while len(self._textures) > self.max_entries:
+            self._textures.popitem(last=False)
+            self.evictions += 1
+
+        return texture
+
+    def prewarm(self, texts, font_size, **kwargs):
+        """Rasterize a set of texts ahead of time."""
+        for text in texts:
+            self.get(text, font_size, **kwargs)
+
+    def clear(self):
+        """Drop all cached textures."""
+        self._textures.clear()
+
+    def __len__(self):
+        return len(self._textures)
+
+    def _rasterize(self, text, font_size, font_name, bold, outline_width, outline_color):
+        """Render text to a new texture."""
+        from kivy.core.text import Label as CoreLabel
+
+        options = {
+            'text': text,
+            'font_size': font_size,
+            'bold': bold,
+        }
+        if font_name:
+            options['font_name'] = font_name
+        if outline_width:
+            options['outline_width'] = outline_width
+            options['outline_color'] = outline_color[:3]
+
+        label = CoreLabel(**options)
+        label.refresh()
+        return label.texture